@@ -32,6 +32,7 @@ from .models import (
     MarginMode,
     OrderData,
     PositionData,
+    PositionSnapshot,
     BalanceData,
     TickerData,
     OHLCVData,
@@ -63,6 +64,7 @@ __all__ = [
     'MarginMode',
     'OrderData',
     'PositionData',
+    'PositionSnapshot',
     'BalanceData',
     'TickerData',
     'OHLCVData',
@@ -8,7 +8,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Union
 from decimal import Decimal
 import traceback
 
@@ -39,6 +39,14 @@ class ExchangeAdapter(ExchangeInterface):
     - 限频控制
     """
 
+    # 是否支持在一次请求中批量下单（支持的适配器覆盖 create_orders_batch 并置为True）
+    supports_batch_orders: bool = False
+    # 单次批量下单请求的最大订单数
+    max_batch_orders: int = 20
+
+    # WebSocket意外断开通知（支持的适配器在检测到断开时 set()，由使用方 clear()）
+    ws_disconnected_event: Optional[asyncio.Event] = None
+
     def __init__(self, config: ExchangeConfig, event_bus: Optional[Any] = None):
         """
         初始化适配器
@@ -447,6 +455,33 @@ class ExchangeAdapter(ExchangeInterface):
         else:
             self.logger.debug(f"订单状态更新: {order_data.id}@{self.config.exchange_id}, 状态: {order_data.status.value}")
 
+    # === 组合操作 ===
+
+    async def create_orders_batch(
+        self,
+        symbol: str,
+        orders: List[Dict[str, Any]]
+    ) -> List[Union[OrderData, Exception]]:
+        """
+        批量下单
+
+        默认实现依次调用 create_order；交易所提供批量下单接口时应覆盖为单次请求。
+
+        Args:
+            symbol: 交易对符号
+            orders: 待创建的订单参数列表（create_order 的关键字参数，不含symbol）
+
+        Returns:
+            与orders一一对应的结果列表（OrderData，或该订单失败时的异常）
+        """
+        results: List[Union[OrderData, Exception]] = []
+        for spec in orders:
+            try:
+                results.append(await self.create_order(symbol=symbol, **spec))
+            except Exception as e:
+                results.append(e)
+        return results
+
     # === 抽象方法（子类必须实现） ===
 
     async def _do_connect(self) -> bool:
@@ -27,6 +27,14 @@ from .backpack_websocket import BackpackWebSocket
 class BackpackAdapter(ExchangeAdapter):
     """Backpack交易所适配器 - 统一接口"""
 
+    # Backpack 提供批量下单接口（POST /api/v1/orders）
+    supports_batch_orders = True
+
+    @property
+    def ws_disconnected_event(self) -> Optional[asyncio.Event]:
+        """WebSocket意外断开通知（由WebSocket模块在消息循环退出时 set()）"""
+        return self._websocket.ws_disconnected_event
+
     def __init__(self, config: ExchangeConfig, event_bus=None):
         super().__init__(config, event_bus)
 
@@ -42,8 +50,8 @@ class BackpackAdapter(ExchangeAdapter):
         self._websocket._position_cache = shared_position_cache
         self._position_cache = shared_position_cache  # adapter自己也引用
 
-        # 🔥 同时共享持仓回调列表
-        shared_position_callbacks = []
+        # 🔥 同时共享持仓回调集合（set：O(1)注册/移除，自动去重）
+        shared_position_callbacks = set()
         self._rest._position_callbacks = shared_position_callbacks
         self._websocket._position_callbacks = shared_position_callbacks
         self._position_callbacks = shared_position_callbacks
@@ -407,6 +415,22 @@ class BackpackAdapter(ExchangeAdapter):
 
         return order
 
+    async def create_orders_batch(
+        self,
+        symbol: str,
+        orders: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """批量创建订单（一次签名请求，结果与orders一一对应：OrderData或异常）"""
+        results = await self._rest.create_orders_batch(symbol, orders)
+
+        # 触发订单创建事件
+        if hasattr(self, '_handle_order_update'):
+            for order in results:
+                if isinstance(order, OrderData):
+                    await self._handle_order_update(order)
+
+        return results
+
     async def cancel_order(self, order_id: str, symbol: str) -> OrderData:
         """取消订单"""
         order = await self._rest.cancel_order(order_id, symbol)
@@ -8,7 +8,7 @@ import asyncio
 import aiohttp
 import time
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from decimal import Decimal
 from datetime import datetime
 
@@ -223,6 +223,8 @@ class BackpackRest(BackpackBase):
         elif endpoint == '/api/v1/orders':
             if upper_method == 'GET':
                 return 'orderQueryAll'
+            elif upper_method == 'POST':
+                return 'orderExecute'
             elif upper_method == 'DELETE':
                 return 'orderCancelAll'
 
@@ -251,9 +253,12 @@ class BackpackRest(BackpackBase):
             self.logger.warning(f"未知的API端点: {method} {endpoint}，使用默认指令类型")
         return f"{upper_method.lower()}{endpoint.replace('/', '_')}"
 
-    def _generate_signature(self, method: str, endpoint: str, params: Dict = None, data: Dict = None) -> Dict:
+    def _generate_signature(self, method: str, endpoint: str, params: Dict = None,
+                            data: Union[Dict, List[Dict]] = None) -> Dict:
         """
         为API请求生成必要的头部和签名，基于参考脚本实现
+
+        data 为列表时（批量下单），每个元素单独以指令类型开头拼接签名字符串
         """
         if not self.api_key or not self.api_secret:
             if self.logger:
@@ -278,8 +283,19 @@ class BackpackRest(BackpackBase):
         timestamp = int(time.time() * 1000)
         window = 5000
 
-        # 构建签名字符串，从指令类型开始
-        signature_str = f"instruction={instruction_type}"
+        if isinstance(data, list):
+            # 批量请求：instruction=X&a=1&b=2&instruction=X&a=3&b=4...
+            signature_str = "&".join(
+                "&".join(
+                    [f"instruction={instruction_type}"] +
+                    [f"{key}={item[key]}" for key in sorted(item) if item[key] is not None]
+                )
+                for item in data
+            )
+            data = None
+        else:
+            # 构建签名字符串，从指令类型开始
+            signature_str = f"instruction={instruction_type}"
 
         # 添加查询参数 - 按字母顺序排序
         if params and len(params) > 0:
@@ -337,8 +353,8 @@ class BackpackRest(BackpackBase):
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        data: Optional[Dict] = None
-    ) -> Dict[str, Any]:
+        data: Optional[Union[Dict, List[Dict]]] = None
+    ) -> Any:
         """发起需要认证的API请求，使用ED25519签名"""
         if not self.is_authenticated:
             raise RuntimeError("Exchange not authenticated")
@@ -1351,32 +1367,13 @@ class BackpackRest(BackpackBase):
         params: Optional[Dict[str, Any]] = None
     ) -> OrderData:
         """创建订单"""
-        mapped_symbol = self._map_symbol(symbol)
-
         # 🔥 确保市场数据已加载（获取真实精度）
         if not self._market_info:
             await self._fetch_supported_symbols()
 
-        # 🔥 格式化数量和价格精度，避免小数位过长问题
-        symbol_info = self.get_symbol_info(symbol)
-        formatted_amount = self.format_quantity(
-            symbol, amount, symbol_info)  # 已经是字符串
-
-        order_data = {
-            "symbol": mapped_symbol,
-            # Bid/Ask (Backpack格式)
-            "side": "Bid" if side == OrderSide.BUY else "Ask",
-            "orderType": order_type.value.title(),  # Market/Limit
-            "quantity": formatted_amount  # 直接使用，已经是字符串
-        }
-
-        if price:
-            formatted_price = self.format_price(
-                symbol, price, symbol_info)  # 已经是字符串
-            order_data["price"] = formatted_price  # 直接使用，已经是字符串
-
-        if params:
-            order_data.update(params)
+        order_data = self._build_order_payload(
+            symbol, side, order_type, amount, price, params,
+            symbol_info=self.get_symbol_info(symbol))
 
         try:
             response = await self._make_authenticated_request("POST", "/api/v1/order", data=order_data)
@@ -1431,6 +1428,81 @@ class BackpackRest(BackpackBase):
                 self.logger.error(f"异常堆栈: {traceback.format_exc()}")
             raise
 
+    def _build_order_payload(
+        self,
+        symbol: str,
+        side: OrderSide,
+        order_type: OrderType,
+        amount: Decimal,
+        price: Optional[Decimal] = None,
+        params: Optional[Dict[str, Any]] = None,
+        symbol_info: Optional[BackpackSymbolInfo] = None
+    ) -> Dict[str, Any]:
+        """构建下单请求体（Backpack格式，数量和价格按交易对精度格式化）"""
+        # 🔥 格式化数量和价格精度，避免小数位过长问题
+        formatted_amount = self.format_quantity(
+            symbol, amount, symbol_info)  # 已经是字符串
+
+        order_data = {
+            "symbol": self._map_symbol(symbol),
+            # Bid/Ask (Backpack格式)
+            "side": "Bid" if side == OrderSide.BUY else "Ask",
+            "orderType": order_type.value.title(),  # Market/Limit
+            "quantity": formatted_amount  # 直接使用，已经是字符串
+        }
+
+        if price:
+            formatted_price = self.format_price(
+                symbol, price, symbol_info)  # 已经是字符串
+            order_data["price"] = formatted_price  # 直接使用，已经是字符串
+
+        if params:
+            order_data.update(params)
+
+        return order_data
+
+    async def create_orders_batch(
+        self,
+        symbol: str,
+        orders: List[Dict[str, Any]]
+    ) -> List[Union[OrderData, Exception]]:
+        """
+        批量创建订单（POST /api/v1/orders，一次签名请求提交多个订单）
+
+        Args:
+            symbol: 交易对符号
+            orders: 订单参数列表（create_order 的关键字参数，不含symbol）
+
+        Returns:
+            与orders一一对应的结果列表（OrderData，或被交易所拒绝时的异常）
+        """
+        if not self._market_info:
+            await self._fetch_supported_symbols()
+
+        symbol_info = self.get_symbol_info(symbol)
+        payload = [
+            self._build_order_payload(symbol, symbol_info=symbol_info, **spec)
+            for spec in orders
+        ]
+
+        response = await self._make_authenticated_request(
+            "POST", "/api/v1/orders", data=payload)
+
+        if not isinstance(response, list) or len(response) != len(payload):
+            raise ValueError(f"批量下单返回了非预期数据: {response}")
+
+        # 逐个解析：被拒绝的订单返回错误对象（无订单ID）
+        results: List[Union[OrderData, Exception]] = []
+        for order_data, item in zip(payload, response):
+            if isinstance(item, dict) and item.get('id'):
+                results.append(self._parse_order(item))
+            else:
+                if self.logger:
+                    self.logger.warning(
+                        f"批量下单中的订单被拒绝: {item}, 订单数据: {order_data}")
+                results.append(RuntimeError(f"订单被拒绝: {item}"))
+        return results
+
     async def cancel_order(self, order_id: str, symbol: str) -> OrderData:
         """取消订单"""
         mapped_symbol = self._map_symbol(symbol)
@@ -15,7 +15,7 @@ from decimal import Decimal
 from datetime import datetime
 
 from .backpack_base import BackpackBase
-from ..models import TickerData, OrderBookData, TradeData, OrderBookLevel, OrderSide
+from ..models import TickerData, OrderBookData, TradeData, OrderBookLevel, OrderSide, PositionSnapshot
 
 
 class BackpackWebSocket(BackpackBase):
@@ -48,11 +48,13 @@ class BackpackWebSocket(BackpackBase):
         self._reconnect_attempts = 0
         self._reconnecting = False
         self._heartbeat_should_stop = False  # 🔧 修复：心跳停止标志
+        # 连接意外断开时 set()（首次连接时创建，绑定当前事件循环）
+        self.ws_disconnected_event: Optional[asyncio.Event] = None
 
         # 🔥 初始化持仓监控相关
         # 持仓缓存: {symbol: {size, entry_price, unrealized_pnl, side, timestamp}}
         self._position_cache = {}
-        self._position_callbacks = []  # 持仓更新回调函数列表
+        self._position_callbacks = set()  # 持仓更新回调函数集合
 
         # ============================================================================
         # 🔥 心跳检测参数（基于Backpack官方规范 + aiohttp实现）
@@ -160,6 +162,8 @@ class BackpackWebSocket(BackpackBase):
             self._reconnect_attempts = 0
             self._reconnecting = False
             self._heartbeat_should_stop = False  # 🔧 修复：重置心跳停止标志
+            if self.ws_disconnected_event is None:
+                self.ws_disconnected_event = asyncio.Event()
 
             # 不再需要监控服务器ping时间，aiohttp自动处理
 
@@ -650,6 +654,10 @@ class BackpackWebSocket(BackpackBase):
                 self.logger.warning(f"Backpack WebSocket消息处理失败: {e}")
             self._ws_connected = False
 
+        # 消息循环结束即连接已不可用（主动断开除外），通知使用方
+        if self.ws_disconnected_event is not None and not self._heartbeat_should_stop:
+            self.ws_disconnected_event.set()
+
     async def _process_websocket_message(self, message: str) -> None:
         """处理WebSocket消息 - 根据Backpack官方文档修复"""
         try:
@@ -1043,13 +1051,8 @@ class BackpackWebSocket(BackpackBase):
             if not hasattr(self, '_position_cache'):
                 self._position_cache = {}
 
-            self._position_cache[symbol] = {
-                'size': quantity,
-                'entry_price': entry_price,
-                'unrealized_pnl': unrealized_pnl,
-                'side': side,
-                'timestamp': datetime.now()
-            }
+            self._position_cache[symbol] = PositionSnapshot(
+                quantity, entry_price, unrealized_pnl, side, datetime.now())
 
             if self.logger:
                 self.logger.info(
@@ -1067,7 +1070,8 @@ class BackpackWebSocket(BackpackBase):
                     'unrealized_pnl': unrealized_pnl,
                     'side': side
                 }
-                for callback in self._position_callbacks:
+                # 快照迭代：回调中可能注销自身（如退出剥头皮模式）
+                for callback in tuple(self._position_callbacks):
                     await self._safe_callback(callback, position_info)
 
         except Exception as e:
@@ -1122,9 +1126,9 @@ class BackpackWebSocket(BackpackBase):
                 }
         """
         if not hasattr(self, '_position_callbacks'):
-            self._position_callbacks = []
+            self._position_callbacks = set()
 
-        self._position_callbacks.append(callback)
+        self._position_callbacks.add(callback)
 
         if self.logger:
             self.logger.info(
@@ -1134,19 +1138,19 @@ class BackpackWebSocket(BackpackBase):
 
         # 🔥 如果缓存中已有数据，立即触发一次回调（同步初始状态）
         if hasattr(self, '_position_cache') and symbol in self._position_cache:
-            cached_pos = self._position_cache[symbol]
+            cached_pos = PositionSnapshot.coerce(self._position_cache[symbol])
             try:
                 await callback({
                     'symbol': symbol,
-                    'size': cached_pos['size'],
-                    'entry_price': cached_pos['entry_price'],
-                    'unrealized_pnl': cached_pos.get('unrealized_pnl', Decimal('0')),
-                    'side': cached_pos.get('side', 'None')
+                    'size': cached_pos.size,
+                    'entry_price': cached_pos.entry_price,
+                    'unrealized_pnl': cached_pos.unrealized_pnl,
+                    'side': cached_pos.side
                 })
                 if self.logger:
                     self.logger.info(
                         f"📊 从缓存立即同步初始持仓: {symbol} "
-                        f"数量={cached_pos['size']}, 成本=${cached_pos['entry_price']}"
+                        f"数量={cached_pos.size}, 成本=${cached_pos.entry_price}"
                     )
             except Exception as e:
                 if self.logger:
@@ -45,7 +45,7 @@ class LighterAdapter(ExchangeAdapter):
         self._order_cache = shared_order_cache
 
         # 设置回调列表
-        shared_position_callbacks = []
+        shared_position_callbacks = set()  # 持仓回调集合（O(1)注册/移除，自动去重）
         shared_order_callbacks = []
 
         self._position_callbacks = shared_position_callbacks
@@ -496,14 +496,13 @@ class LighterAdapter(ExchangeAdapter):
                 # 统一使用LONG=正数, SHORT=负数的符号约定
                 signed_size = position.size if position.side.value.lower() == 'long' else - \
                     position.size
-                self._position_cache[position.symbol] = {
-                    'symbol': position.symbol,
-                    'size': signed_size,
-                    'side': position.side.value,
-                    'entry_price': position.entry_price,
-                    'unrealized_pnl': position.unrealized_pnl or Decimal('0'),
-                    'timestamp': position.timestamp,
-                }
+                self._position_cache[position.symbol] = PositionSnapshot(
+                    signed_size,
+                    position.entry_price,
+                    position.unrealized_pnl or Decimal('0'),
+                    position.side.value,
+                    position.timestamp,
+                )
 
         return positions
 
@@ -771,7 +770,7 @@ class LighterAdapter(ExchangeAdapter):
             callback: 数据回调函数
         """
         if callback:
-            self._position_callbacks.append(callback)
+            self._position_callbacks.add(callback)
         await self._websocket.subscribe_positions(callback)
 
     async def unsubscribe_ticker(self, symbol: str):
@@ -9,7 +9,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from typing import Dict, List, Optional, Any, AsyncGenerator, Callable
+from typing import Dict, List, Optional, Any, AsyncGenerator, Callable, Set
 from decimal import Decimal
 
 from ...services.events import Event
@@ -104,6 +104,11 @@ class ExchangeInterface(ABC):
         self._event_callbacks: Dict[str, List[Callable]] = {}
         self._last_heartbeat = datetime.now()
 
+        # 持仓推送缓存与回调（WebSocket持仓更新，供网格/剥头皮模块读取和注册）
+        # 子类可替换为与REST/WebSocket模块共享的同类型容器
+        self._position_cache: Dict[str, Any] = {}
+        self._position_callbacks: Set[Callable] = set()
+
     # === 生命周期管理 ===
 
     @abstractmethod
@@ -8,7 +8,7 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, NamedTuple, Optional, Any, Union
 from decimal import Decimal
 
 
@@ -160,6 +160,28 @@ class PositionData:
                 setattr(self, field_name, Decimal(str(value)))
 
 
+class PositionSnapshot(NamedTuple):
+    """持仓缓存条目（适配器 _position_cache 中保存的轻量持仓快照）"""
+    size: Decimal                    # 持仓数量（正数=多头，负数=空头）
+    entry_price: Decimal             # 开仓均价
+    unrealized_pnl: Decimal          # 未实现盈亏
+    side: str                        # 持仓方向（'Long'/'Short'/'None'）
+    timestamp: datetime              # 更新时间
+
+    @classmethod
+    def coerce(cls, entry: Union['PositionSnapshot', Dict[str, Any]]) -> 'PositionSnapshot':
+        """兼容旧版dict格式的缓存条目"""
+        if isinstance(entry, cls):
+            return entry
+        return cls(
+            entry['size'],
+            entry['entry_price'],
+            entry.get('unrealized_pnl') or Decimal('0'),
+            entry.get('side', 'None'),
+            entry.get('timestamp') or datetime.now()
+        )
+
+
 @dataclass
 class BalanceData:
     """余额数据模型"""
@@ -5,18 +5,20 @@ MESA交易系统 - 统一日志模块核心实现
 - 基础日志器类
 - 专用日志器（交易、数据、错误、系统等）
 - 简单配置
-- 文件和控制台输出
+- 文件和控制台输出（默认由后台线程写出，不阻塞事件循环）
 - 统一的日志格式
 """
 
+import atexit
 import logging
 import os
 import json
+import queue
 import time
 from typing import Dict, Any, Optional, Union, List
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 
 class LogConfig:
@@ -30,7 +32,8 @@ class LogConfig:
                  max_file_size: int = 5 * 1024 *
                  1024,  # 5MB (与 logging.yaml 保持一致)
                  backup_count: int = 3,  # 3个备份 (与 logging.yaml 保持一致)
-                 enable_console: bool = True):  # 🔥 新增：是否启用控制台输出
+                 enable_console: bool = True,  # 🔥 新增：是否启用控制台输出
+                 async_output: bool = True):  # 由后台线程写出日志（调用方只入队）
         self.log_dir = log_dir
         self.level = getattr(logging, level.upper())
         self.console_level = getattr(logging, console_level.upper())
@@ -38,11 +41,60 @@ class LogConfig:
         self.max_file_size = max_file_size
         self.backup_count = backup_count
         self.enable_console = enable_console
+        self.async_output = async_output
 
         # 确保日志目录存在
         Path(log_dir).mkdir(parents=True, exist_ok=True)
 
 
+class _TargetQueueHandler(QueueHandler):
+    """入队处理器：记录附带实际输出的处理器，由后台线程写出"""
+
+    def __init__(self, log_queue, targets: List[logging.Handler]):
+        super().__init__(log_queue)
+        self.targets = targets
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.targets = self.targets
+        return record
+
+
+class _DispatchHandler(logging.Handler):
+    """后台线程中把记录交给其附带的处理器（按各处理器级别过滤）"""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in record.targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# 所有日志器共享一个队列和后台写出线程（首次使用时启动）
+_log_queue: Optional[queue.SimpleQueue] = None
+_log_listener: Optional[QueueListener] = None
+
+
+def _get_log_queue() -> queue.SimpleQueue:
+    """获取共享日志队列（必要时启动后台写出线程）"""
+    global _log_queue, _log_listener
+    if _log_listener is None:
+        _log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(_log_queue, _DispatchHandler())
+        _log_listener.start()
+        atexit.register(_stop_log_listener)
+    return _log_queue
+
+
+def _stop_log_listener():
+    """停止后台写出线程（先写完队列中剩余的记录）"""
+    global _log_queue, _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+        _log_queue = None
+
+
 class BaseLogger:
     """基础日志器类"""
 
@@ -84,30 +136,54 @@ class BaseLogger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
 
-    def debug(self, message: str, **kwargs):
+        # 异步输出：调用方只把记录放入队列，控制台/文件I/O在后台线程完成
+        if self.config.async_output:
+            targets = list(self.logger.handlers)
+            self.logger.handlers.clear()
+            self.logger.addHandler(
+                _TargetQueueHandler(_get_log_queue(), targets))
+
+    def isEnabledFor(self, level: int) -> bool:
+        """该级别的日志是否会输出（可据此跳过昂贵的日志内容构造）"""
+        return self.logger.isEnabledFor(level)
+
+    # 各级别方法：args 为 %-格式化参数（延迟到实际输出时格式化），
+    # exc_info 交给标准库处理（堆栈仅在该级别启用时才格式化），其余 kwargs 追加到消息末尾
+
+    def debug(self, message: str, *args, **kwargs):
         """调试日志"""
+        exc_info = kwargs.pop('exc_info', None)
         extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.debug(f"{message}{extra_info}")
+        self.logger.debug(f"{message}{extra_info}", *args, exc_info=exc_info)
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args, **kwargs):
         """信息日志"""
+        exc_info = kwargs.pop('exc_info', None)
         extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.info(f"{message}{extra_info}")
+        self.logger.info(f"{message}{extra_info}", *args, exc_info=exc_info)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """警告日志"""
+        exc_info = kwargs.pop('exc_info', None)
         extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.warning(f"{message}{extra_info}")
+        self.logger.warning(f"{message}{extra_info}", *args, exc_info=exc_info)
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args, **kwargs):
         """错误日志"""
+        exc_info = kwargs.pop('exc_info', None)
         extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.error(f"{message}{extra_info}")
+        self.logger.error(f"{message}{extra_info}", *args, exc_info=exc_info)
+
+    def exception(self, message: str, *args, **kwargs):
+        """错误日志（附带当前异常堆栈，仅在except块中调用）"""
+        kwargs.setdefault('exc_info', True)
+        self.error(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args, **kwargs):
         """严重错误日志"""
+        exc_info = kwargs.pop('exc_info', None)
         extra_info = f" | {self._format_extra(**kwargs)}" if kwargs else ""
-        self.logger.critical(f"{message}{extra_info}")
+        self.logger.critical(f"{message}{extra_info}", *args, exc_info=exc_info)
 
     def _format_extra(self, **kwargs) -> str:
         """格式化额外信息"""
@@ -356,9 +432,12 @@ def shutdown_logging():
         system_logger = get_system_logger()
         system_logger.shutdown("UnifiedLoggingSystem", "正常关闭")
 
-        # 关闭所有处理器
+        # 写完队列中剩余的记录后关闭所有处理器
+        _stop_log_listener()
         for logger in _loggers.values():
             for handler in logger.logger.handlers:
+                for target in getattr(handler, 'targets', ()):
+                    target.close()
                 handler.close()
 
         _loggers.clear()
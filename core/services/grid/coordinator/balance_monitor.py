@@ -214,9 +214,7 @@ class BalanceMonitor:
                 )
 
         except Exception as e:
-            self.logger.error(f"❌ 获取账户余额失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 获取账户余额失败: {e}")
 
     def _initialize_managers_capital(self):
         """初始化各个管理器的本金（首次获取时）"""
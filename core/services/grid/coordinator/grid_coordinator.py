@@ -33,6 +33,7 @@ from decimal import Decimal
 from datetime import datetime
 
 from ....logging import get_logger
+from ....adapters.exchanges.models import PositionSnapshot
 from ..interfaces import IGridStrategy, IGridEngine, IPositionTracker
 from ..models import (
     GridConfig, GridState, GridOrder, GridOrderSide,
@@ -49,6 +50,8 @@ from .position_monitor import PositionMonitor
 from .balance_monitor import BalanceMonitor
 from .scalping_operations import ScalpingOperations
 
+_DEC_ZERO = Decimal(0)
+
 
 class GridCoordinator:
     """
@@ -345,7 +348,7 @@ class GridCoordinator:
             self.tracker.record_filled_order(filled_order)
 
             # 🔥 2.5. 记录现货买入手续费（仅现货且启用预留）
-            if self.reserve_manager and filled_order.side.value == 'buy':
+            if self.reserve_manager and filled_order.side is GridOrderSide.BUY:
                 fee = self.reserve_manager.record_buy_fee(
                     filled_order.filled_amount or filled_order.amount
                 )
@@ -517,8 +520,7 @@ class GridCoordinator:
             placed_orders = await self.engine.place_batch_orders(reverse_orders)
 
             # 5. 批量更新状态
-            for order in placed_orders:
-                self.state.add_order(order)
+            self.state.add_orders_bulk(placed_orders)
 
             self.logger.info(
                 f"✅ 批量反向订单已挂: {len(placed_orders)}个"
@@ -626,9 +628,7 @@ class GridCoordinator:
                 self.logger.info("✅ 无旧订单，跳过清理")
 
         except Exception as e:
-            self.logger.error(f"❌ 清理旧订单失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 清理旧订单失败: {e}")
 
         # 步骤2: 平掉所有持仓
         try:
@@ -641,11 +641,11 @@ class GridCoordinator:
 
             if positions and len(positions) > 0:
                 position = positions[0]
-                position_size = position.size or Decimal('0')
+                position_size = position.size or _DEC_ZERO
 
                 if position_size != 0:
                     self.logger.warning(
-                        f"⚠️ 检测到持仓: {position_size} {self.config.symbol.split('_')[0]}, "
+                        f"⚠️ 检测到持仓: {position_size} {self.config.base_asset}, "
                         f"成本=${position.entry_price}, "
                         f"未实现盈亏=${position.unrealized_pnl}"
                     )
@@ -703,18 +703,14 @@ class GridCoordinator:
                             self.logger.info("✅ 持仓已清空")
 
                     except Exception as e:
-                        self.logger.error(f"❌ 平仓失败: {e}")
-                        import traceback
-                        self.logger.error(traceback.format_exc())
+                        self.logger.exception(f"❌ 平仓失败: {e}")
                 else:
                     self.logger.info("✅ 无持仓，跳过平仓")
             else:
                 self.logger.info("✅ 无持仓，跳过平仓")
 
         except Exception as e:
-            self.logger.error(f"❌ 检查/平仓失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 检查/平仓失败: {e}")
 
         self.logger.info("=" * 80)
         self.logger.info("✅ 启动前清理完成")
@@ -747,34 +743,33 @@ class GridCoordinator:
                 positions = await self.engine.exchange.get_positions(symbols=[self.config.symbol])
                 if positions and len(positions) > 0:
                     position = positions[0]
-                    real_size = position.size or Decimal('0')
-                    real_entry_price = position.entry_price or Decimal('0')
+                    real_size = position.size or _DEC_ZERO
+                    real_entry_price = position.entry_price or _DEC_ZERO
 
                     # 同步到WebSocket缓存
-                    if hasattr(self.engine.exchange, '_position_cache'):
-                        self.engine.exchange._position_cache[self.config.symbol] = {
-                            'size': real_size,
-                            'entry_price': real_entry_price,
-                            'unrealized_pnl': position.unrealized_pnl or Decimal('0'),
-                            'side': 'Long' if real_size > 0 else 'Short',
-                            'timestamp': datetime.now()
-                        }
-                        self.logger.info(
-                            f"✅ 初始持仓已同步到WebSocket缓存: "
-                            f"{real_size} {self.config.symbol.split('_')[0]}, "
-                            f"成本=${real_entry_price:,.2f}"
-                        )
-                        # 更新position_data供后续使用
-                        position_data = {
-                            'size': real_size,
-                            'entry_price': real_entry_price,
-                            'unrealized_pnl': position.unrealized_pnl or Decimal('0')
-                        }
+                    self.engine.exchange._position_cache[self.config.symbol] = PositionSnapshot(
+                        real_size,
+                        real_entry_price,
+                        position.unrealized_pnl or _DEC_ZERO,
+                        'Long' if real_size > 0 else 'Short',
+                        datetime.now()
+                    )
+                    self.logger.info(
+                        f"✅ 初始持仓已同步到WebSocket缓存: "
+                        f"{real_size} {self.config.base_asset}, "
+                        f"成本=${real_entry_price:,.2f}"
+                    )
+                    # 更新position_data供后续使用
+                    position_data = {
+                        'size': real_size,
+                        'entry_price': real_entry_price,
+                        'unrealized_pnl': position.unrealized_pnl or _DEC_ZERO
+                    }
             else:
                 # WebSocket缓存已有数据
                 self.logger.info(
                     f"✅ WebSocket缓存已有持仓数据: "
-                    f"{position_data['size']} {self.config.symbol.split('_')[0]}, "
+                    f"{position_data['size']} {self.config.base_asset}, "
                     f"成本=${position_data['entry_price']:,.2f}"
                 )
         except Exception as e:
@@ -813,9 +808,7 @@ class GridCoordinator:
                         f"触发点: Grid {self.config.get_scalping_trigger_grid()})"
                     )
             except Exception as e:
-                self.logger.warning(f"检查剥头皮模式失败: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.warning(f"检查剥头皮模式失败: {e}", exc_info=True)
 
         # 🔥 价格移动网格：启动价格脱离监控
         if self.config.is_follow_mode():
@@ -853,6 +846,10 @@ class GridCoordinator:
         # 🔄 停止持仓同步监控（使用新模块）
         await self.position_monitor.stop_monitoring()
 
+        # 停止止盈订单更新（避免撤单后又挂出止盈订单）
+        if self.scalping_ops:
+            await self.scalping_ops.cancel_take_profit_updates()
+
         # 取消所有挂单
         cancelled_count = await self.engine.cancel_all_orders()
         self.logger.info(f"取消了{cancelled_count}个挂单")
@@ -930,6 +927,7 @@ class GridCoordinator:
 
         # 🔥 添加监控方式信息
         stats.monitoring_mode = self.engine.get_monitoring_mode()
+        stats.order_update_backpressure = self.engine.get_order_update_backpressure_count()
 
         # 💰 使用真实的账户余额（从 BalanceMonitor 获取）
         balances = self.balance_monitor.get_balances()
@@ -1128,15 +1126,20 @@ class GridCoordinator:
         当WebSocket收到持仓更新推送时自动调用
         """
         try:
-            # 只在剥头皮模式激活时处理
-            if not self.scalping_manager or not self.scalping_manager.is_active():
-                return
-
             # 只处理当前交易对的持仓
             if position_info.get('symbol') != self.config.symbol:
                 return
 
             current_position = position_info.get('size', Decimal('0'))
+
+            # 通知剥头皮操作（止盈成交后等待持仓归零）
+            if self.scalping_ops:
+                self.scalping_ops.notify_position_update(current_position)
+
+            # 只在剥头皮模式激活时处理
+            if not self.scalping_manager or not self.scalping_manager.is_active():
+                return
+
             entry_price = position_info.get('entry_price', Decimal('0'))
 
             # 检查是否有变化
@@ -1169,9 +1172,7 @@ class GridCoordinator:
                 self._last_ws_position_price = entry_price
 
         except Exception as e:
-            self.logger.error(f"处理WebSocket持仓更新失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"处理WebSocket持仓更新失败: {e}")
 
     def __repr__(self) -> str:
         return (
@@ -1261,9 +1262,7 @@ class GridCoordinator:
                 self.logger.info("价格脱离监控已停止")
                 break
             except Exception as e:
-                self.logger.error(f"价格脱离监控出错: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception(f"价格脱离监控出错: {e}")
                 await asyncio.sleep(10)  # 出错后等待10秒再继续
 
     async def _check_scalping_mode(self, current_price: Decimal, current_grid_index: int):
@@ -1544,11 +1543,8 @@ class GridCoordinator:
             # 从engine获取当前挂单
             engine_orders = self.engine.get_pending_orders()
 
-            # 统计买单和卖单数量
-            buy_count = sum(
-                1 for order in engine_orders if order.side == GridOrderSide.BUY)
-            sell_count = sum(
-                1 for order in engine_orders if order.side == GridOrderSide.SELL)
+            # 统计买单和卖单数量（引擎增量维护）
+            buy_count, sell_count = self.engine.get_pending_order_counts()
 
             # 更新state的统计数据
             self.state.pending_buy_orders = buy_count
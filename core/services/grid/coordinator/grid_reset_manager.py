@@ -91,9 +91,7 @@ class GridResetManager:
                 self.logger.warning("🛡️ 本金保护：固定范围网格已停止，请手动重新启动")
 
         except Exception as e:
-            self.logger.error(f"❌ 本金保护重置失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 本金保护重置失败: {e}")
         finally:
             # 🔥 关键：无论成功或失败，都要释放重置锁
             self.coordinator._resetting = False
@@ -141,9 +139,7 @@ class GridResetManager:
                 self.logger.info("✅ 止盈重置完成，固定范围网格已重启")
 
         except Exception as e:
-            self.logger.error(f"❌ 止盈重置失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 止盈重置失败: {e}")
         finally:
             # 🔥 关键：无论成功或失败，都要释放重置锁
             self.coordinator._resetting = False
@@ -219,9 +215,7 @@ class GridResetManager:
                 self.logger.error("❌ 价格脱离重置失败")
 
         except Exception as e:
-            self.logger.error(f"❌ 价格脱离重置失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 价格脱离重置失败: {e}")
         finally:
             self.coordinator._is_resetting = False
 
@@ -5,7 +5,8 @@
 """
 
 import asyncio
-from typing import List, Optional, Callable, TYPE_CHECKING
+import time
+from typing import Dict, List, Optional, Callable, Tuple, TYPE_CHECKING
 from decimal import Decimal
 
 from ....logging import get_logger
@@ -47,6 +48,106 @@ class OrderOperations:
         # 创建验证工具实例
         self.verifier = OrderVerificationUtils(engine.exchange, config.symbol)
 
+        # 开放订单短时快照缓存：symbol -> (monotonic时间戳, 订单列表)
+        # 撤单验证与挂单验证共用，撤单/挂单提交后立即失效
+        self._open_orders_cache: Dict[str, Tuple[float, list]] = {}
+
+        # 撤单确认事件：order_id -> Event（由WebSocket订单终态推送触发）
+        self._pending_cancel_events: Dict[str, asyncio.Event] = {}
+        self._terminal_updates_subscribed = False
+
+        # 撤单提交到确认的延迟EMA（秒），用于自适应确定验证前的等待时间
+        self._cancel_latency_ema: float = 0.3
+
+    async def get_open_orders_cached(self, symbol: Optional[str] = None, max_age: float = 0.5) -> list:
+        """
+        获取开放订单（带短时缓存）
+
+        Args:
+            symbol: 交易对，默认使用配置的交易对
+            max_age: 缓存最大有效期（秒）
+
+        Returns:
+            开放订单列表
+        """
+        symbol = symbol or self.config.symbol
+        cached = self._open_orders_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        open_orders = await self.engine.exchange.get_open_orders(symbol=symbol)
+        self._open_orders_cache[symbol] = (time.monotonic(), open_orders)
+        return open_orders
+
+    def invalidate_open_orders_cache(self, symbol: Optional[str] = None):
+        """使开放订单缓存失效（撤单/挂单后调用）"""
+        self._open_orders_cache.pop(symbol or self.config.symbol, None)
+
+    def _on_order_terminal_update(self, order_id: str, status: str):
+        """WebSocket订单终态回调：撤单/成交确认"""
+        event = self._pending_cancel_events.pop(order_id, None)
+        if event is not None:
+            event.set()
+
+    def _register_cancel_events(self, order_ids: List[str]) -> List[asyncio.Event]:
+        """为待撤订单注册确认事件（首次使用时订阅引擎的订单终态推送）"""
+        if not self._terminal_updates_subscribed:
+            subscribe = getattr(self.engine, 'subscribe_order_terminal_updates', None)
+            if subscribe is None:
+                return []
+            subscribe(self._on_order_terminal_update)
+            self._terminal_updates_subscribed = True
+
+        events = []
+        for order_id in order_ids:
+            event = asyncio.Event()
+            self._pending_cancel_events[order_id] = event
+            events.append(event)
+        return events
+
+    def _record_cancel_latency(self, started_at: float):
+        """记录一次撤单确认延迟（更新EMA）"""
+        latency = time.perf_counter() - started_at
+        self._cancel_latency_ema = 0.8 * self._cancel_latency_ema + 0.2 * latency
+
+    def _cancel_wait_timeout(self) -> float:
+        """撤单后到验证前的等待时间（按历史确认延迟自适应）"""
+        return max(self._cancel_latency_ema * 1.2, 0.05)
+
+    async def _wait_cancel_events(
+        self,
+        order_ids: List[str],
+        events: List[asyncio.Event],
+        timeout: float,
+        started_at: Optional[float] = None
+    ) -> bool:
+        """
+        等待WebSocket撤单确认（无法订阅推送时退化为固定等待）
+
+        Args:
+            started_at: 撤单提交时刻（time.perf_counter），确认后用于更新延迟EMA
+
+        Returns:
+            True: 所有订单均已通过WebSocket确认
+            False: 超时（调用方回退到REST验证）
+        """
+        if not events:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(event.wait() for event in events)),
+                timeout=timeout
+            )
+            if started_at is not None:
+                self._record_cancel_latency(started_at)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for order_id in order_ids:
+                self._pending_cancel_events.pop(order_id, None)
+
     def _check_if_paused(self, operation_name: str) -> bool:
         """
         检查系统是否暂停或紧急停止
@@ -74,6 +175,80 @@ class OrderOperations:
 
         return False
 
+    async def cancel_order(
+        self,
+        order_id: str,
+        verify: bool = False,
+        verify_delay: Optional[float] = None
+    ) -> bool:
+        """
+        取消单个订单（可选验证）
+
+        流程：
+        1. 提交取消（交易所支持时走批量取消接口）
+        2. verify=True 时等待后查询一次开放订单确认
+        3. 订单仍存在则重试一次
+
+        Args:
+            order_id: 订单ID
+            verify: 是否从交易所验证订单已取消
+            verify_delay: 提交取消后到验证前的等待时间（秒），默认按历史撤单确认延迟自适应
+
+        Returns:
+            True: 订单已取消（或已不存在）
+            False: 取消失败
+        """
+        max_attempts = 2 if verify else 1
+
+        for attempt in range(max_attempts):
+            events = self._register_cancel_events([order_id]) if verify else []
+            started_at = time.perf_counter()
+            # engine.cancel_orders 不抛异常，返回成功取消的数量（0 表示请求失败）
+            cancelled = await self.engine.cancel_orders([order_id])
+            self.invalidate_open_orders_cache()
+            if cancelled:
+                self.state.remove_order(order_id)
+                self.logger.info(f"✅ 已提交取消订单: {order_id}")
+            elif not verify:
+                self.logger.error(f"取消订单失败: {order_id}")
+                return False
+            else:
+                # 取消请求失败：订单可能已成交/已不存在，查询交易所确认
+                self.logger.warning(f"⚠️ 取消订单请求失败: {order_id}，查询交易所确认订单状态")
+                self._pending_cancel_events.pop(order_id, None)
+
+            if not verify:
+                return True
+
+            # 优先等待WebSocket撤单确认，超时后回退到REST查询验证
+            if cancelled:
+                timeout = verify_delay if verify_delay is not None else self._cancel_wait_timeout()
+                if await self._wait_cancel_events([order_id], events, timeout, started_at):
+                    self.logger.info("✅ 验证通过: WebSocket确认订单已取消")
+                    return True
+
+            try:
+                exchange_orders = await self.get_open_orders_cached()
+            except Exception as e:
+                self.logger.error(f"验证取消失败: {e}")
+                continue
+
+            if not any(order.id == order_id for order in exchange_orders):
+                if cancelled:
+                    self._record_cancel_latency(started_at)
+                    self.logger.info("✅ 验证通过: 订单已取消")
+                else:
+                    self.logger.info("订单已不存在，视为取消成功")
+                    self.state.remove_order(order_id)
+                return True
+
+            self.logger.warning(
+                f"⚠️ 验证失败 (尝试{attempt+1}/{max_attempts}): "
+                f"订单仍存在，重新取消..."
+            )
+
+        return False
+
     async def cancel_all_orders_with_verification(
         self,
         max_retries: int = 3,
@@ -101,6 +276,7 @@ class OrderOperations:
         self.logger.info("📋 取消所有订单并验证...")
 
         # 1. 首次批量取消
+        self.invalidate_open_orders_cache()
         try:
             cancelled_count = await self.engine.cancel_all_orders()
             self.logger.info(f"✅ 批量取消API返回: {cancelled_count} 个订单")
@@ -220,6 +396,14 @@ class OrderOperations:
             cancelled_count = 0
             failed_count = 0
 
+            cancel_ids = [
+                getattr(order, 'order_id', None) or getattr(order, 'id', None)
+                for order in orders_to_cancel_list
+            ]
+            cancel_ids = [order_id for order_id in cancel_ids if order_id]
+            cancel_events = self._register_cancel_events(cancel_ids)
+            started_at = time.perf_counter()
+
             async def cancel_single_order(order):
                 """取消单个订单"""
                 try:
@@ -272,12 +456,14 @@ class OrderOperations:
                 if i + batch_size < len(orders_to_cancel_list):
                     await asyncio.sleep(0.1)
 
+            self.invalidate_open_orders_cache()
             self.logger.info(
                 f"✅ 批量取消完成: 成功={cancelled_count}, 失败={failed_count}"
             )
 
-            # 3. 等待一小段时间，让交易所处理取消请求
-            await asyncio.sleep(0.3)
+            # 3. 等待交易所处理取消请求（WebSocket全部确认则提前结束等待）
+            await self._wait_cancel_events(
+                cancel_ids, cancel_events, self._cancel_wait_timeout(), started_at)
 
             # 4. 🔥 关键：从交易所验证是否还有满足条件的订单
             if await self.verifier.verify_no_orders_by_filter(
@@ -377,6 +563,7 @@ class OrderOperations:
 
             try:
                 placed_order = await self.engine.place_order(order)
+                self.invalidate_open_orders_cache()
                 self.state.add_order(placed_order)
                 api_success = True
                 returned_order = placed_order
@@ -389,6 +576,8 @@ class OrderOperations:
             except Exception as e:
                 api_success = False
                 api_error_msg = str(e)
+                # 订单可能已提交但返回失败，验证时必须重新查询
+                self.invalidate_open_orders_cache()
 
                 self.logger.warning(
                     f"❌ 挂单API调用失败: {e}\n"
@@ -491,9 +680,7 @@ class OrderOperations:
         """
         # 获取当前所有开放订单
         try:
-            open_orders = await self.engine.exchange.get_open_orders(
-                symbol=self.config.symbol
-            )
+            open_orders = await self.get_open_orders_cached()
         except Exception as e:
             self.logger.error(f"❌ 获取开放订单失败: {e}")
             return None
@@ -58,7 +58,7 @@ class PositionMonitor:
         self._rest_is_available: bool = True     # REST API可用性
 
         # 🆕 持仓异常保护配置
-        self._position_change_alert_threshold: float = 100  # 持仓变化告警阈值（%）
+        self._position_change_alert_threshold: float = 100.0  # 持仓变化告警阈值（%）
         self._position_max_multiplier: int = 10             # 最大持仓倍数
 
         # 🔥 初始化阶段配置（避免首次启动和重置时的误报）
@@ -76,9 +76,15 @@ class PositionMonitor:
         # 事件触发查询去重
         self._last_event_query_time: float = 0
 
+        # 现货/合约模式缓存（交易所类型运行期间不变，首次判断后缓存）
+        self._is_spot_mode_cached: Optional[bool] = None
+        self._mode_str: str = "合约"
+
         # 监控任务
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._wake_event = asyncio.Event()     # 停止时唤醒查询循环
+        self._error_backoff: float = 0         # 循环异常后的退避时间（秒）
 
     async def start_monitoring(self):
         """启动持仓监控（纯REST API）"""
@@ -87,6 +93,8 @@ class PositionMonitor:
             return
 
         self._running = True
+        self._wake_event.clear()
+        self._error_backoff = 0
 
         # 🔥 进入初始化阶段（避免首次启动时的持仓变化误报）
         self._initial_phase = True
@@ -114,6 +122,8 @@ class PositionMonitor:
     async def stop_monitoring(self):
         """停止持仓监控"""
         self._running = False
+        # 先唤醒循环，使其在退避等待中立即看到 _running=False
+        self._wake_event.set()
 
         if self._monitor_task:
             self._monitor_task.cancel()
@@ -167,8 +177,7 @@ class PositionMonitor:
             if position_qty == 0:
                 # 无持仓
                 if is_initial or self._last_position_size != Decimal('0'):
-                    mode_str = "现货" if is_spot_mode else "合约"
-                    self.logger.info(f"📊 REST查询({mode_str}): 当前无持仓")
+                    self.logger.info(f"📊 REST查询({self._mode_str}): 当前无持仓")
                     # 🔥 持仓数据的唯一来源：REST API查询结果
                     # tracker不再通过WebSocket订单成交事件更新持仓
                     self.tracker.sync_initial_position(
@@ -178,6 +187,10 @@ class PositionMonitor:
                     self._last_position_size = Decimal('0')
                     self._last_position_price = Decimal('0')
 
+                    # 通知剥头皮操作：持仓已归零（止盈成交后的平仓确认）
+                    if self.coordinator.scalping_ops:
+                        self.coordinator.scalping_ops.notify_position_update(Decimal('0'))
+
                     # 更新剥头皮管理器
                     if self.coordinator.scalping_manager and self.coordinator.scalping_manager.is_active():
                         initial_capital = self.coordinator.scalping_manager.get_initial_capital()
@@ -221,17 +234,15 @@ class PositionMonitor:
                     initial_capital, self.coordinator.balance_monitor.collateral_balance
                 )
 
-            # 记录日志
-            side_str = "Long" if position_qty > 0 else "Short" if position_qty < 0 else "None"
-            mode_str = "现货" if is_spot_mode else "合约"
-
+            # 记录日志（仅在实际输出时才构造字符串）
             if is_initial:
+                side_str = "Long" if position_qty > 0 else "Short" if position_qty < 0 else "None"
                 self.logger.info(
-                    f"✅ 初始持仓({mode_str}): {side_str} {abs(position_qty)} @ ${entry_price}"
+                    f"✅ 初始持仓({self._mode_str}): {side_str} {abs(position_qty)} @ ${entry_price}"
                 )
             elif position_changed:
                 self.logger.info(
-                    f"📡 REST同步({mode_str}): 持仓变化 {self._last_position_size} → {position_qty}, "
+                    f"📡 REST同步({self._mode_str}): 持仓变化 {self._last_position_size} → {position_qty}, "
                     f"成本=${entry_price:.2f}"
                 )
 
@@ -319,13 +330,10 @@ class PositionMonitor:
             return  # 上次持仓为0（或被归零），不检测
 
         # 计算持仓变化率（使用归零后的持仓）
-        position_change = abs(normalized_new_position -
-                              normalized_last_position)
-        if normalized_last_position != Decimal('0'):
-            change_percentage = (
-                position_change / abs(normalized_last_position)) * 100
-        else:
-            change_percentage = Decimal('0')
+        # 仅用于阈值比较，使用float计算即可（日志中的持仓数值仍保留Decimal）
+        last_f = float(normalized_last_position)
+        new_f = float(normalized_new_position)
+        change_percentage = abs(new_f - last_f) / abs(last_f) * 100.0
 
         # 告警阈值检测
         if change_percentage > self._position_change_alert_threshold:
@@ -343,9 +351,8 @@ class PositionMonitor:
                 )
 
         # 紧急停止检测（使用归零后的持仓）
-        expected_max_position = abs(
-            normalized_last_position) * self._position_max_multiplier
-        if abs(normalized_new_position) > expected_max_position and expected_max_position > 0:
+        expected_max_position = abs(last_f) * self._position_max_multiplier
+        if abs(new_f) > expected_max_position and expected_max_position > 0:
             self.logger.critical(
                 f"🚨 持仓异常！紧急停止交易！\n"
                 f"   上次持仓: {normalized_last_position} (原始: {self._last_position_size})\n"
@@ -387,15 +394,20 @@ class PositionMonitor:
                     self.logger.debug(f"✅ 定时REST查询成功")
                 else:
                     self.logger.warning(f"⚠️ 定时REST查询失败")
+                self._error_backoff = 0
 
             except asyncio.CancelledError:
                 self.logger.info("🔄 REST查询循环已取消")
                 break
             except Exception as e:
-                self.logger.error(f"❌ REST查询循环错误: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
-                await asyncio.sleep(10)
+                self.logger.exception(f"❌ REST查询循环错误: {e}")
+
+                # 自适应退避（1s起，最长10s），可被停止信号立即唤醒
+                self._error_backoff = min(10, self._error_backoff * 2 or 1)
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=self._error_backoff)
+                except asyncio.TimeoutError:
+                    pass
 
         self.logger.info("🔄 REST查询循环已退出")
 
@@ -429,7 +441,10 @@ class PositionMonitor:
         return "REST API"
 
     def _is_spot_mode(self) -> bool:
-        """判断是否是现货模式"""
+        """判断是否是现货模式（结果缓存，同时更新 self._mode_str）"""
+        if self._is_spot_mode_cached is not None:
+            return self._is_spot_mode_cached
+
         try:
             # 🔥 修复导入路径：4个点，不是5个点
             from ....adapters.exchanges.interface import ExchangeType
@@ -437,11 +452,11 @@ class PositionMonitor:
                 is_spot = self.engine.exchange.config.exchange_type == ExchangeType.SPOT
                 self.logger.debug(
                     f"🔍 现货模式判断: {is_spot} (exchange_type={self.engine.exchange.config.exchange_type})")
+                self._is_spot_mode_cached = is_spot
+                self._mode_str = "现货" if is_spot else "合约"
                 return is_spot
         except Exception as e:
-            self.logger.error(f"❌ 判断现货模式失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 判断现货模式失败: {e}")
         return False
 
     async def _query_spot_position(self) -> tuple:
@@ -527,9 +542,7 @@ class PositionMonitor:
             return trading_balance, entry_price
 
         except Exception as e:
-            self.logger.error(f"❌ 查询现货持仓失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 查询现货持仓失败: {e}")
             return Decimal('0'), Decimal('0')
 
     def end_initial_phase(self):
@@ -5,15 +5,32 @@
 """
 
 import asyncio
-from typing import Optional
+import random
+import time
+from functools import wraps
+from typing import Dict, Optional
 from decimal import Decimal
 from datetime import datetime
 
 from ....logging import get_logger
+from ....adapters.exchanges.interface import ExchangeType
 from ..models import GridOrder, GridOrderSide
 from ..models.grid_config import GridType
 from .order_operations import OrderOperations
 
+_DEC_ZERO = Decimal(0)
+_TP_UPDATE_DEBOUNCE = 0.2  # 止盈订单更新防抖窗口（秒）
+
+
+def require_active_scalping(func):
+    """前置条件：剥头皮模式未激活时直接返回False，不执行方法体"""
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if not self._scalping_active_event.is_set():
+            return False
+        return await func(self, *args, **kwargs)
+    return wrapper
+
 
 class ScalpingOperations:
     """
@@ -57,6 +74,10 @@ class ScalpingOperations:
         self.strategy = strategy
         self.config = config
 
+        # 剥头皮激活事件（由ScalpingManager的activate/deactivate维护；无管理器时永不触发）
+        self._scalping_active_event = (
+            scalping_manager.active_event if scalping_manager else asyncio.Event())
+
         # 创建订单操作实例
         self.order_ops = OrderOperations(engine, state, config, coordinator)
 
@@ -65,16 +86,65 @@ class ScalpingOperations:
         self._same_directional_order_count = 0     # 同一方向性订单下的调整次数
         self._max_same_directional_updates = 1    # 同一方向性订单只操作1次
 
+        # 挂止盈订单连续失败次数（按交易对，跨调用保留，用于指数退避）
+        self._tp_failure_counts: Dict[str, int] = {}
+
+        # 网格重置管理器（止盈成交时首次使用才获取，之后复用）
+        self._reset_manager = None
+
+        # 持仓归零事件（止盈成交后等待平仓完成，由持仓推送/REST持仓监控触发）
+        self._balance_settled_event = asyncio.Event()
+
+        # 止盈订单更新防抖（连续成交时合并为一次取消+重挂）
+        self._tp_update_pending: Optional[asyncio.Task] = None
+        # 全部止盈更新任务（等待中+执行中），保持强引用，停用/停止时统一取消
+        self._tp_update_tasks: set = set()
+        self._tp_update_deadline: float = 0
+        self._tp_update_lock = asyncio.Lock()
+
+        # 上次确认止盈订单无需更新时的持仓（持仓未变化时跳过检查）
+        self._last_checked_position: Optional[Decimal] = None
+
     def _is_spot_mode(self) -> bool:
         """判断是否是现货模式"""
         try:
-            from ....adapters.exchanges.interface import ExchangeType
             if hasattr(self.engine, 'exchange') and hasattr(self.engine.exchange, 'config'):
                 return self.engine.exchange.config.exchange_type == ExchangeType.SPOT
         except Exception as e:
             self.logger.debug(f"判断现货模式失败: {e}")
         return False
 
+    def notify_position_update(self, position_size: Decimal):
+        """
+        持仓更新通知（由WebSocket持仓回调和REST持仓监控调用）
+
+        Args:
+            position_size: 最新持仓数量
+        """
+        if position_size == 0:
+            self._balance_settled_event.set()
+
+    def _get_reset_manager(self):
+        """获取网格重置管理器（优先复用协调器的实例，否则延迟创建并缓存）"""
+        if self._reset_manager is None:
+            reset_manager = getattr(self.coordinator, 'reset_manager', None)
+            if reset_manager is None:
+                from .grid_reset_manager import GridResetManager
+                reset_manager = GridResetManager(
+                    self.coordinator, self.config, self.state,
+                    self.engine, self.tracker, self.strategy
+                )
+            self._reset_manager = reset_manager
+        return self._reset_manager
+
+    async def _tp_retry_backoff(self):
+        """挂止盈订单失败后的退避等待（指数退避 + 抖动，上限1秒）"""
+        symbol = self.config.symbol
+        failures = self._tp_failure_counts.get(symbol, 0)
+        self._tp_failure_counts[symbol] = failures + 1
+        delay = min(0.1 * 2 ** failures + random.uniform(0, 0.05), 1.0)
+        await asyncio.sleep(delay)
+
     def _get_reserve_amount(self) -> Decimal:
         """
         获取预留数量（仅现货模式）
@@ -83,7 +153,7 @@ class ScalpingOperations:
             预留BTC数量，如果不是现货模式或没有预留管理器则返回0
         """
         if not self._is_spot_mode():
-            return Decimal('0')
+            return _DEC_ZERO
 
         try:
             if hasattr(self.coordinator, 'reserve_manager') and self.coordinator.reserve_manager:
@@ -91,7 +161,7 @@ class ScalpingOperations:
         except Exception as e:
             self.logger.debug(f"获取预留数量失败: {e}")
 
-        return Decimal('0')
+        return _DEC_ZERO
 
     def update_last_directional_order(self, order_id: str, order_side: str):
         """
@@ -149,7 +219,28 @@ class ScalpingOperations:
         self.scalping_manager.activate()
 
         # 2. 取消所有卖单（带验证）- 做多网格
-        if not await self.order_ops.cancel_sell_orders_with_verification(max_attempts=3):
+        # 🔥 同时强制更新余额（两者互不依赖，并发执行以隐藏REST往返延迟）
+        # 原因：激活剥头皮时可能刚有订单成交，余额监控器的缓存数据可能过时
+        # 必须在计算止盈价格之前获取最新的USDC和BTC余额
+        self.logger.info("💰 激活剥头皮前强制更新余额（与取消卖单并发）...")
+        cancel_task = asyncio.create_task(
+            self.order_ops.cancel_sell_orders_with_verification(max_attempts=3))
+        balance_task = asyncio.create_task(
+            self.coordinator.balance_monitor.update_balance())
+        await asyncio.gather(cancel_task, balance_task, return_exceptions=True)
+
+        # 在 except 块中取回任务异常，由 logger.exception 附带堆栈
+        try:
+            balance_task.result()
+        except Exception as e:
+            self.logger.exception(f"❌ 更新余额失败: {e}")
+
+        try:
+            cancelled = cancel_task.result()
+        except Exception as e:
+            self.logger.exception(f"❌ 取消卖单异常: {e}")
+            cancelled = False
+        if not cancelled:
             self.logger.error("❌ 取消卖单失败，剥头皮激活中止")
             self.scalping_manager.deactivate()
             return
@@ -172,16 +263,10 @@ class ScalpingOperations:
 
         self.logger.info(
             f"📊 持仓（来源: position_monitor的REST数据）: "
-            f"{current_position} {self.config.symbol.split('_')[0]}, "
+            f"{current_position} {self.config.base_asset}, "
             f"平均成本: ${average_cost:,.2f}"
         )
 
-        # 🔥 强制更新余额（确保当前权益计算准确）
-        # 原因：激活剥头皮时可能刚有订单成交，余额监控器的缓存数据可能过时
-        # 必须在计算止盈价格之前获取最新的USDC和BTC余额
-        self.logger.info("💰 激活剥头皮前强制更新余额...")
-        await self.coordinator.balance_monitor.update_balance()
-
         initial_capital = self.scalping_manager.get_initial_capital()
         self.scalping_manager.update_position(
             current_position, average_cost, initial_capital,
@@ -194,12 +279,9 @@ class ScalpingOperations:
             # 不中止流程，继续运行
 
         # 5. 注册WebSocket持仓更新回调（事件驱动）
-        if not hasattr(self.engine.exchange, '_position_callbacks'):
-            self.engine.exchange._position_callbacks = []
-        if self.coordinator._on_position_update_from_ws not in self.engine.exchange._position_callbacks:
-            self.engine.exchange._position_callbacks.append(
-                self.coordinator._on_position_update_from_ws)
-            self.logger.info("✅ 已注册WebSocket持仓更新回调（事件驱动）")
+        self.engine.exchange._position_callbacks.add(
+            self.coordinator._on_position_update_from_ws)
+        self.logger.info("✅ 已注册WebSocket持仓更新回调（事件驱动）")
 
         # 🆕 增加剥头皮触发次数（仅标记）
         self.coordinator._scalping_trigger_count += 1
@@ -212,6 +294,10 @@ class ScalpingOperations:
         """退出剥头皮模式，恢复正常网格"""
         self.logger.info("🟢 正在退出剥头皮模式...")
 
+        # 丢弃尚未执行/正在执行的止盈订单更新
+        await self.cancel_take_profit_updates()
+        self._last_checked_position = None
+
         # 🛡️ 0. 检查全局状态（紧急停止时只停用管理器，不执行订单操作）
         if hasattr(self.coordinator, 'is_emergency_stopped') and self.coordinator.is_emergency_stopped:
             self.logger.error(
@@ -230,11 +316,9 @@ class ScalpingOperations:
             return
 
         # 1. 移除WebSocket持仓更新回调
-        if hasattr(self.engine.exchange, '_position_callbacks'):
-            if self.coordinator._on_position_update_from_ws in self.engine.exchange._position_callbacks:
-                self.engine.exchange._position_callbacks.remove(
-                    self.coordinator._on_position_update_from_ws)
-                self.logger.info("✅ 已移除WebSocket持仓更新回调")
+        self.engine.exchange._position_callbacks.discard(
+            self.coordinator._on_position_update_from_ws)
+        self.logger.info("✅ 已移除WebSocket持仓更新回调")
 
         # 2. 停用剥头皮管理器（先停用，避免干扰）
         self.scalping_manager.deactivate()
@@ -258,10 +342,8 @@ class ScalpingOperations:
                 # 批量挂单
                 placed_orders = await self.engine.place_batch_orders(initial_orders)
 
-                # 更新状态
-                for order in placed_orders:
-                    if order.order_id not in self.state.active_orders:
-                        self.state.add_order(order)
+                # 更新状态（批量写入，已存在的订单自动跳过）
+                self.state.add_orders_bulk(placed_orders)
 
                 self.logger.info(f"✅ 已恢复正常网格，挂出 {len(placed_orders)} 个订单")
 
@@ -295,8 +377,13 @@ class ScalpingOperations:
                 # 先不停止系统，等待REST恢复
                 return
 
-            # 等待一小段时间，让平仓完成并余额更新
-            await asyncio.sleep(2)
+            # 等待平仓完成并余额更新（持仓归零事件驱动，最多等待2秒）
+            self._balance_settled_event.clear()
+            if self.tracker.get_current_position() != 0:
+                try:
+                    await asyncio.wait_for(self._balance_settled_event.wait(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    pass
 
             # 根据网格类型决定后续行为
             if self.config.is_follow_mode():
@@ -304,11 +391,7 @@ class ScalpingOperations:
                 self.logger.info("🔄 跟随移动网格模式：准备重置并重启...")
 
                 # 使用reset_manager的通用重置工作流
-                from .grid_reset_manager import GridResetManager
-                reset_manager = GridResetManager(
-                    self.coordinator, self.config, self.state,
-                    self.engine, self.tracker, self.strategy
-                )
+                reset_manager = self._get_reset_manager()
 
                 # 重置（不需要再平仓，因为止盈订单已平仓）
                 await reset_manager._generic_reset_workflow(
@@ -318,35 +401,37 @@ class ScalpingOperations:
                     update_price_range=True  # 更新价格区间
                 )
 
-                # 重置完成后，获取最新余额作为新本金
+                # 重置完成后，立即开始获取最新余额（REST），与下面的本地簿记并发
+                balance_task = asyncio.create_task(
+                    self.coordinator.balance_monitor.update_balance())
+
+                # 🔥 清空频率限制计数器，允许下次剥头皮触发时重新挂止盈订单
+                self._last_directional_order_id = ""
+                self._same_directional_order_count = 0
+                if hasattr(self, '_last_checked_directional_order_id'):
+                    self._last_checked_directional_order_id = ""
+                self.logger.debug("🔄 已清空剥头皮操作频率限制计数器（重置后）")
+
+                # 获取最新余额作为新本金
                 try:
-                    await self.coordinator.balance_monitor.update_balance()
+                    await balance_task
                     new_capital = self.coordinator.balance_monitor.collateral_balance
                     self.logger.info(f"📊 重置后最新本金: ${new_capital:,.3f}")
 
                     # 重新初始化所有管理器的本金
-                    if self.coordinator.capital_protection_manager:
-                        self.coordinator.capital_protection_manager.initialize_capital(
-                            new_capital, is_reinit=True)
-                    if self.coordinator.take_profit_manager:
-                        self.coordinator.take_profit_manager.initialize_capital(
-                            new_capital, is_reinit=True)
-                    if self.scalping_manager:
-                        self.scalping_manager.initialize_capital(
-                            new_capital, is_reinit=True)
+                    for manager in (
+                        self.coordinator.capital_protection_manager,
+                        self.coordinator.take_profit_manager,
+                        self.scalping_manager,
+                    ):
+                        if manager:
+                            manager.initialize_capital(new_capital, is_reinit=True)
 
                     self.logger.info(f"💰 所有管理器本金已更新为最新余额: ${new_capital:,.3f}")
                 except Exception as e:
                     self.logger.error(f"⚠️ 获取最新余额失败: {e}")
 
                 self.logger.info("✅ 剥头皮重置完成，价格移动网格已重启")
-
-                # 🔥 清空频率限制计数器，允许下次剥头皮触发时重新挂止盈订单
-                self._last_directional_order_id = ""
-                self._same_directional_order_count = 0
-                if hasattr(self, '_last_checked_directional_order_id'):
-                    self._last_checked_directional_order_id = ""
-                self.logger.debug("🔄 已清空剥头皮操作频率限制计数器（重置后）")
             else:
                 # 普通/马丁网格：停止系统
                 self.logger.info("⏸️  普通/马丁网格模式：停止系统")
@@ -356,6 +441,7 @@ class ScalpingOperations:
             self.coordinator._resetting = False
             self.logger.info("🔓 系统锁定已释放")
 
+    @require_active_scalping
     async def place_take_profit_order_with_verification(
         self,
         max_attempts: int = 3,
@@ -374,8 +460,8 @@ class ScalpingOperations:
             True: 止盈订单已挂出
             False: 挂单失败
         """
-        if not self.scalping_manager or not self.scalping_manager.is_active():
-            return False
+        # 止盈订单将被替换，下次更新检查需重新比较
+        self._last_checked_position = None
 
         # 🛡️ 0. 检查全局状态（REST失败或持仓异常时跳过挂单）
         if hasattr(self.coordinator, 'is_emergency_stopped') and self.coordinator.is_emergency_stopped:
@@ -452,13 +538,14 @@ class ScalpingOperations:
                 self.coordinator.balance_monitor.collateral_balance
             )
 
-            # 3. 获取当前价格
+            # 3. 获取当前价格（优先使用新鲜的WebSocket缓存价格）
             try:
-                current_price = await self.engine.get_current_price()
+                current_price = (self.engine.get_cached_price(500)
+                                 or await self.engine.get_current_price())
             except Exception as e:
                 self.logger.error(f"获取当前价格失败: {e}")
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(0.5)
+                    await self._tp_retry_backoff()
                 continue
 
             # 4. 计算止盈订单
@@ -480,7 +567,7 @@ class ScalpingOperations:
                     f"!= tracker持仓{abs(tracker_position)}，重新尝试..."
                 )
                 if attempt < max_attempts - 1:
-                    await asyncio.sleep(0.5)
+                    await self._tp_retry_backoff()
                     continue
                 return False
 
@@ -494,6 +581,7 @@ class ScalpingOperations:
             )
 
             if placed_order:
+                self._tp_failure_counts.pop(self.config.symbol, None)
                 self.logger.info(
                     f"✅ 止盈订单已挂出: {placed_order.order_id} "
                     f"{placed_order.side.value} {placed_order.amount} @ ${placed_order.price}"
@@ -532,9 +620,7 @@ class ScalpingOperations:
 
                 # 2. 验证止盈订单是否还存在且数量正确
                 try:
-                    open_orders = await self.engine.exchange.get_open_orders(
-                        symbol=self.config.symbol
-                    )
+                    open_orders = await self.order_ops.get_open_orders_cached()
                     tp_order_found = False
                     tp_order_correct = False
 
@@ -592,6 +678,8 @@ class ScalpingOperations:
                 self.logger.warning(
                     f"⚠️ 止盈订单挂出失败，准备第{attempt+2}次尝试..."
                 )
+                if attempt < max_attempts - 1:
+                    await self._tp_retry_backoff()
 
         # 达到最大尝试次数，挂单仍失败
         self.logger.error(
@@ -599,9 +687,53 @@ class ScalpingOperations:
         )
         return False
 
+    @require_active_scalping
     async def update_take_profit_order_if_needed(self):
+        """
+        如果持仓变化，更新止盈订单（防抖）
+
+        连续成交时每次调用只顺延截止时间，窗口结束后按当时的持仓执行一次更新
+        """
+        self._tp_update_deadline = time.monotonic() + _TP_UPDATE_DEBOUNCE
+        if self._tp_update_pending and not self._tp_update_pending.done():
+            return
+        task = asyncio.create_task(self._debounced_tp_update())
+        self._tp_update_pending = task
+        self._tp_update_tasks.add(task)
+        task.add_done_callback(self._tp_update_tasks.discard)
+
+    async def cancel_take_profit_updates(self):
+        """取消所有止盈订单更新任务（包括正在执行的），并等待其结束"""
+        self._tp_update_pending = None
+        current = asyncio.current_task()
+        tasks = [task for task in self._tp_update_tasks if task is not current]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _debounced_tp_update(self):
+        """等待防抖窗口结束后执行止盈订单更新"""
+        try:
+            while True:
+                delay = self._tp_update_deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            # 开始执行后允许新的调用重新调度，执行本身串行化（任务仍由 _tp_update_tasks 引用）
+            if self._tp_update_pending is asyncio.current_task():
+                self._tp_update_pending = None
+            async with self._tp_update_lock:
+                await self._update_take_profit_order_now()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.exception(f"❌ 更新止盈订单失败: {e}")
+
+    async def _update_take_profit_order_now(self):
         """如果持仓变化，更新止盈订单（带验证）"""
-        if not self.scalping_manager or not self.scalping_manager.is_active():
+        if not self._scalping_active_event.is_set():
             self.logger.debug("⏭️ 跳过更新止盈订单: 剥头皮未激活")
             return
 
@@ -615,6 +747,9 @@ class ScalpingOperations:
             return
 
         current_position = self.tracker.get_current_position()
+        if current_position == self._last_checked_position:
+            return
+
         tp_order = self.scalping_manager.get_current_take_profit_order()
 
         self.logger.debug(
@@ -626,6 +761,7 @@ class ScalpingOperations:
         # 检查止盈订单是否需要更新
         if not self.scalping_manager.is_take_profit_order_outdated(current_position):
             self.logger.debug("✅ 止盈订单无需更新")
+            self._last_checked_position = current_position
             return
 
         self.logger.info("📋 持仓变化，需要更新止盈订单...")
@@ -633,48 +769,8 @@ class ScalpingOperations:
         # 1. 取消旧止盈订单（带验证）
         old_tp_order = self.scalping_manager.get_current_take_profit_order()
         if old_tp_order:
-            max_cancel_attempts = 3
-            cancel_success = False
-
-            for attempt in range(max_cancel_attempts):
-                try:
-                    await self.engine.cancel_order(old_tp_order.order_id)
-                    self.state.remove_order(old_tp_order.order_id)
-                    self.logger.info(f"✅ 已取消旧止盈订单: {old_tp_order.order_id}")
-
-                    # 等待取消完成
-                    await asyncio.sleep(0.3)
-
-                    # 验证订单已取消（从交易所查询）
-                    try:
-                        exchange_orders = await self.engine.exchange.get_open_orders(
-                            symbol=self.config.symbol
-                        )
-                        found = any(
-                            order.id == old_tp_order.order_id
-                            for order in exchange_orders
-                        )
-
-                        if not found:
-                            self.logger.info("✅ 验证通过: 旧止盈订单已取消")
-                            cancel_success = True
-                            break
-                        else:
-                            self.logger.warning(
-                                f"⚠️ 验证失败 (尝试{attempt+1}/{max_cancel_attempts}): "
-                                f"订单仍存在，重新取消..."
-                            )
-                    except Exception as e:
-                        self.logger.error(f"验证取消失败: {e}")
-
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "not found" in error_msg or "does not exist" in error_msg:
-                        self.logger.info("订单已不存在，视为取消成功")
-                        cancel_success = True
-                        break
-                    else:
-                        self.logger.error(f"取消旧止盈订单失败: {e}")
+            cancel_success = await self.order_ops.cancel_order(
+                old_tp_order.order_id, verify=True)
 
             if not cancel_success:
                 self.logger.error("❌ 取消旧止盈订单失败，中止更新")
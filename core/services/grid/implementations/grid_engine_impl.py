@@ -54,16 +54,118 @@ Lighter 作为链上交易所，订单有两种 ID：
 """
 
 import asyncio
+import logging
+import random
 import time
-from typing import List, Optional, Callable, Dict
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional, Callable, Dict, Tuple
 from decimal import Decimal
 from datetime import datetime
 
 from ....logging import get_logger
-from ....adapters.exchanges import ExchangeInterface, OrderSide as ExchangeOrderSide, OrderType
+from ....adapters.exchanges import (
+    ExchangeInterface, OrderData as ExchangeOrderData, OrderSide as ExchangeOrderSide,
+    OrderStatus, OrderType, PositionSnapshot
+)
 from ..interfaces.grid_engine import IGridEngine
 from ..models import GridConfig, GridOrder, GridOrderSide, GridOrderStatus
 
+# 网格订单方向 → 交易所订单方向
+_SIDE_TO_EXCHANGE = {
+    GridOrderSide.BUY: ExchangeOrderSide.BUY,
+    GridOrderSide.SELL: ExchangeOrderSide.SELL,
+}
+# 交易所订单方向 → 网格订单方向
+_SIDE_FROM_EXCHANGE = {v: k for k, v in _SIDE_TO_EXCHANGE.items()}
+# 视为已成交的交易所订单状态
+_FILLED_STATUSES = frozenset({OrderStatus.FILLED})
+
+# 常用 Decimal 常量（避免热路径上重复构造）
+_DEC_ZERO = Decimal(0)
+
+
+def _to_decimal(value, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    """将推送数据中的数值转换为 Decimal（已是 Decimal/int 时跳过字符串转换）"""
+    if value is None:
+        return default
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+class _LRUSet:
+    """
+    容量有限的集合（超出容量时淘汰最早加入的元素）
+
+    用于记录主动取消的订单ID：确认后的元素会被移除，
+    未收到确认的元素最终被淘汰（超出容量或超过存活时间），避免长时间运行时无限增长
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        # 值为加入时间（单调时钟），按加入顺序排列
+        self._items: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def add(self, key: Hashable):
+        self._items[key] = time.monotonic()
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def update(self, keys: Iterable[Hashable]):
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: Hashable):
+        self._items.pop(key, None)
+
+    def pop(self, key: Hashable) -> bool:
+        """移除元素，返回其移除前是否存在（一次查找完成判断与移除）"""
+        return self._items.pop(key, None) is not None
+
+    def prune(self, max_age: float) -> int:
+        """淘汰加入时间超过 max_age 秒的元素，返回淘汰数量"""
+        items = self._items
+        cutoff = time.monotonic() - max_age
+        pruned = 0
+        while items and next(iter(items.values())) < cutoff:
+            items.popitem(last=False)
+            pruned += 1
+        return pruned
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _TokenBucket:
+    """
+    令牌桶限速器（令牌按速率连续补充，容量为一秒的量）
+
+    令牌充足时立即放行，耗尽后按补充速度等待，用于按交易所频率限制发出请求
+    """
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._capacity = max(rate, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, tokens: float = 1.0):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+            await asyncio.sleep((tokens - self._tokens) / self._rate)
+
 
 class GridEngineImpl(IGridEngine):
     """
@@ -75,6 +177,19 @@ class GridEngineImpl(IGridEngine):
     - WebSocket订阅
     """
 
+    # 间隔/时效计算使用单调时钟（不受系统时间调整影响）
+    _now = staticmethod(time.monotonic)
+
+    # 主动取消记录的最长保留时间（秒），超时未确认的记录由健康检查循环清理
+    _EXPECTED_CANCEL_TTL = 3600.0
+
+    # 订单更新消费任务每轮最多连续处理的消息数
+    _ORDER_UPDATE_BATCH = 64
+    # 订单更新队列容量（积压超过容量时WebSocket回调等待入队，对接收端施加背压）
+    _ORDER_UPDATE_QUEUE_SIZE = 2048
+    # 被动取消后重新挂单（网格恢复）的最大并发数
+    _RECOVERY_CONCURRENCY = 8
+
     def __init__(self, exchange_adapter: ExchangeInterface):
         """
         初始化执行引擎
@@ -89,20 +204,77 @@ class GridEngineImpl(IGridEngine):
 
         # 订单回调
         self._order_callbacks: List[Callable] = []
+        # 按同步/异步拆分的回调快照（订阅时重建，分发时无需逐个判断）
+        self._sync_order_callbacks: tuple = ()
+        self._async_order_callbacks: tuple = ()
+        # WebSocket订单更新格式分派表（数据类型 -> 处理方法）
+        self._update_dispatch: Dict[type, Callable] = {
+            ExchangeOrderData: self._handle_exchange_order_data,
+            list: self._handle_order_list,
+            dict: self._handle_backpack_update,
+        }
+        # Backpack订单事件分派表（状态/事件类型 -> 处理方法）
+        self._backpack_event_handlers: Dict[str, Callable] = {
+            'Filled': self._handle_backpack_fill,
+            'orderFilled': self._handle_backpack_fill,
+            'Cancelled': self._handle_backpack_cancel,
+            'orderCancelled': self._handle_backpack_cancel,
+        }
+        # 订单终态回调（成交/取消），按订单ID通知，不要求订单在 _pending_orders 中
+        self._order_terminal_callbacks: List[Callable[[str, str], None]] = []
+
+        # 批量下单期间的订单终态跟踪（WebSocket推送代替REST查询检测立即成交）
+        # _batch_terminal_status: 批量窗口内收到的终态 order_id -> status（None表示未在批量窗口内）
+        # _order_futures: 批量下单的订单ID -> 终态Future
+        self._batch_terminal_status: Optional[Dict[str, str]] = None
+        self._order_futures: Dict[str, asyncio.Future] = {}
+        # _batch_acked_ids: 批量窗口内收到过WebSocket推送（挂单确认或终态）的ID
+        # _batch_unacked/_batch_ack_event: 等待确认期间尚未确认的订单ID，全部确认时触发事件
+        self._batch_acked_ids: set = set()
+        self._batch_unacked: Optional[set] = None
+        self._batch_ack_event: Optional[asyncio.Event] = None
+        # 以上批量窗口状态为单份共享，批量下单通过此锁串行执行（重叠时后者等待前者结束）
+        self._batch_lock = asyncio.Lock()
+        # 批量窗口内检测到的立即成交订单：释放批量锁后再通知回调
+        # （回调可能再次批量下单，asyncio.Lock 不可重入，持锁通知会死锁）
+        self._batch_deferred_fills: Optional[List[GridOrder]] = None
 
         # 订单追踪
         # order_id -> GridOrder
         self._pending_orders: Dict[str, GridOrder] = {}
-        self._expected_cancellations: set = set()  # 🔥 记录主动取消的订单ID（剥头皮模式、本金保护等）
+        # 反向索引（Lighter 同一订单可能有 client_id + order_index 两个键）
+        # id(order) -> 指向该订单的键列表 / 去重后的订单对象
+        self._order_key_index: Dict[int, List[str]] = {}
+        self._unique_orders: Dict[int, GridOrder] = {}
+        self._pending_buy_count = 0  # 去重后的买单数量（随 _unique_orders 增量维护）
+        self._expected_cancellations = _LRUSet(maxsize=10000)  # 🔥 记录主动取消的订单ID（剥头皮模式、本金保护等）
+        self._seen_event_fps = _LRUSet(maxsize=4096)  # WebSocket订单事件指纹（去重）
+        self._cancel_all_inflight = 0  # 进行中的批量取消请求数（期间新挂的订单也可能被撤销）
+        # WebSocket订单更新队列：回调只负责入队，由消费任务按批处理
+        self._order_update_queue: Optional[asyncio.Queue] = None
+        self._order_update_task: Optional[asyncio.Task] = None
+        # 上次收到WebSocket消息的时间（单调时钟纳秒整数，消息路径上只做整数赋值）
+        self._ws_last_msg_ns = time.monotonic_ns()
+        self._ws_msg_count = 0  # 收到的WebSocket订单消息数
+        self._order_update_backpressure = 0  # 队列已满、WebSocket回调等待入队的次数
+        # 被动取消后的网格恢复任务（后台执行，不阻塞订单更新处理）
+        self._recovery_tasks: set = set()
+        self._recovery_sem: Optional[asyncio.Semaphore] = None
+        # WebSocket成交的回调分发队列与任务：不阻塞后续订单更新的处理，
+        # 同时保持回调按成交到达顺序逐个执行（反向挂单需串行提交，如 Lighter nonce）
+        self._fill_dispatch_queue: Optional[asyncio.Queue] = None
+        self._fill_dispatch_task: Optional[asyncio.Task] = None
 
         # 🔥 价格监控
-        self._current_price: Optional[Decimal] = None
-        self._last_price_update_time: float = 0
+        # (最新价格, 更新时间)：整体赋值，读取方一次取得一致的价格与时间
+        self._price_state: Tuple[Optional[Decimal], float] = (None, 0.0)
+        self._ticker_inflight: Optional[asyncio.Future] = None  # 进行中的REST行情请求
         self._price_ws_enabled = False  # WebSocket价格订阅是否启用
 
         # 🔥 订单健康检查
         self._expected_total_orders: int = 0  # 预期的总订单数（初始化时设定）
         self._health_check_task = None
+        self._polling_task: Optional[asyncio.Task] = None  # 智能监控任务（长期运行，内部切换WebSocket/REST模式）
         self._last_health_check_time: float = 0
         self._last_health_repair_count: int = 0  # 最后一次健康检查补充的订单数
         self._last_health_repair_time: float = 0  # 最后一次补充订单的时间
@@ -128,34 +300,48 @@ class GridEngineImpl(IGridEngine):
             config: 网格配置
         """
         self.config = config
+        self._exchange_id = str(config.exchange).lower() if config.exchange else ''
+
+        # 批量下单并发上限（同时在途的下单请求数）
+        self._place_sem = asyncio.Semaphore(config.place_concurrency or 20)
+        # 批量下单请求速率限制（None表示不限速）
+        self._place_rate = (_TokenBucket(config.place_rate_limit)
+                            if config.place_rate_limit > 0 else None)
 
         # 确保交易所连接
         if not self.exchange.is_connected():
             await self.exchange.connect()
             self.logger.info(f"连接到交易所: {config.exchange}")
 
+        # 监控循环用到的交易所特性（连接后固定不变，只探测一次）
+        self._is_lighter = self._exchange_id == 'lighter'
+        self._has_ws_connected_attr = hasattr(self.exchange, '_ws_connected')
+        self._has_heartbeat_attr = hasattr(self.exchange, '_last_heartbeat')
+
         # 订阅用户数据流（接收订单更新）- 优先使用WebSocket
         self._ws_monitoring_enabled = False
-        self._polling_task = None
         self._last_ws_check_time = 0  # 上次检查WebSocket的时间
         self._ws_check_interval = 30  # WebSocket检查间隔（秒）
-        self._last_ws_message_time = time.time()  # 上次收到WebSocket消息的时间
         # 🔥 WebSocket 心跳超时阈值（秒）- 仅用于 Backpack/Hyperliquid
         # Lighter 不使用心跳超时检测，只依赖连接状态检测
         # Backpack/Hyperliquid 会在每次消息时更新心跳，可以用此阈值检测异常
         self._ws_timeout_threshold = 600  # 10分钟超时阈值
+        # REST轮询间隔：失败时指数退避，无挂单时使用最大间隔
+        self._poll_interval_min = config.rest_poll_interval or 3.0
+        self._poll_interval_max = 30.0
+        self._poll_interval = self._poll_interval_min
+
+        self._start_order_update_consumer()
+        self._recovery_sem = asyncio.Semaphore(self._RECOVERY_CONCURRENCY)
 
         try:
             self.logger.info("🔄 正在订阅WebSocket用户数据流...")
-            await self.exchange.subscribe_user_data(self._on_order_update)
+            await self.exchange.subscribe_user_data(self._enqueue_order_update)
             self._ws_monitoring_enabled = True
             self.logger.info("✅ 订单更新流订阅成功 (WebSocket)")
             self.logger.info("📡 使用WebSocket实时监控订单成交")
         except Exception as e:
-            self.logger.error(f"❌ 订单更新流订阅失败: {e}")
-            self.logger.error(f"❌ 错误类型: {type(e).__name__}")
-            import traceback
-            self.logger.error(f"❌ 错误堆栈:\n{traceback.format_exc()}")
+            self.logger.exception(f"❌ 订单更新流订阅失败: {e}")
             self.logger.warning("⚠️ WebSocket暂时不可用，启用REST轮询作为临时备用")
 
         # 🔥 启动智能订单监控：WebSocket优先，REST备用
@@ -201,7 +387,7 @@ class GridEngineImpl(IGridEngine):
         """
         try:
             # 转换订单方向
-            exchange_side = self._convert_order_side(order.side)
+            exchange_side = _SIDE_TO_EXCHANGE[order.side]
 
             # 使用交易所适配器下单（纯限价单）
             # 注意：不能在 params 中传递 Backpack API 不支持的参数（如 grid_id），
@@ -216,35 +402,63 @@ class GridEngineImpl(IGridEngine):
                 batch_mode=batch_mode  # 🔥 传递批量模式标志（仅Lighter使用）
             )
 
-            # 更新订单ID
-            order.order_id = exchange_order.id or exchange_order.order_id
-            order.status = GridOrderStatus.PENDING
+            return self._track_placed_order(order, exchange_order)
 
-            # 如果订单ID为临时ID（"pending"），尝试从符号查询获取实际ID
-            if order.order_id == "pending" or not order.order_id:
-                # Backpack API 有时只返回状态，需要查询获取实际订单ID
-                # 暂时使用价格+数量作为唯一标识
-                temp_id = f"grid_{order.grid_id}_{int(order.price)}_{int(order.amount*1000000)}"
-                order.order_id = temp_id
-                self.logger.warning(
-                    f"订单ID为临时值，使用组合ID: {temp_id} "
-                    f"(Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price})"
-                )
+        except Exception as e:
+            self.logger.error(f"下单失败: {e}")
+            order.mark_failed()
+            raise
 
-            # 添加到追踪列表
-            self._pending_orders[order.order_id] = order
+    def _exchange_order_spec(self, order: GridOrder) -> dict:
+        """网格订单 → create_order 关键字参数（纯限价单，不含symbol）"""
+        return {
+            'side': _SIDE_TO_EXCHANGE[order.side],
+            'order_type': OrderType.LIMIT,
+            'amount': order.amount,
+            'price': order.price,
+            'params': None
+        }
 
-            self.logger.info(
-                f"下单成功: {order.side.value} {order.amount}@{order.price} "
-                f"(Grid {order.grid_id}, OrderID: {order.order_id})"
+    def _track_placed_order(self, order: GridOrder, exchange_order) -> GridOrder:
+        """
+        记录交易所返回的订单ID并加入追踪列表
+
+        Args:
+            order: 网格订单
+            exchange_order: 交易所返回的订单数据
+
+        Returns:
+            更新后的订单
+        """
+        # 更新订单ID
+        order.order_id = exchange_order.id or exchange_order.order_id
+        order.status = GridOrderStatus.PENDING
+
+        # 如果订单ID为临时ID（"pending"），尝试从符号查询获取实际ID
+        if order.order_id == "pending" or not order.order_id:
+            # Backpack API 有时只返回状态，需要查询获取实际订单ID
+            # 暂时使用价格+数量作为唯一标识
+            temp_id = f"grid_{order.grid_id}_{order.price}_{order.amount}"
+            order.order_id = temp_id
+            self.logger.warning(
+                f"订单ID为临时值，使用组合ID: {temp_id} "
+                f"(Grid {order.grid_id}, {order.side.value} {order.amount}@{order.price})"
             )
 
-            return order
+        # 添加到追踪列表
+        self._add_pending_key(order.order_id, order)
+        if self._cancel_all_inflight:
+            # 批量取消进行中：若该订单被一并撤销，属于主动取消，不应重新挂单
+            self._expected_cancellations.add(order.order_id)
+        if self._batch_terminal_status is not None:
+            self._register_order_future(order.order_id)
 
-        except Exception as e:
-            self.logger.error(f"下单失败: {e}")
-            order.mark_failed()
-            raise
+        self.logger.info(
+            "下单成功: %s %s@%s (Grid %s, OrderID: %s)",
+            order.side.value, order.amount, order.price, order.grid_id, order.order_id
+        )
+
+        return order
 
     async def place_market_order(self, side: GridOrderSide, amount: Decimal) -> None:
         """
@@ -256,9 +470,9 @@ class GridEngineImpl(IGridEngine):
         """
         try:
             # 转换订单方向
-            exchange_side = self._convert_order_side(side)
+            exchange_side = _SIDE_TO_EXCHANGE[side]
 
-            self.logger.info(f"📊 下市价单: {side.value} {amount}")
+            self.logger.info("📊 下市价单: %s %s", side.value, amount)
 
             # 使用交易所适配器下市价单
             exchange_order = await self.exchange.create_order(
@@ -271,8 +485,8 @@ class GridEngineImpl(IGridEngine):
             )
 
             self.logger.info(
-                f"✅ 市价单成功: {side.value} {amount}, "
-                f"OrderID: {exchange_order.id or exchange_order.order_id}"
+                "✅ 市价单成功: %s %s, OrderID: %s",
+                side.value, amount, exchange_order.id or exchange_order.order_id
             )
 
         except Exception as e:
@@ -293,60 +507,45 @@ class GridEngineImpl(IGridEngine):
         total_orders = len(orders)
         self.logger.info(f"开始批量下单: {total_orders}个订单")
 
-        # 分批下单，避免一次性并发过多（每批50个）
-        batch_size = 50
+        deferred_fills: List[GridOrder] = []
+        try:
+            async with self._batch_lock:
+                # 开启批量窗口：记录终态推送，用于检测立即成交的订单
+                self._batch_terminal_status = {}
+                self._order_futures = {}
+                self._batch_acked_ids = set()
+                self._batch_deferred_fills = deferred_fills
+                try:
+                    return await self._place_batch_orders(orders, max_retries)
+                finally:
+                    self._batch_terminal_status = None
+                    self._order_futures = {}
+                    self._batch_acked_ids = set()
+                    self._batch_deferred_fills = None
+        finally:
+            # 批量窗口已关闭、锁已释放，按检测顺序通知立即成交订单的回调
+            for order in deferred_fills:
+                await self._dispatch_order_callbacks(order)
+
+    async def _place_batch_orders(self, orders: List[GridOrder], max_retries: int) -> List[GridOrder]:
+        """批量下单（place_batch_orders 的实现，在批量窗口内执行）"""
+        total_orders = len(orders)
         successful_orders = []
         failed_orders = []  # 记录失败的订单
 
-        for i in range(0, total_orders, batch_size):
-            batch = orders[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total_orders + batch_size - 1) // batch_size
-
-            self.logger.info(
-                f"处理第{batch_num}/{total_batches}批订单 "
-                f"({len(batch)}个订单)"
-            )
+        results = await self._place_orders_concurrently(orders)
 
-            # 🔥 Lighter交易所特殊处理：串行下单（避免nonce冲突）
-            # 其他交易所：并发下单（保持原有性能）
-            exchange_id = str(self.config.exchange).lower(
-            ) if self.config.exchange else ''
-            if exchange_id == 'lighter':
-                self.logger.info("🔥 Lighter交易所：使用串行批量下单模式（避免nonce冲突）")
-                results = []
-                for order in batch:
-                    try:
-                        # 🔥 批量下单时使用 batch_mode=True，不立即查询 order_index
-                        result = await self.place_order(order, batch_mode=True)
-                        results.append(result)
-                    except Exception as e:
-                        results.append(e)
-                        self.logger.error(f"订单下单异常: {e}")
+        for idx, result in enumerate(results):
+            if isinstance(result, GridOrder):
+                successful_orders.append(result)
             else:
-                # 并发下单当前批次（其他交易所）
-                tasks = [self.place_order(order) for order in batch]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 统计当前批次结果
-            batch_success = 0
-            for idx, result in enumerate(results):
-                if isinstance(result, GridOrder):
-                    successful_orders.append(result)
-                    batch_success += 1
-                else:
-                    # 记录失败的订单
-                    failed_orders.append((batch[idx], str(result)))
-                    self.logger.error(f"订单下单失败: {result}")
-
-            self.logger.info(
-                f"第{batch_num}批完成: 成功{batch_success}/{len(batch)}个，"
-                f"总进度: {len(successful_orders)}/{total_orders}"
-            )
+                # 记录失败的订单
+                failed_orders.append((orders[idx], str(result)))
+                self.logger.error(f"订单下单失败: {result}")
 
-            # 短暂延迟，避免触发交易所限频
-            if i + batch_size < total_orders:
-                await asyncio.sleep(0.5)
+        self.logger.info(
+            f"首轮下单完成: 成功{len(successful_orders)}/{total_orders}个"
+        )
 
         # ✅ 重试失败的订单
         if failed_orders and max_retries > 0:
@@ -368,23 +567,7 @@ class GridEngineImpl(IGridEngine):
                 retry_orders = [order for order, _ in failed_orders]
                 failed_orders = []  # 清空失败列表
 
-                # 🔥 Lighter交易所：串行重试（避免nonce冲突）
-                # 其他交易所：并发重试
-                exchange_id = str(self.config.exchange).lower(
-                ) if self.config.exchange else ''
-                if exchange_id == 'lighter':
-                    results = []
-                    for order in retry_orders:
-                        try:
-                            # 🔥 重试也使用批量模式
-                            result = await self.place_order(order, batch_mode=True)
-                            results.append(result)
-                        except Exception as e:
-                            results.append(e)
-                else:
-                    # 重试失败的订单（并发）
-                    tasks = [self.place_order(order) for order in retry_orders]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                results = await self._place_orders_concurrently(retry_orders)
 
                 retry_success = 0
                 for idx, result in enumerate(results):
@@ -428,14 +611,101 @@ class GridEngineImpl(IGridEngine):
                 f"({success_rate:.1f}%)"
             )
 
-        # 🔥 批量下单完成后，主动查询一次所有订单状态
-        # 目的：检测那些在提交时立即成交的订单
+        # 🔥 批量下单完成后，检测那些在提交时立即成交的订单
+        # WebSocket可用时等待终态推送；否则主动查询一次所有订单状态
+        # Lighter 需要建立 client_id → order_index 映射：优先等待WebSocket挂单确认，超时再走REST查询
         self.logger.info("🔍 正在同步订单状态，检测立即成交的订单...")
-        await asyncio.sleep(3)  # 等待3秒，让交易所处理完所有订单并更新状态
-        await self._sync_order_status_after_batch()
+        if self._ws_monitoring_enabled and not self._is_lighter:
+            await self._sync_order_status_from_ws()
+            return successful_orders
+
+        wait_start = self._now()
+        if self._ws_monitoring_enabled and await self._wait_for_batch_acks(timeout=2.0):
+            # Lighter：所有订单都已收到WebSocket推送（挂单确认已建立 order_index 映射），
+            # 无需等待REST查询，只补处理推送早于登记到达的成交
+            await self._sync_order_status_from_ws(timeout=0)
+        else:
+            # 等待3秒，让交易所处理完所有订单并更新状态
+            # （REST查询中不存在的订单会被判定为成交，不能缩短到交易所可见之前）
+            await asyncio.sleep(max(0.0, 3 - (self._now() - wait_start)))
+            await self._sync_order_status_after_batch()
 
         return successful_orders
 
+    async def _place_orders_concurrently(self, orders: List[GridOrder]) -> list:
+        """
+        提交一组订单
+
+        - Lighter：串行下单（避免nonce冲突）
+        - 支持批量下单接口的交易所：每个请求提交一批订单
+        - 其他交易所：信号量限制同时在途的请求数，持续提交（无批次间等待）
+
+        Returns:
+            与orders一一对应的结果列表（GridOrder或异常）
+        """
+        if self._is_lighter:
+            # 签名与发送不能拆开并发：SDK 在同一API key的nonce锁内完成签名+发送，
+            # 以保证交易按nonce顺序到达排序器；client_order_id 也按毫秒时间生成，
+            # 并发签名会产生重复ID。因此逐个提交（每单一次RTT）。
+            self.logger.info("🔥 Lighter交易所：使用串行批量下单模式（避免nonce冲突）")
+            results = []
+            for order in orders:
+                try:
+                    # 🔥 批量下单时使用 batch_mode=True，不立即查询 order_index
+                    result = await self.place_order(order, batch_mode=True)
+                    results.append(result)
+                except Exception as e:
+                    results.append(e)
+                    self.logger.error(f"订单下单异常: {e}")
+            return results
+
+        if getattr(self.exchange, 'supports_batch_orders', False):
+            return await self._place_orders_in_batches(orders)
+
+        async def place_with_limit(order: GridOrder) -> GridOrder:
+            async with self._place_sem:
+                if self._place_rate is not None:
+                    await self._place_rate.acquire()
+                return await self.place_order(order)
+
+        return await asyncio.gather(
+            *[place_with_limit(order) for order in orders], return_exceptions=True)
+
+    async def _place_orders_in_batches(self, orders: List[GridOrder]) -> list:
+        """
+        通过交易所批量下单接口提交订单（每个请求最多 max_batch_orders 个）
+
+        Returns:
+            与orders一一对应的结果列表（GridOrder或异常）
+        """
+        batch_size = getattr(self.exchange, 'max_batch_orders', 20)
+        results: list = [None] * len(orders)
+
+        async def submit(start: int):
+            chunk = orders[start:start + batch_size]
+            async with self._place_sem:
+                if self._place_rate is not None:
+                    await self._place_rate.acquire()
+                try:
+                    exchange_orders = await self.exchange.create_orders_batch(
+                        self.config.symbol,
+                        [self._exchange_order_spec(order) for order in chunk]
+                    )
+                except Exception as e:
+                    self.logger.error(f"批量下单请求失败: {e}")
+                    exchange_orders = [e] * len(chunk)
+
+            # 每批返回后立即加入追踪，尽早匹配WebSocket推送
+            for offset, (order, result) in enumerate(zip(chunk, exchange_orders)):
+                if isinstance(result, Exception):
+                    order.mark_failed()
+                    results[start + offset] = result
+                else:
+                    results[start + offset] = self._track_placed_order(order, result)
+
+        await asyncio.gather(*(submit(start) for start in range(0, len(orders), batch_size)))
+        return results
+
     def _remove_order_from_pending(self, order_id: str) -> int:
         """
         从 _pending_orders 中移除订单（支持双键删除）
@@ -451,25 +721,59 @@ class GridEngineImpl(IGridEngine):
         Returns:
             删除的键数量（0表示订单不存在，1-2表示删除的键数量）
         """
-        if order_id not in self._pending_orders:
+        order_obj = self._pending_orders.get(order_id)
+        if order_obj is None:
             return 0
 
-        # 获取订单对象
-        order_obj = self._pending_orders[order_id]
+        # 通过反向索引找到所有指向同一订单对象的键
         order_obj_id = id(order_obj)
-
-        # 找到所有指向同一订单对象的键
-        keys_to_remove = [
-            key for key, order in self._pending_orders.items()
-            if id(order) == order_obj_id
-        ]
+        keys_to_remove = self._order_key_index.pop(order_obj_id, [order_id])
+        self._untrack_unique_order(order_obj_id)
 
         # 删除所有找到的键
         for key in keys_to_remove:
-            del self._pending_orders[key]
+            self._pending_orders.pop(key, None)
 
         return len(keys_to_remove)
 
+    def _add_pending_key(self, key: str, order: GridOrder):
+        """将订单以指定键加入 _pending_orders（同步维护反向索引）"""
+        existing = self._pending_orders.get(key)
+        if existing is not None and existing is not order:
+            self._drop_pending_key(key)
+
+        self._pending_orders[key] = order
+        order_obj_id = id(order)
+        keys = self._order_key_index.setdefault(order_obj_id, [])
+        if key not in keys:
+            keys.append(key)
+        if order_obj_id not in self._unique_orders:
+            self._unique_orders[order_obj_id] = order
+            if order.side is GridOrderSide.BUY:
+                self._pending_buy_count += 1
+
+    def _drop_pending_key(self, key: str) -> Optional[GridOrder]:
+        """从 _pending_orders 删除单个键（同步维护反向索引，订单其他键保留）"""
+        order = self._pending_orders.pop(key, None)
+        if order is None:
+            return None
+
+        order_obj_id = id(order)
+        keys = self._order_key_index.get(order_obj_id)
+        if keys is not None:
+            if key in keys:
+                keys.remove(key)
+            if not keys:
+                del self._order_key_index[order_obj_id]
+                self._untrack_unique_order(order_obj_id)
+        return order
+
+    def _untrack_unique_order(self, order_obj_id: int):
+        """从去重订单表移除订单（同步维护买单计数）"""
+        order = self._unique_orders.pop(order_obj_id, None)
+        if order is not None and order.side is GridOrderSide.BUY:
+            self._pending_buy_count -= 1
+
     async def cancel_order(self, order_id: str) -> bool:
         """
         取消订单（主动取消，不会重新挂单）
@@ -488,8 +792,8 @@ class GridEngineImpl(IGridEngine):
             await self.exchange.cancel_order(order_id, self.config.symbol)
 
             # 标记为已取消并从追踪列表移除（自动处理 Lighter 双键）
-            if order_id in self._pending_orders:
-                order = self._pending_orders[order_id]
+            order = self._pending_orders.get(order_id)
+            if order is not None:
                 order.mark_cancelled()
                 self._remove_order_from_pending(order_id)
 
@@ -500,6 +804,47 @@ class GridEngineImpl(IGridEngine):
             self.logger.error(f"取消订单失败 {order_id}: {e}")
             return False
 
+    async def cancel_orders(self, order_ids: List[str]) -> int:
+        """
+        批量取消指定订单（主动取消，不会重新挂单）
+
+        交易所适配器提供 batch_cancel_orders 时一次请求取消全部订单，
+        否则并发调用 cancel_order。
+
+        Args:
+            order_ids: 订单ID列表
+
+        Returns:
+            成功取消的订单数量
+        """
+        if not order_ids:
+            return 0
+
+        batch_cancel = getattr(self.exchange, 'batch_cancel_orders', None)
+        if batch_cancel is None:
+            results = await asyncio.gather(
+                *[self.cancel_order(order_id) for order_id in order_ids])
+            return sum(1 for ok in results if ok)
+
+        try:
+            # 在调用取消前先记录，避免WebSocket事件先到达
+            self._expected_cancellations.update(order_ids)
+
+            await batch_cancel(order_ids, self.config.symbol)
+
+            for order_id in order_ids:
+                cancelled_order = self._pending_orders.get(order_id)
+                if cancelled_order is not None:
+                    cancelled_order.mark_cancelled()
+                    self._remove_order_from_pending(order_id)
+
+            self.logger.info(f"✅ 主动批量取消订单成功: {len(order_ids)}个")
+            return len(order_ids)
+
+        except Exception as e:
+            self.logger.error(f"批量取消订单失败 {order_ids}: {e}")
+            return 0
+
     async def cancel_all_orders(self) -> int:
         """
         取消所有订单（主动批量取消，不会重新挂单）
@@ -515,19 +860,26 @@ class GridEngineImpl(IGridEngine):
 
             # 🔥 关键修复：记录所有待取消的订单ID
             # 在调用取消前先记录，避免WebSocket事件先到达
-            pending_order_ids = list(self._pending_orders.keys())
-            for order_id in pending_order_ids:
-                self._expected_cancellations.add(order_id)
+            self._expected_cancellations.update(self._pending_orders)
+            tracked_orders = list(self._unique_orders.items())
 
-            cancelled_orders = await self.exchange.cancel_all_orders(self.config.symbol)
+            # 请求期间新登记的订单同样可能被交易所撤销，由 _track_placed_order 一并记录
+            self._cancel_all_inflight += 1
+            try:
+                cancelled_orders = await self.exchange.cancel_all_orders(self.config.symbol)
+            finally:
+                self._cancel_all_inflight -= 1
             count = len(cancelled_orders)
 
-            # 清空追踪列表
-            for order_id in pending_order_ids:
-                if order_id in self._pending_orders:
-                    order = self._pending_orders[order_id]
-                    order.mark_cancelled()
-                    del self._pending_orders[order_id]
+            # 清空追踪列表（按订单对象单次遍历；等待期间已被移除/新加入的订单不受影响）
+            for order_obj_id, order in tracked_orders:
+                keys = self._order_key_index.pop(order_obj_id, None)
+                if keys is None:
+                    continue
+                order.mark_cancelled()
+                self._untrack_unique_order(order_obj_id)
+                for key in keys:
+                    self._pending_orders.pop(key, None)
 
             self.logger.info(f"✅ 主动批量取消所有订单: {count}个")
             return count
@@ -551,11 +903,10 @@ class GridEngineImpl(IGridEngine):
             exchange_order = await self.exchange.get_order(order_id, self.config.symbol)
 
             # 更新本地订单信息
-            if order_id in self._pending_orders:
-                grid_order = self._pending_orders[order_id]
-
+            grid_order = self._pending_orders.get(order_id)
+            if grid_order is not None:
                 # 如果已成交
-                if exchange_order.status.value == "filled":
+                if exchange_order.status in _FILLED_STATUSES:
                     grid_order.mark_filled(
                         filled_price=exchange_order.price,
                         filled_amount=exchange_order.filled
@@ -569,6 +920,13 @@ class GridEngineImpl(IGridEngine):
             self.logger.error(f"查询订单状态失败 {order_id}: {e}")
             return None
 
+    def _on_ticker_done(self, task: asyncio.Future):
+        """REST行情请求结束（无论成功失败）后清除进行中标记"""
+        if self._ticker_inflight is task:
+            self._ticker_inflight = None
+        if not task.cancelled():
+            task.exception()  # 标记异常已读取（等待者均被取消时避免告警）
+
     async def get_current_price(self) -> Decimal:
         """
         获取当前市场价格
@@ -580,20 +938,29 @@ class GridEngineImpl(IGridEngine):
         """
         try:
             # 🔥 优先使用WebSocket缓存的价格
-            if self._current_price is not None:
-                price_age = time.time() - self._last_price_update_time
+            cached_price, updated_at = self._price_state
+            if cached_price is not None:
+                price_age = self._now() - updated_at
                 # 如果价格在5秒内更新过，直接返回缓存
                 if price_age < 5:
-                    return self._current_price
+                    return cached_price
 
             # 🔥 WebSocket价格过期或不可用，使用REST API
-            ticker = await self.exchange.get_ticker(self.config.symbol)
+            # 并发调用共享同一个进行中的请求（single-flight）
+            ticker_task = self._ticker_inflight
+            if ticker_task is None:
+                ticker_task = asyncio.ensure_future(
+                    self.exchange.get_ticker(self.config.symbol))
+                ticker_task.add_done_callback(self._on_ticker_done)
+                self._ticker_inflight = ticker_task
+            # shield：单个调用方被取消时不影响其他等待者
+            ticker = await asyncio.shield(ticker_task)
 
             # 优先使用last，其次bid/ask均价
             if ticker.last is not None:
                 price = ticker.last
             elif ticker.bid is not None and ticker.ask is not None:
-                price = (ticker.bid + ticker.ask) / Decimal('2')
+                price = (ticker.bid + ticker.ask) / 2
             elif ticker.bid is not None:
                 price = ticker.bid
             elif ticker.ask is not None:
@@ -602,20 +969,37 @@ class GridEngineImpl(IGridEngine):
                 raise ValueError("Ticker数据不包含有效价格信息")
 
             # 更新缓存
-            self._current_price = price
-            self._last_price_update_time = time.time()
+            self._price_state = (price, self._now())
 
             return price
 
         except Exception as e:
             self.logger.error(f"获取当前价格失败: {e}")
             # 如果有缓存价格，即使过期也返回
-            if self._current_price is not None:
+            cached_price, updated_at = self._price_state
+            if cached_price is not None:
                 self.logger.warning(
-                    f"使用缓存价格（{time.time() - self._last_price_update_time:.0f}秒前）")
-                return self._current_price
+                    f"使用缓存价格（{self._now() - updated_at:.0f}秒前）")
+                return cached_price
             raise
 
+    def get_cached_price(self, max_age_ms: int = 500) -> Optional[Decimal]:
+        """
+        获取WebSocket推送的缓存价格（不发起网络请求）
+
+        Args:
+            max_age_ms: 允许的最大缓存时长（毫秒）
+
+        Returns:
+            缓存价格；无缓存或已过期时返回None
+        """
+        cached_price, updated_at = self._price_state
+        if cached_price is None:
+            return None
+        if (self._now() - updated_at) * 1000 > max_age_ms:
+            return None
+        return cached_price
+
     def get_pending_orders(self) -> List[GridOrder]:
         """
         获取当前所有挂单列表
@@ -623,22 +1007,22 @@ class GridEngineImpl(IGridEngine):
         🔥 批量模式说明（2025-11）：
         - 批量下单时，订单会暂时有两个键：client_id + order_index
         - 需要去重，避免统计重复
-        - 使用对象ID (id(order)) 进行去重
+        - 由反向索引按对象ID (id(order)) 维护去重结果
 
         Returns:
             挂单列表（去重后）
         """
-        # 使用对象ID去重，避免同一订单被计数两次
-        seen_objects = set()
-        unique_orders = []
+        return list(self._unique_orders.values())
 
-        for order in self._pending_orders.values():
-            order_obj_id = id(order)
-            if order_obj_id not in seen_objects:
-                seen_objects.add(order_obj_id)
-                unique_orders.append(order)
+    def get_pending_order_counts(self) -> Tuple[int, int]:
+        """
+        获取当前挂单的买/卖数量（去重后，O(1)，无需构造订单列表）
 
-        return unique_orders
+        Returns:
+            (买单数量, 卖单数量)
+        """
+        buy_count = self._pending_buy_count
+        return buy_count, len(self._unique_orders) - buy_count
 
     def subscribe_order_updates(self, callback: Callable):
         """
@@ -648,7 +1032,175 @@ class GridEngineImpl(IGridEngine):
             callback: 回调函数，接收订单更新
         """
         self._order_callbacks.append(callback)
-        self.logger.debug(f"添加订单更新回调: {callback}")
+        # 注册时分类一次，分发时不再逐个判断
+        if asyncio.iscoroutinefunction(callback):
+            self._async_order_callbacks += (callback,)
+        else:
+            self._sync_order_callbacks += (callback,)
+        self.logger.debug("添加订单更新回调: %s", callback)
+
+    async def _dispatch_order_callbacks(self, order: GridOrder):
+        """通知所有订单更新回调（同步回调依次执行，异步回调并发执行）"""
+        for callback in self._sync_order_callbacks:
+            try:
+                callback(order)
+            except Exception as e:
+                self.logger.exception(f"订单回调执行失败: {e}")
+
+        if self._async_order_callbacks:
+            results = await asyncio.gather(
+                *(callback(order) for callback in self._async_order_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        f"订单回调执行失败: {result}", exc_info=result)
+
+    async def _finalize_fill(self, order: GridOrder, filled_price: Decimal,
+                             filled_amount: Decimal, key: Optional[str] = None,
+                             background: bool = False):
+        """
+        成交收尾：标记成交 → 移除挂单 → 通知回调
+
+        Args:
+            order: 成交的网格订单
+            filled_price: 成交价格
+            filled_amount: 成交数量
+            key: 挂单字典中的匹配键；为 None 表示调用方已提前移除
+            background: 是否交给成交回调分发任务按顺序通知（订单更新消费任务使用：
+                回调可能等待后续的WebSocket推送，如撤单确认，不能阻塞消费任务）
+
+        批量窗口内的同步调用只记录订单，由 place_batch_orders 在释放批量锁后通知回调
+        """
+        order.mark_filled(filled_price, filled_amount)
+        if key is not None:
+            self._remove_order_from_pending(key)
+        if not background and self._batch_deferred_fills is not None:
+            self._batch_deferred_fills.append(order)
+        elif background:
+            self._fill_dispatch_queue.put_nowait(order)
+        else:
+            await self._dispatch_order_callbacks(order)
+
+    def subscribe_order_terminal_updates(self, callback: Callable[[str, str], None]):
+        """
+        订阅订单终态更新（WebSocket推送的成交/取消事件）
+
+        与 subscribe_order_updates 不同，这里对所有订单ID都会通知
+        （包括已从 _pending_orders 移除的主动取消订单），用于撤单确认等场景。
+
+        Args:
+            callback: 同步回调函数，参数为 (order_id, status)，status 为 'FILLED' 或 'CANCELLED'
+        """
+        if callback not in self._order_terminal_callbacks:
+            self._order_terminal_callbacks.append(callback)
+
+    def _notify_order_terminal(self, status: str, *order_ids):
+        """通知订单终态回调（批量下单期间同时完成对应的订单Future）"""
+        batch_status = self._batch_terminal_status
+        for order_id in order_ids:
+            if not order_id:
+                continue
+            order_id = str(order_id)
+
+            if batch_status is not None:
+                batch_status[order_id] = status
+                future = self._order_futures.get(order_id)
+                if future is not None and not future.done():
+                    future.set_result(status)
+
+            for callback in self._order_terminal_callbacks:
+                try:
+                    callback(order_id, status)
+                except Exception as e:
+                    self.logger.error(f"订单终态回调执行失败: {e}")
+
+    def _register_order_future(self, order_id: str):
+        """批量下单期间为订单登记终态Future（推送先于登记到达时立即完成）"""
+        future = asyncio.get_running_loop().create_future()
+        status = self._batch_terminal_status.get(order_id)
+        if status is not None:
+            future.set_result(status)
+        self._order_futures[order_id] = future
+
+    def _mark_batch_ack(self, *order_ids):
+        """记录批量窗口内收到WebSocket推送的订单ID（全部确认时唤醒等待方）"""
+        unacked = self._batch_unacked
+        for order_id in order_ids:
+            if not order_id:
+                continue
+            self._batch_acked_ids.add(order_id)
+            if unacked is not None:
+                unacked.discard(order_id)
+        if unacked is not None and not unacked:
+            self._batch_ack_event.set()
+
+    async def _wait_for_batch_acks(self, timeout: float) -> bool:
+        """
+        等待本批所有订单收到WebSocket推送（挂单确认或终态）
+
+        Args:
+            timeout: 最长等待时间（秒）
+
+        Returns:
+            是否在超时前全部确认
+        """
+        unacked = (set(self._order_futures) - self._batch_acked_ids
+                   - self._batch_terminal_status.keys())
+        if not unacked:
+            return True
+
+        self._batch_unacked = unacked
+        self._batch_ack_event = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._batch_ack_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            self.logger.info(
+                "⏱️ %d 个订单未在 %.1f 秒内收到WebSocket确认，改用REST查询", len(unacked), timeout)
+            return False
+        finally:
+            self._batch_unacked = None
+            self._batch_ack_event = None
+
+    async def _sync_order_status_from_ws(self, timeout: float = 0.5):
+        """
+        批量下单后通过WebSocket终态推送检测立即成交的订单（代替REST查询）
+
+        超时仍未收到终态的订单即仍在挂单中（正常挂单不会有推送，因此总会等满超时，
+        立即成交的推送通常在毫秒级到达，超时无需太长）；
+        已被WebSocket处理器处理的成交不会重复处理
+
+        Args:
+            timeout: 等待终态推送的最长时间（秒）
+        """
+        futures = dict(self._order_futures)
+        if futures:
+            await asyncio.wait(list(futures.values()), timeout=timeout)
+
+        filled_count = 0
+        for order_id, future in futures.items():
+            if not future.done() or future.result() != "FILLED":
+                continue
+
+            # 推送早于订单登记到达时，WebSocket处理器无法匹配订单，在此补处理
+            order = self._pending_orders.get(order_id)
+            if order is None or order.is_filled():
+                continue
+
+            filled_count += 1
+            self.logger.info(
+                "✅ 检测到立即成交订单: %s %s@%s (Grid %s, OrderID: %s)",
+                order.side.value, order.amount, order.price, order.grid_id, order_id
+            )
+            await self._finalize_fill(
+                order, order.price, order.amount, order_id)
+
+        self.logger.info(
+            f"✅ 同步完成（WebSocket）: 补处理 {filled_count} 个立即成交订单，"
+            f"剩余挂单 {len(self._unique_orders)} 个"
+        )
 
     def get_monitoring_mode(self) -> str:
         """
@@ -662,6 +1214,20 @@ class GridEngineImpl(IGridEngine):
         else:
             return "REST轮询"
 
+    def get_order_update_backpressure_count(self) -> int:
+        """
+        获取订单更新队列已满、WebSocket回调等待入队的次数
+
+        Returns:
+            累计次数
+        """
+        return self._order_update_backpressure
+
+    @property
+    def _last_ws_message_time(self) -> float:
+        """上次收到WebSocket消息的时间（秒，与 self._now() 同一单调时钟，兼容旧字段）"""
+        return self._ws_last_msg_ns / 1e9
+
     async def get_real_time_position(self, symbol: str) -> Dict[str, Decimal]:
         """
         从WebSocket缓存获取实时持仓信息（完全不使用REST API）
@@ -679,101 +1245,104 @@ class GridEngineImpl(IGridEngine):
         """
         try:
             # 🔥 只使用WebSocket缓存（不用REST API）
-            if hasattr(self.exchange, '_position_cache'):
-                cached_position = self.exchange._position_cache.get(symbol)
-                if cached_position:
-                    cache_age = (datetime.now() -
-                                 cached_position['timestamp']).total_seconds()
+            cached_position = self.exchange._position_cache.get(symbol)
+            if cached_position:
+                cached_position = PositionSnapshot.coerce(cached_position)
 
+                # 缓存年龄仅用于调试日志，未启用DEBUG时不计算
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    cache_age = (datetime.now() -
+                                 cached_position.timestamp).total_seconds()
                     self.logger.debug(
-                        f"📊 使用WebSocket持仓缓存: {symbol} "
-                        f"数量={cached_position['size']}, "
-                        f"成本=${cached_position['entry_price']}, "
-                        f"缓存年龄={cache_age:.1f}秒"
+                        "📊 使用WebSocket持仓缓存: %s 数量=%s, 成本=$%s, 缓存年龄=%.1f秒",
+                        symbol, cached_position.size, cached_position.entry_price, cache_age
                     )
 
-                    return {
-                        'size': cached_position['size'],
-                        'entry_price': cached_position['entry_price'],
-                        'unrealized_pnl': cached_position['unrealized_pnl'],
-                        'has_cache': True  # 🔥 标记：有缓存数据
-                    }
+                return {
+                    'size': cached_position.size,
+                    'entry_price': cached_position.entry_price,
+                    'unrealized_pnl': cached_position.unrealized_pnl,
+                    'has_cache': True  # 🔥 标记：有缓存数据
+                }
 
             # 🔥 WebSocket缓存不可用（可能还没收到更新）
             # 🔥 频率控制：每60秒最多打印一次警告
-            current_time = time.time()
+            current_time = self._now()
             if current_time - self._last_position_warning_time >= self._position_warning_interval:
                 self.logger.debug(
-                    f"📊 WebSocket持仓缓存暂无数据: {symbol} "
-                    f"(使用PositionTracker数据)"
-                )
+                    "📊 WebSocket持仓缓存暂无数据: %s (使用PositionTracker数据)", symbol)
                 self._last_position_warning_time = current_time
             return {
-                'size': Decimal('0'),
-                'entry_price': Decimal('0'),
-                'unrealized_pnl': Decimal('0'),
+                'size': _DEC_ZERO,
+                'entry_price': _DEC_ZERO,
+                'unrealized_pnl': _DEC_ZERO,
                 'has_cache': False  # 🔥 标记：无缓存数据
             }
 
         except Exception as e:
             self.logger.error(f"获取WebSocket持仓缓存失败: {e}")
             return {
-                'size': Decimal('0'),
-                'entry_price': Decimal('0'),
-                'unrealized_pnl': Decimal('0'),
+                'size': _DEC_ZERO,
+                'entry_price': _DEC_ZERO,
+                'unrealized_pnl': _DEC_ZERO,
                 'has_cache': False  # 🔥 标记：无缓存数据
             }
 
     def _start_smart_monitor(self):
-        """启动智能监控：WebSocket优先，REST临时备用"""
-        if self._polling_task is None or self._polling_task.done():
-            self._polling_task = asyncio.create_task(
-                self._smart_monitor_loop())
-            if self._ws_monitoring_enabled:
-                self.logger.info("✅ 智能监控已启动：WebSocket (主)")
-            else:
-                self.logger.info("✅ 智能监控已启动：REST轮询 (临时备用)")
+        """启动智能监控：WebSocket优先，REST临时备用（幂等，任务运行中时不重复创建）"""
+        if self._polling_task is not None and not self._polling_task.done():
+            return
+
+        self._polling_task = asyncio.create_task(self._smart_monitor_loop())
+        if self._ws_monitoring_enabled:
+            self.logger.info("✅ 智能监控已启动：WebSocket (主)")
+        else:
+            self.logger.info("✅ 智能监控已启动：REST轮询 (临时备用)")
 
     async def _smart_monitor_loop(self):
         """智能监控循环：优先WebSocket，必要时使用REST"""
         self.logger.info("📡 智能监控循环已启动")
 
+        now = self._now
+        exchange = self.exchange
+        is_lighter = self._is_lighter
+        has_ws_connected_attr = self._has_ws_connected_attr
+        has_heartbeat_attr = self._has_heartbeat_attr
+
         while True:
             try:
                 # 🔥 策略1：如果WebSocket正常，只做定期检查（不轮询订单）
                 if self._ws_monitoring_enabled:
-                    await asyncio.sleep(30)  # 30秒检查一次WebSocket状态
+                    # 30秒检查一次WebSocket状态；适配器通知断开时立即唤醒
+                    ws_connected = not await self._wait_ws_disconnected(30)
 
-                    current_time = time.time()
-                    time_since_last_message = current_time - self._last_ws_message_time
+                    current_time = now()
+                    time_since_last_message = (
+                        time.monotonic_ns() - self._ws_last_msg_ns) / 1e9
 
                     # 🔥 优先检查WebSocket连接状态（而不是消息时间）
-                    ws_connected = True
-                    if hasattr(self.exchange, '_ws_connected'):
-                        ws_connected = self.exchange._ws_connected
+                    if ws_connected and has_ws_connected_attr:
+                        ws_connected = exchange._ws_connected
 
                     if not ws_connected:
                         self.logger.error("❌ WebSocket连接断开，切换到REST轮询模式")
                         self.logger.info(
-                            f"📊 最后收到消息时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._last_ws_message_time))}")
+                            "📊 最后收到消息: %.0f秒前", time_since_last_message)
                         self.logger.info(
-                            f"📊 当前挂单数量: {len(self.get_pending_orders())}")
+                            "📊 当前挂单数量: %d", len(self._unique_orders))
                         self._ws_monitoring_enabled = False
                         self._last_ws_check_time = current_time
                         continue
 
                     # 🔥 检查WebSocket心跳状态（仅对支持主动心跳的交易所）
-                    exchange_name = self.config.exchange.lower() if hasattr(
-                        self.config, 'exchange') else 'unknown'
-
                     # 🔥 Lighter 不会主动推送心跳消息，只依赖连接状态检测
                     # Backpack/Hyperliquid 会在每次消息时更新心跳，可以用超时检测
-                    if exchange_name == 'lighter':
+                    if is_lighter:
                         # 对于 Lighter：没有订单成交时不会有消息，这是正常现象
                         # 只要连接状态正常，就继续使用 WebSocket
                         self.logger.info(
-                            f"💓 WebSocket健康: 连接正常, "
-                            f"消息 {time_since_last_message:.0f}秒前"
+                            "💓 WebSocket健康: 连接正常, 消息 %.0f秒前 (累计%d条)",
+                            time_since_last_message, self._ws_msg_count
                         )
 
                         # 💡 如果长时间没有消息，提示这是正常现象
@@ -785,12 +1354,13 @@ class GridEngineImpl(IGridEngine):
                     else:
                         # 对于 Backpack/Hyperliquid：检查心跳超时
                         heartbeat_age = 0
-                        if hasattr(self.exchange, '_last_heartbeat'):
-                            last_heartbeat = self.exchange._last_heartbeat
+                        if has_heartbeat_attr:
+                            last_heartbeat = exchange._last_heartbeat
                             # 处理可能的datetime对象
                             if isinstance(last_heartbeat, datetime):
                                 last_heartbeat = last_heartbeat.timestamp()
-                            heartbeat_age = current_time - last_heartbeat
+                            # 心跳时间来自交易所适配器（墙上时钟）
+                            heartbeat_age = time.time() - last_heartbeat
 
                             # 对于这些交易所，心跳超时是真正的问题
                             if heartbeat_age > self._ws_timeout_threshold:
@@ -798,32 +1368,40 @@ class GridEngineImpl(IGridEngine):
                                     f"❌ WebSocket心跳超时（{heartbeat_age:.0f}秒未更新），"
                                     f"切换到REST轮询模式"
                                 )
+                                if self.logger.isEnabledFor(logging.INFO):
+                                    self.logger.info(
+                                        "📊 最后心跳时间: %s",
+                                        time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_heartbeat)))
                                 self.logger.info(
-                                    f"📊 最后心跳时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(last_heartbeat))}")
-                                self.logger.info(
-                                    f"📊 最后消息时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._last_ws_message_time))}")
+                                    "📊 最后收到消息: %.0f秒前", time_since_last_message)
                                 self.logger.info(
-                                    f"📊 当前挂单数量: {len(self.get_pending_orders())}")
+                                    "📊 当前挂单数量: %d", len(self._unique_orders))
                                 self._ws_monitoring_enabled = False
                                 self._last_ws_check_time = current_time
                                 continue
 
                         # 打印健康状态
                         self.logger.info(
-                            f"💓 WebSocket健康: 连接正常, 心跳 {heartbeat_age:.0f}秒前, "
-                            f"消息 {time_since_last_message:.0f}秒前"
+                            "💓 WebSocket健康: 连接正常, 心跳 %.0f秒前, 消息 %.0f秒前 (累计%d条)",
+                            heartbeat_age, time_since_last_message, self._ws_msg_count
                         )
 
                     continue
 
                 # 🔥 策略2：WebSocket不可用时，使用REST轮询
-                await asyncio.sleep(3)  # 3秒轮询一次
+                # 上一次轮询完成后才计算下一次等待（不会重叠），附加随机抖动
+                interval = self._poll_interval if self._pending_orders else self._poll_interval_max
+                await asyncio.sleep(interval + random.uniform(0, 0.5))
 
                 if self._pending_orders:
-                    await self._check_pending_orders()
+                    if await self._check_pending_orders():
+                        self._poll_interval = self._poll_interval_min
+                    else:
+                        self._poll_interval = min(
+                            self._poll_interval * 2, self._poll_interval_max)
 
                 # 🔥 策略3：定期尝试恢复WebSocket
-                current_time = time.time()
+                current_time = now()
                 if current_time - self._last_ws_check_time >= self._ws_check_interval:
                     self._last_ws_check_time = current_time
                     await self._try_restore_websocket()
@@ -835,6 +1413,25 @@ class GridEngineImpl(IGridEngine):
                 self.logger.error(f"智能监控出错: {e}")
                 await asyncio.sleep(5)
 
+    async def _wait_ws_disconnected(self, timeout: float) -> bool:
+        """
+        等待交易所适配器的WebSocket断开通知（不支持通知的适配器只休眠）
+
+        Returns:
+            是否在超时前收到断开通知
+        """
+        event = getattr(self.exchange, 'ws_disconnected_event', None)
+        if event is None:
+            await asyncio.sleep(timeout)
+            return False
+
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        event.clear()
+        return True
+
     async def _try_restore_websocket(self):
         """尝试恢复WebSocket监控"""
         if self._ws_monitoring_enabled:
@@ -844,20 +1441,21 @@ class GridEngineImpl(IGridEngine):
             self.logger.info("🔄 尝试恢复WebSocket监控...")
 
             # 尝试重新订阅用户数据流
-            await self.exchange.subscribe_user_data(self._on_order_update)
+            await self.exchange.subscribe_user_data(self._enqueue_order_update)
 
-            # 订阅成功，切换回WebSocket模式
+            # 订阅成功，切换回WebSocket模式（丢弃REST期间积累的断开通知）
+            event = getattr(self.exchange, 'ws_disconnected_event', None)
+            if event is not None:
+                event.clear()
             self._ws_monitoring_enabled = True
             # 重置WebSocket消息时间戳
-            self._last_ws_message_time = time.time()
+            self._ws_last_msg_ns = time.monotonic_ns()
             self.logger.info("✅ WebSocket监控已恢复！切换回WebSocket模式")
             self.logger.info("📡 使用WebSocket实时监控订单成交")
 
         except Exception as e:
             self.logger.warning(f"⚠️ WebSocket恢复失败: {type(e).__name__}: {e}")
-            self.logger.debug(f"详细错误: {e}，继续使用REST轮询")
-            import traceback
-            self.logger.debug(f"错误堆栈:\n{traceback.format_exc()}")
+            self.logger.debug("详细错误: %s，继续使用REST轮询", e, exc_info=True)
 
     async def _sync_order_status_after_batch(self):
         """
@@ -875,39 +1473,29 @@ class GridEngineImpl(IGridEngine):
             # 🔍 调试：输出查询结果
             self.logger.info(
                 f"🔍 批量下单后查询挂单: 共查询到 {len(open_orders) if open_orders else 0} 个挂单")
-            if open_orders:
-                rest_order_ids = [o.id for o in open_orders]
-                self.logger.info(f"🔍 REST返回的挂单ID: {rest_order_ids}")
+            if self.logger.isEnabledFor(logging.INFO):
+                if open_orders:
+                    self.logger.info(
+                        "🔍 REST返回的挂单ID: %s", [o.id for o in open_orders])
 
-            # 🔍 调试：输出本地订单ID
-            pending_ids = list(self._pending_orders.keys())
-            self.logger.info(f"🔍 本地_pending_orders的ID: {pending_ids}")
+                # 🔍 调试：输出本地订单ID
+                self.logger.info(
+                    "🔍 本地_pending_orders的ID: %s", list(self._pending_orders))
 
             if not open_orders:
                 self.logger.warning("⚠️ 未获取到任何挂单，可能所有订单都已成交")
                 # 所有订单都可能已成交，逐个检查
-                pending_order_ids = list(self._pending_orders.keys())
-                for order_id in pending_order_ids:
-                    order = self._pending_orders.get(order_id)
-                    if order:
-                        self.logger.info(
-                            f"🔍 订单 {order_id} (Grid {order.grid_id}) 不在挂单列表中，"
-                            f"可能已成交，触发成交处理"
-                        )
-                        # 标记为已成交并触发回调
-                        order.mark_filled(
-                            filled_price=order.price, filled_amount=order.amount)
-                        del self._pending_orders[order_id]
-
-                        # 触发成交回调
-                        for callback in self._order_callbacks:
-                            try:
-                                if asyncio.iscoroutinefunction(callback):
-                                    await callback(order)
-                                else:
-                                    callback(order)
-                            except Exception as e:
-                                self.logger.error(f"订单回调执行失败: {e}")
+                # 快照 items；回调期间可能有订单被移除，处理前确认订单仍在追踪中
+                for order_id, order in tuple(self._pending_orders.items()):
+                    if self._pending_orders.get(order_id) is not order:
+                        continue
+                    self._remove_order_from_pending(order_id)
+                    self.logger.info(
+                        "🔍 订单 %s (Grid %s) 不在挂单列表中，可能已成交，触发成交处理",
+                        order_id, order.grid_id
+                    )
+                    # 标记为已成交并触发回调（已在上方移除）
+                    await self._finalize_fill(order, order.price, order.amount)
                 return
 
             # 创建挂单ID集合（同时包含 order.id 和 order.client_id）
@@ -915,139 +1503,205 @@ class GridEngineImpl(IGridEngine):
             open_order_ids = {order.id for order in open_orders if order.id}
             open_client_ids = {
                 order.client_id for order in open_orders if order.client_id}
+            # client_id → order_index 映射（单次遍历构建，避免逐个订单扫描挂单列表）
+            client_to_index = {
+                order.client_id: order.id for order in open_orders if order.client_id and order.id}
+            # 合并后单次成员判断（order_index 或 client_id 任一匹配即仍在挂单中）
+            open_ids = open_order_ids | open_client_ids
 
-            self.logger.debug(f"🔍 挂单 order_index 集合: {open_order_ids}")
-            self.logger.debug(f"🔍 挂单 client_id 集合: {open_client_ids}")
+            self.logger.debug("🔍 挂单 order_index 集合: %s", open_order_ids)
+            self.logger.debug("🔍 挂单 client_id 集合: %s", open_client_ids)
 
             # 检查哪些订单不在挂单列表中（可能已成交）
             # 同时检查 order_id 和 client_id，只要其中一个匹配就认为订单还在挂单列表中
             filled_count = 0
-            pending_order_ids = list(self._pending_orders.keys())
 
-            for order_id in pending_order_ids:
+            for order_id, order in tuple(self._pending_orders.items()):
                 # 如果 order_id 既不在 open_order_ids 也不在 open_client_ids 中，才认为已成交
-                if order_id not in open_order_ids and order_id not in open_client_ids:
-                    order = self._pending_orders.get(order_id)
-                    if order:
-                        filled_count += 1
-                        self.logger.info(
-                            f"🔍 订单ID {order_id} 不在REST挂单列表中 (REST返回{len(open_order_ids)}个order_index, {len(open_client_ids)}个client_id)"
-                        )
-                        self.logger.info(
-                            f"✅ 检测到立即成交订单: {order.side.value} {order.amount}@{order.price} "
-                            f"(Grid {order.grid_id}, OrderID: {order_id})"
-                        )
+                if order_id not in open_ids:
+                    # 回调期间订单可能已被移除（与快照不符时跳过）
+                    if self._pending_orders.get(order_id) is not order:
+                        continue
+                    self._remove_order_from_pending(order_id)
+                    filled_count += 1
+                    self.logger.info(
+                        "🔍 订单ID %s 不在REST挂单列表中 (REST返回%d个order_index, %d个client_id)",
+                        order_id, len(open_order_ids), len(open_client_ids)
+                    )
+                    self.logger.info(
+                        "✅ 检测到立即成交订单: %s %s@%s (Grid %s, OrderID: %s)",
+                        order.side.value, order.amount, order.price, order.grid_id, order_id
+                    )
 
-                        # 标记为已成交并触发回调
-                        order.mark_filled(
-                            filled_price=order.price, filled_amount=order.amount)
-                        del self._pending_orders[order_id]
-
-                        # 触发成交回调
-                        for callback in self._order_callbacks:
-                            try:
-                                if asyncio.iscoroutinefunction(callback):
-                                    await callback(order)
-                                else:
-                                    callback(order)
-                            except Exception as e:
-                                self.logger.error(f"❌ 订单回调执行失败: {e}")
-                                import traceback
-                                self.logger.error(traceback.format_exc())
+                    # 标记为已成交并触发回调（已在上方移除）
+                    await self._finalize_fill(order, order.price, order.amount)
                 else:
                     # 🔍 订单匹配成功（在挂单列表中）
                     # 🔥 建立 order_index 映射（仅当 order_id 是 client_id 时）
                     if order_id in open_client_ids:
-                        # 找到对应的 order_index
-                        for ex_order in open_orders:
-                            if ex_order.client_id == order_id:
-                                order_index = ex_order.id
+                        order_index = client_to_index.get(order_id)
 
-                                # 建立映射（如果还没有）
-                                if order_index and order_index not in self._pending_orders:
-                                    grid_order = self._pending_orders[order_id]
-                                    self._pending_orders[order_index] = grid_order
+                        # 建立映射（如果还没有，且订单未在回调期间被移除）
+                        if (order_index and order_index not in self._pending_orders
+                                and self._pending_orders.get(order_id) is order):
+                            self._add_pending_key(order_index, order)
 
-                                    self.logger.info(
-                                        f"✅ 映射订单ID: client_id={order_id} → "
-                                        f"order_index={order_index} "
-                                        f"(Grid {grid_order.grid_id})"
-                                    )
-                                break
+                            self.logger.info(
+                                "✅ 映射订单ID: client_id=%s → order_index=%s (Grid %s)",
+                                order_id, order_index, order.grid_id
+                            )
                     else:
                         self.logger.debug(
-                            f"✅ 订单ID {order_id} 在挂单列表中（匹配成功）"
+                            "✅ 订单ID %s 在挂单列表中（匹配成功）", order_id
                         )
 
             if filled_count > 0:
-                # 使用 get_pending_orders() 获取去重后的订单数量
-                pending_count = len(self.get_pending_orders())
+                # _unique_orders 即去重后的订单（O(1) 计数）
+                pending_count = len(self._unique_orders)
                 self.logger.info(
                     f"🎯 同步完成: 检测到 {filled_count} 个立即成交订单，"
                     f"剩余挂单 {pending_count} 个"
                 )
             else:
-                # 使用 get_pending_orders() 获取去重后的订单数量
-                pending_count = len(self.get_pending_orders())
+                # _unique_orders 即去重后的订单（O(1) 计数）
+                pending_count = len(self._unique_orders)
                 self.logger.info(
                     f"✅ 同步完成: 所有 {pending_count} 个订单均在挂单列表中"
                 )
 
         except Exception as e:
-            self.logger.error(f"同步订单状态失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"同步订单状态失败: {e}")
+
+    async def _check_pending_orders(self) -> bool:
+        """
+        检查挂单状态（通过REST API）
 
-    async def _check_pending_orders(self):
-        """检查挂单状态（通过REST API）"""
+        Returns:
+            查询是否成功（失败时由调用方退避）
+        """
         try:
             # 获取当前所有挂单
             open_orders = await self.exchange.get_open_orders(self.config.symbol)
 
             # 创建订单ID集合（用于快速查找）
             open_order_ids = {
-                order.id or order.order_id for order in open_orders if order.id or order.order_id}
+                oid for order in open_orders if (oid := order.id or order.order_id)}
 
-            # 检查我们跟踪的订单
-            filled_orders = []
-            for order_id, grid_order in list(self._pending_orders.items()):
-                # 如果订单不在挂单列表中，说明已成交或取消
-                if order_id not in open_order_ids:
-                    # 假设是成交了（网格系统不会主动取消订单）
-                    filled_orders.append((order_id, grid_order))
+            # 检查我们跟踪的订单：不在挂单列表中的键说明已成交或取消
+            # （假设是成交了，网格系统不会主动取消订单；dict_keys 差集在C层完成，无需逐个探测）
+            pending = self._pending_orders
+            filled_orders = [
+                (order_id, pending[order_id])
+                for order_id in pending.keys() - open_order_ids
+            ]
 
             # 处理成交的订单
             for order_id, grid_order in filled_orders:
+                # 回调期间订单可能已被移除（与快照不符时跳过）
+                if self._pending_orders.get(order_id) is not grid_order:
+                    continue
+                self._remove_order_from_pending(order_id)
                 self.logger.info(
-                    f"📊 REST轮询检测到订单成交: {grid_order.side.value} "
-                    f"{grid_order.amount}@{grid_order.price} (Grid {grid_order.grid_id})"
+                    "📊 REST轮询检测到订单成交: %s %s@%s (Grid %s)",
+                    grid_order.side.value, grid_order.amount, grid_order.price, grid_order.grid_id
                 )
 
-                # 标记为已成交
-                grid_order.mark_filled(grid_order.price, grid_order.amount)
-
-                # 从挂单列表移除
-                del self._pending_orders[order_id]
-
-                # 通知回调
-                for callback in self._order_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(grid_order)
-                        else:
-                            callback(grid_order)
-                    except Exception as e:
-                        self.logger.error(f"订单回调执行失败: {e}")
+                # 标记为已成交并通知回调（已在上方移除）
+                await self._finalize_fill(
+                    grid_order, grid_order.price, grid_order.amount)
 
             if filled_orders:
                 self.logger.info(f"✅ REST轮询处理了 {len(filled_orders)} 个成交订单")
 
+            return True
+
         except Exception as e:
             self.logger.error(f"检查挂单状态失败: {e}")
+            return False
+
+    def _is_duplicate_event(self, order_id: str, status: Optional[str], filled) -> bool:
+        """
+        WebSocket重复事件检测（部分交易所会重复推送同一订单状态）
+
+        指纹为 (订单ID, 状态, 已成交数量微单位)，首次出现时记录并返回False
+        """
+        try:
+            filled_micros = int(_to_decimal(filled) * 1_000_000) if filled else 0
+        except (ArithmeticError, ValueError):
+            filled_micros = 0
+        fingerprint = (order_id, status, filled_micros)
+        if fingerprint in self._seen_event_fps:
+            self.logger.debug("忽略重复的订单事件: %s", fingerprint)
+            return True
+        self._seen_event_fps.add(fingerprint)
+        return False
+
+    def _start_order_update_consumer(self):
+        """启动订单更新消费任务及成交回调分发任务（幂等，任务运行中时不重复创建）"""
+        if self._fill_dispatch_task is None or self._fill_dispatch_task.done():
+            if self._fill_dispatch_queue is None:
+                self._fill_dispatch_queue = asyncio.Queue()
+            self._fill_dispatch_task = asyncio.create_task(
+                self._fill_dispatch_loop())
+        if self._order_update_task is not None and not self._order_update_task.done():
+            return
+        if self._order_update_queue is None:
+            self._order_update_queue = asyncio.Queue(
+                maxsize=self._ORDER_UPDATE_QUEUE_SIZE)
+        self._order_update_task = asyncio.create_task(
+            self._order_update_consumer_loop())
+
+    async def _fill_dispatch_loop(self):
+        """成交回调分发循环：按成交到达顺序逐个通知回调（前一个回调完成后再通知下一个）"""
+        queue = self._fill_dispatch_queue
+        while True:
+            try:
+                order = await queue.get()
+                await self._dispatch_order_callbacks(order)
+            except asyncio.CancelledError:
+                break
+
+    async def _enqueue_order_update(self, update_data):
+        """
+        WebSocket订单更新回调：记录消息时间后入队，处理交给消费任务
+
+        接收路径不再等待订单处理（成交回调、撤单恢复挂单等），连续推送时由消费任务批量处理；
+        队列已满（消费任务被拖慢）时等待入队而不是丢弃：成交事件丢失后无法由其他路径补回
+        """
+        # 🔥 更新WebSocket消息时间戳（表示WebSocket正常工作）
+        self._ws_msg_count += 1
+        self._ws_last_msg_ns = time.monotonic_ns()
+        queue = self._order_update_queue
+        if queue.full():
+            self._order_update_backpressure += 1
+            # 首次及每100次记录一次，避免积压期间刷屏
+            if self._order_update_backpressure == 1 or self._order_update_backpressure % 100 == 0:
+                self.logger.warning(
+                    "⚠️ 订单更新队列已满(%d)，WebSocket接收等待处理（累计 %d 次）",
+                    self._ORDER_UPDATE_QUEUE_SIZE, self._order_update_backpressure)
+        await queue.put(update_data)
+
+    async def _order_update_consumer_loop(self):
+        """订单更新消费循环：每轮取出队列中已到达的消息（最多 _ORDER_UPDATE_BATCH 条），按到达顺序处理"""
+        queue = self._order_update_queue
+        max_batch = self._ORDER_UPDATE_BATCH
+        while True:
+            try:
+                batch = [await queue.get()]
+                while len(batch) < max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                if len(batch) > 1:
+                    self.logger.debug("📨 批量处理WebSocket订单更新: %d 条", len(batch))
+                # 同一订单的事件有先后依赖（挂单确认 -> 成交/取消），逐条按序处理；
+                # 成交回调交给分发任务按顺序执行，消费任务只做状态更新
+                for update_data in batch:
+                    await self._on_order_update(update_data)
+            except asyncio.CancelledError:
+                break
 
     async def _on_order_update(self, update_data: dict):
         """
-        处理订单更新（来自WebSocket）
+        处理订单更新（来自WebSocket，由订单更新消费任务调用）
 
         Args:
             update_data: 交易所推送的订单更新数据
@@ -1064,285 +1718,282 @@ class GridEngineImpl(IGridEngine):
         try:
             # 🔍 简化日志：仅记录关键信息到日志文件
             self.logger.debug(
-                f"📨 收到WebSocket订单更新，类型={type(update_data).__name__}")
+                "📨 收到WebSocket订单更新，类型=%s", type(update_data).__name__)
+            self.logger.debug("📨 完整订单更新数据: %s", update_data)
+
+            # 🔥 按数据格式分派：OrderData对象（Hyperliquid/Lighter）/ 列表（Hyperliquid）/ 字典（Backpack）
+            handler = self._update_dispatch.get(type(update_data))
+            if handler is None:
+                # 非精确类型（子类实例）回退到 isinstance 判断
+                handler = next((h for t, h in self._update_dispatch.items()
+                                if isinstance(update_data, t)), None)
+            if handler is None:
+                self.logger.warning(f"未知的订单更新格式: {type(update_data)}")
+                return
 
-            # 🔥 更新WebSocket消息时间戳（表示WebSocket正常工作）
-            self._last_ws_message_time = time.time()
+            await handler(update_data)
 
-            self.logger.debug(f"📨 完整订单更新数据: {update_data}")
+        except Exception as e:
+            self.logger.exception(f"处理订单更新失败: {e}")
+
+    async def _handle_exchange_order_data(self, update_data: ExchangeOrderData):
+        """处理OrderData对象格式的订单更新（Hyperliquid/Lighter）"""
+        self.logger.debug(
+            "收到OrderData: id=%s, client_id=%s, status=%s",
+            update_data.id, update_data.client_id, update_data.status)
+
+        order_id = str(update_data.id)
+        client_id = str(
+            update_data.client_id) if update_data.client_id else None
+        # 🔥 修复：OrderStatus是枚举，使用.value获取字符串值
+        status = update_data.status.value.upper() if update_data.status else ""
+
+        if self._is_duplicate_event(order_id, status, update_data.filled):
+            return
+
+        if self._batch_terminal_status is not None:
+            self._mark_batch_ack(order_id, client_id)
+
+        if self._order_terminal_callbacks or self._batch_terminal_status is not None:
+            if status in ("FILLED", "CLOSED"):
+                self._notify_order_terminal("FILLED", order_id, client_id)
+            elif status in ("CANCELLED", "CANCELED"):
+                self._notify_order_terminal("CANCELLED", order_id, client_id)
+
+        # 🔥 修复：优先用 client_id 匹配订单（因为下单时返回的是 tx_hash，不是 order_index）
+        grid_order = self._pending_orders.get(client_id) if client_id else None
+        matched_key = client_id
+        if grid_order is not None:
             self.logger.debug(
-                f"📊 WebSocket消息时间戳已更新: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._last_ws_message_time))}")
-
-            # 🔥 检测数据格式：Hyperliquid OrderData对象 vs Backpack字典
-            from ....adapters.exchanges.models import OrderData as ExchangeOrderData
-
-            # === Hyperliquid/Lighter: OrderData对象 ===
-            if isinstance(update_data, ExchangeOrderData):
+                "✅ 通过ClientID找到订单: %s, Grid=%s", client_id, grid_order.grid_id)
+        else:
+            grid_order = self._pending_orders.get(order_id)
+            matched_key = order_id
+            if grid_order is not None:
                 self.logger.debug(
-                    f"收到OrderData: id={update_data.id}, client_id={update_data.client_id}, status={update_data.status}")
-
-                order_id = str(update_data.id)
-                client_id = str(
-                    update_data.client_id) if update_data.client_id else None
-                # 🔥 修复：OrderStatus是枚举，使用.value获取字符串值
-                status = update_data.status.value.upper() if update_data.status else ""
-                event_type = "order_update"
-
-                # 🔥 修复：优先用 client_id 匹配订单（因为下单时返回的是 tx_hash，不是 order_index）
-                grid_order = None
-                if client_id and client_id in self._pending_orders:
-                    grid_order = self._pending_orders[client_id]
-                    self.logger.debug(
-                        f"✅ 通过ClientID找到订单: {client_id}, Grid={grid_order.grid_id}")
-                elif order_id in self._pending_orders:
-                    grid_order = self._pending_orders[order_id]
-                    self.logger.debug(
-                        f"✅ 通过OrderID找到订单: {order_id}, Grid={grid_order.grid_id}")
-                else:
-                    self.logger.debug(
-                        f"收到非监控订单的更新: OrderID={order_id}, ClientID={client_id}")
-                    return
+                    "✅ 通过OrderID找到订单: %s, Grid=%s", order_id, grid_order.grid_id)
+        if grid_order is None:
+            self._expected_cancellations.discard(order_id)
+            if client_id:
+                self._expected_cancellations.discard(client_id)
+            self.logger.debug(
+                "收到非监控订单的更新: OrderID=%s, ClientID=%s", order_id, client_id)
+            return
 
-                # Hyperliquid/Lighter的订单状态
-                if status in ["FILLED", "CLOSED"]:
-                    # 🔥 修复：OrderData的属性名是 average 和 filled，不是 average_price 和 filled_amount
-                    filled_price = update_data.average or update_data.price or grid_order.price
-                    filled_amount = update_data.filled or grid_order.amount
+        # Hyperliquid/Lighter的订单状态
+        if status in ["FILLED", "CLOSED"]:
+            # 🔥 修复：OrderData的属性名是 average 和 filled，不是 average_price 和 filled_amount
+            filled_price = update_data.average or update_data.price or grid_order.price
+            filled_amount = update_data.filled or grid_order.amount
 
-                    grid_order.mark_filled(filled_price, filled_amount)
+            self.logger.info(
+                "✅ WebSocket订单成交: %s %s@%s (Grid %s, OrderID: %s)",
+                grid_order.side.value, filled_amount, filled_price, grid_order.grid_id, order_id
+            )
 
-                    # 🔥 修复：从字典中删除订单时，使用实际存储的key（client_id或order_id）
-                    if client_id and client_id in self._pending_orders:
-                        del self._pending_orders[client_id]
-                    elif order_id in self._pending_orders:
-                        del self._pending_orders[order_id]
+            # 🔥 修复：从字典中删除订单时，使用实际匹配的key（同时移除该订单的其他键）
+            # 触发回调（重要！）
+            await self._finalize_fill(
+                grid_order, filled_price, filled_amount, matched_key,
+                background=True)
 
-                    self.logger.info(
-                        f"✅ WebSocket订单成交: {grid_order.side.value} {filled_amount}@{filled_price} "
-                        f"(Grid {grid_order.grid_id}, OrderID: {order_id})"
-                    )
+            return
 
-                    # 触发回调（重要！）
-                    for callback in self._order_callbacks:
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(grid_order)
-                            else:
-                                callback(grid_order)
-                        except Exception as e:
-                            self.logger.error(f"订单回调执行失败: {e}")
+        elif status in ["CANCELLED", "CANCELED"]:
+            self.logger.debug("订单被取消: order_id=%s", order_id)
 
-                    return
+            self._remove_order_from_pending(matched_key)
 
-                elif status in ["CANCELLED", "CANCELED"]:
-                    self.logger.debug(f"订单被取消: order_id={order_id}")
+            if self._expected_cancellations.pop(order_id):
+                self.logger.info(
+                    "ℹ️ Hyperliquid订单已主动取消: %s", grid_order.grid_id)
+            else:
+                self.logger.warning(
+                    "⚠️ Hyperliquid订单被手动取消: %s", grid_order.grid_id)
+                # TODO: 可能需要重新挂单
 
-                    if order_id in self._pending_orders:
-                        del self._pending_orders[order_id]
+            return
 
-                    is_expected_cancellation = order_id in self._expected_cancellations
-                    if is_expected_cancellation:
-                        self._expected_cancellations.remove(order_id)
-                        self.logger.info(
-                            f"ℹ️ Hyperliquid订单已主动取消: {grid_order.grid_id}")
-                    else:
-                        self.logger.warning(
-                            f"⚠️ Hyperliquid订单被手动取消: {grid_order.grid_id}")
-                        # TODO: 可能需要重新挂单
+        else:
+            # 🔥 其他状态（如 OPEN, PENDING）：订单挂单成功的通知
+            # 通过 client_id 匹配且推送带有 order_index 时，建立映射（与REST同步相同）
+            if (matched_key == client_id and order_id != client_id
+                    and order_id not in self._pending_orders):
+                self._add_pending_key(order_id, grid_order)
+                self.logger.debug(
+                    "🔗 建立订单映射: client_id=%s → order_index=%s", client_id, order_id)
+            self.logger.debug(
+                "订单状态更新: %s, Grid %s", status, grid_order.grid_id)
+            return
+
+    async def _handle_order_list(self, update_data: list):
+        """处理列表格式的订单更新（Hyperliquid 订单列表）"""
+        self.logger.debug("收到Hyperliquid订单列表，包含%d个订单", len(update_data))
+
+        # 🔥 遍历处理每个订单（实现实时WebSocket监控）
+        processed_count = 0
+        for order_item in update_data:
+            if isinstance(order_item, dict):
+                # 提取订单信息
+                order_id = str(order_item.get('id', ''))
+                status = order_item.get('status', '').lower()
+
+                if self._is_duplicate_event(order_id, status, order_item.get('filled')):
+                    continue
 
-                    return
+                if self._order_terminal_callbacks or self._batch_terminal_status is not None:
+                    if status in ('closed', 'filled'):
+                        self._notify_order_terminal("FILLED", order_id)
+                    elif status in ('cancelled', 'canceled'):
+                        self._notify_order_terminal("CANCELLED", order_id)
 
-                else:
-                    # 🔥 其他状态（如 OPEN, PENDING）：订单挂单成功的通知，无需处理
-                    self.logger.debug(
-                        f"订单状态更新: {status}, Grid {grid_order.grid_id}")
-                    return
+                # 检查是否是我们的订单
+                grid_order = self._pending_orders.get(order_id)
+                if grid_order is None:
+                    self._expected_cancellations.discard(order_id)
+                    continue
 
-            # === Hyperliquid: 列表格式（订单列表更新）===
-            if isinstance(update_data, list):
-                self.logger.debug(f"收到Hyperliquid订单列表，包含{len(update_data)}个订单")
+                # 处理订单成交
+                if status in ['closed', 'filled']:
 
-                # 🔥 遍历处理每个订单（实现实时WebSocket监控）
-                processed_count = 0
-                for order_item in update_data:
-                    if isinstance(order_item, dict):
-                        # 提取订单信息
-                        order_id = str(order_item.get('id', ''))
-                        status = order_item.get('status', '').lower()
+                    filled_price = _to_decimal(
+                        order_item.get('price'), grid_order.price)
+                    filled_amount = _to_decimal(
+                        order_item.get('filled'), grid_order.amount)
 
-                        # 检查是否是我们的订单
-                        if order_id not in self._pending_orders:
-                            continue
+                    self.logger.info(
+                        "✅ WebSocket订单成交: %s %s@%s (Grid %s, OrderID: %s)",
+                        grid_order.side.value, filled_amount, filled_price, grid_order.grid_id, order_id
+                    )
 
-                        grid_order = self._pending_orders[order_id]
+                    # 标记成交、移除并触发回调（反向挂单）
+                    await self._finalize_fill(
+                        grid_order, filled_price, filled_amount, order_id,
+                        background=True)
 
-                        # 处理订单成交
-                        if status in ['closed', 'filled']:
+                    processed_count += 1
 
-                            filled_price = Decimal(
-                                str(order_item.get('price', grid_order.price)))
-                            filled_amount = Decimal(
-                                str(order_item.get('filled', grid_order.amount)))
+        if processed_count > 0:
+            self.logger.debug("处理了%d个订单成交", processed_count)
 
-                            # 标记成交并移除
-                            grid_order.mark_filled(filled_price, filled_amount)
-                            del self._pending_orders[order_id]
+    async def _handle_backpack_update(self, update_data: dict):
+        """处理字典格式的订单更新（Backpack）"""
+        self.logger.debug("使用Backpack格式处理")
+        data = update_data.get('data', update_data)
 
-                            self.logger.info(
-                                f"✅ WebSocket订单成交: {grid_order.side.value} {filled_amount}@{filled_price} "
-                                f"(Grid {grid_order.grid_id}, OrderID: {order_id})"
-                            )
+        # 如果data仍然不是字典，跳过
+        if not isinstance(data, dict):
+            self.logger.debug("data字段不是字典格式，跳过: %s", type(data))
+            return
 
-                            # 🔥 触发回调（反向挂单）
-                            for callback in self._order_callbacks:
-                                try:
-                                    if asyncio.iscoroutinefunction(callback):
-                                        await callback(grid_order)
-                                    else:
-                                        callback(grid_order)
-                                except Exception as e:
-                                    self.logger.error(f"订单回调执行失败: {e}")
+        # 从data字段中提取订单信息（Backpack格式）
+        order_id = data.get('i')  # Backpack使用'i'表示订单ID
+        status = data.get('X')     # Backpack使用'X'表示状态
+        event_type = data.get('e')  # 事件类型
 
-                            processed_count += 1
+        if not order_id:
+            self.logger.debug("订单更新缺少订单ID: %s", update_data)
+            return
 
-                if processed_count > 0:
-                    self.logger.debug(f"处理了{processed_count}个订单成交")
+        if self._is_duplicate_event(order_id, status or event_type, data.get('z')):
+            return
 
-                return
+        if self._order_terminal_callbacks or self._batch_terminal_status is not None:
+            if status == 'Filled' or event_type == 'orderFilled':
+                self._notify_order_terminal("FILLED", order_id)
+            elif status == 'Cancelled' or event_type == 'orderCancelled':
+                self._notify_order_terminal("CANCELLED", order_id)
 
-            # === Backpack: 字典格式 ===
-            if not isinstance(update_data, dict):
-                self.logger.warning(f"未知的订单更新格式: {type(update_data)}")
-                return
+        # 检查是否是我们的订单
+        grid_order = self._pending_orders.get(order_id)
+        if grid_order is None:
+            self._expected_cancellations.discard(order_id)
+            self.logger.debug("收到非监控订单的更新: %s", order_id)
+            return
 
-            self.logger.debug("使用Backpack格式处理")
-            data = update_data.get('data', update_data)
+        self.logger.info(
+            "📨 订单更新: ID=%s, 事件=%s, 状态=%s, Grid=%s",
+            order_id, event_type, status, grid_order.grid_id
+        )
 
-            # 如果data仍然不是字典，跳过
-            if not isinstance(data, dict):
-                self.logger.debug(f"data字段不是字典格式，跳过: {type(data)}")
-                return
+        # ✅ 按事件分派（Backpack使用"Filled"表示已成交）：优先状态，其次事件类型
+        handler = (self._backpack_event_handlers.get(status)
+                   or self._backpack_event_handlers.get(event_type))
+        if handler is not None:
+            await handler(order_id, grid_order, data)
 
-            # 从data字段中提取订单信息（Backpack格式）
-            order_id = data.get('i')  # Backpack使用'i'表示订单ID
-            status = data.get('X')     # Backpack使用'X'表示状态
-            event_type = data.get('e')  # 事件类型
+    async def _handle_backpack_fill(self, order_id: str, grid_order: GridOrder, data: dict):
+        """处理Backpack订单成交事件"""
+        # 获取成交价格和数量 - 从data字段中提取
+        filled_price = _to_decimal(data.get('p'), grid_order.price)
+        filled_amount = _to_decimal(data.get('z'), grid_order.amount)  # 'z'是已成交数量
 
-            if not order_id:
-                self.logger.debug(f"订单更新缺少订单ID: {update_data}")
-                return
+        self.logger.info(
+            "✅ 订单成交: %s %s@%s (Grid %s)",
+            grid_order.side.value, filled_amount, filled_price, grid_order.grid_id
+        )
 
-            # 检查是否是我们的订单
-            if order_id not in self._pending_orders:
-                self.logger.debug(f"收到非监控订单的更新: {order_id}")
-                return
+        # 标记成交、从挂单列表移除并通知所有回调
+        await self._finalize_fill(
+            grid_order, filled_price, filled_amount, order_id,
+            background=True)
 
-            grid_order = self._pending_orders[order_id]
+    async def _handle_backpack_cancel(self, order_id: str, grid_order: GridOrder, data: dict):
+        """处理Backpack订单取消事件（区分主动取消与手动取消）"""
+        # 从挂单列表移除
+        self._drop_pending_key(order_id)
 
+        # 🔥 关键修复：区分主动取消和被动取消
+        if self._expected_cancellations.pop(order_id):
+            # 主动取消（剥头皮模式、本金保护等），不重新挂单
             self.logger.info(
-                f"📨 订单更新: ID={order_id}, "
-                f"事件={event_type}, 状态={status}, "
-                f"Grid={grid_order.grid_id}"
+                "ℹ️ 订单已主动取消，不重新挂单: %s %s@%s (Grid %s, OrderID: %s)",
+                grid_order.side.value, grid_order.amount, grid_order.price, grid_order.grid_id, order_id
+            )
+        else:
+            # 被动取消（用户手动取消），需要重新挂单恢复网格
+            self.logger.warning(
+                "⚠️ 订单被手动取消，正在恢复网格: %s %s@%s (Grid %s, OrderID: %s)",
+                grid_order.side.value, grid_order.amount, grid_order.price, grid_order.grid_id, order_id
             )
 
-            # ✅ 修复：Backpack使用"Filled"表示已成交
-            if status == 'Filled' or event_type == 'orderFilled':
-                # 获取成交价格和数量 - 从data字段中提取
-                filled_price = Decimal(str(data.get('p', grid_order.price)))
-                filled_amount = Decimal(
-                    str(data.get('z', grid_order.amount)))  # 'z'是已成交数量
-
-                grid_order.mark_filled(filled_price, filled_amount)
-
-                # 从挂单列表移除
-                del self._pending_orders[order_id]
+            # 重新挂单需要一次网络往返，放到后台执行，订单更新处理立即返回
+            task = asyncio.create_task(self._recover_grid_order(grid_order))
+            self._recovery_tasks.add(task)
+            task.add_done_callback(self._recovery_tasks.discard)
+
+    async def _recover_grid_order(self, grid_order: GridOrder):
+        """按被取消订单的网格参数重新挂单（后台任务，并发数受 _recovery_sem 限制）"""
+        # 创建新订单（使用相同的网格参数）
+        new_order = GridOrder(
+            order_id="",  # 新订单ID将在提交后获得
+            grid_id=grid_order.grid_id,
+            side=grid_order.side,
+            price=grid_order.price,
+            amount=grid_order.amount,
+            status=GridOrderStatus.PENDING,
+            created_at=datetime.now()
+        )
 
+        try:
+            async with self._recovery_sem:
+                # 提交新订单
+                placed_order = await self.place_order(new_order)
+            if placed_order:
                 self.logger.info(
-                    f"✅ 订单成交: {grid_order.side.value} {filled_amount}@{filled_price} "
-                    f"(Grid {grid_order.grid_id})"
+                    "✅ 网格恢复成功: %s %s@%s (Grid %s, 新OrderID: %s)",
+                    placed_order.side.value, placed_order.amount, placed_order.price,
+                    placed_order.grid_id, placed_order.order_id
+                )
+            else:
+                self.logger.error(
+                    f"❌ 网格恢复失败: Grid {grid_order.grid_id}, "
+                    f"{grid_order.side.value} {grid_order.amount}@{grid_order.price}"
                 )
-
-                # 通知所有回调
-                for callback in self._order_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(grid_order)
-                        else:
-                            callback(grid_order)
-                    except Exception as e:
-                        self.logger.error(f"订单回调执行失败: {e}")
-
-            # 🔥 处理订单取消事件
-            elif status == 'Cancelled' or event_type == 'orderCancelled':
-                # 从挂单列表移除
-                if order_id in self._pending_orders:
-                    del self._pending_orders[order_id]
-
-                # 🔥 关键修复：区分主动取消和被动取消
-                is_expected_cancellation = order_id in self._expected_cancellations
-
-                if is_expected_cancellation:
-                    # 主动取消（剥头皮模式、本金保护等），不重新挂单
-                    self._expected_cancellations.remove(order_id)
-                    self.logger.info(
-                        f"ℹ️ 订单已主动取消，不重新挂单: {grid_order.side.value} {grid_order.amount}@{grid_order.price} "
-                        f"(Grid {grid_order.grid_id}, OrderID: {order_id})"
-                    )
-                else:
-                    # 被动取消（用户手动取消），需要重新挂单恢复网格
-                    self.logger.warning(
-                        f"⚠️ 订单被手动取消，正在恢复网格: {grid_order.side.value} {grid_order.amount}@{grid_order.price} "
-                        f"(Grid {grid_order.grid_id}, OrderID: {order_id})"
-                    )
-
-                    # 创建新订单（使用相同的网格参数）
-                    new_order = GridOrder(
-                        order_id="",  # 新订单ID将在提交后获得
-                        grid_id=grid_order.grid_id,
-                        side=grid_order.side,
-                        price=grid_order.price,
-                        amount=grid_order.amount,
-                        status=GridOrderStatus.PENDING,
-                        created_at=datetime.now()
-                    )
-
-                    try:
-                        # 提交新订单
-                        placed_order = await self.place_order(new_order)
-                        if placed_order:
-                            self.logger.info(
-                                f"✅ 网格恢复成功: {placed_order.side.value} {placed_order.amount}@{placed_order.price} "
-                                f"(Grid {placed_order.grid_id}, 新OrderID: {placed_order.order_id})"
-                            )
-                        else:
-                            self.logger.error(
-                                f"❌ 网格恢复失败: Grid {grid_order.grid_id}, "
-                                f"{grid_order.side.value} {grid_order.amount}@{grid_order.price}"
-                            )
-                    except Exception as e:
-                        self.logger.error(
-                            f"❌ 重新挂单失败: Grid {grid_order.grid_id}, 错误: {e}"
-                        )
-
         except Exception as e:
-            import traceback
-            self.logger.error(f"处理订单更新失败: {e}")
-            self.logger.error(traceback.format_exc())
-
-    def _convert_order_side(self, grid_side: GridOrderSide) -> ExchangeOrderSide:
-        """
-        转换订单方向
-
-        Args:
-            grid_side: 网格订单方向
-
-        Returns:
-            交易所订单方向
-        """
-        if grid_side == GridOrderSide.BUY:
-            return ExchangeOrderSide.BUY
-        else:
-            return ExchangeOrderSide.SELL
+            self.logger.error(
+                f"❌ 重新挂单失败: Grid {grid_order.grid_id}, 错误: {e}"
+            )
 
     async def start(self):
         """启动执行引擎"""
@@ -1364,6 +2015,34 @@ class GridEngineImpl(IGridEngine):
             except asyncio.CancelledError:
                 self.logger.info("健康检查任务已取消")
 
+        # 🔥 取消智能监控任务
+        if self._polling_task and not self._polling_task.done():
+            self._polling_task.cancel()
+            try:
+                await self._polling_task
+            except asyncio.CancelledError:
+                pass  # 任务在进入循环前即被取消（循环内会自行记录停止日志）
+        self._polling_task = None
+
+        # 🔥 停止订单更新消费任务
+        if self._order_update_task and not self._order_update_task.done():
+            self._order_update_task.cancel()
+            try:
+                await self._order_update_task
+            except asyncio.CancelledError:
+                pass
+        self._order_update_task = None
+
+        # 🔥 停止成交回调分发任务、取消未完成的网格恢复任务（避免撤单后又挂出新订单）
+        pending_tasks = set(self._recovery_tasks)
+        if self._fill_dispatch_task and not self._fill_dispatch_task.done():
+            pending_tasks.add(self._fill_dispatch_task)
+        self._fill_dispatch_task = None
+        for task in pending_tasks:
+            task.cancel()
+        if pending_tasks:
+            await asyncio.gather(*pending_tasks, return_exceptions=True)
+
         # 取消所有挂单
         await self.cancel_all_orders()
 
@@ -1391,10 +2070,7 @@ class GridEngineImpl(IGridEngine):
             self.logger.info("📡 使用WebSocket实时监控价格")
 
         except Exception as e:
-            self.logger.error(f"❌ 价格数据流订阅失败: {e}")
-            self.logger.error(f"❌ 错误类型: {type(e).__name__}")
-            import traceback
-            self.logger.error(f"❌ 错误堆栈:\n{traceback.format_exc()}")
+            self.logger.exception(f"❌ 价格数据流订阅失败: {e}")
             self.logger.warning("⚠️ WebSocket价格订阅失败，将使用REST API获取价格")
             self._price_ws_enabled = False
 
@@ -1410,7 +2086,7 @@ class GridEngineImpl(IGridEngine):
             if ticker_data.last is not None:
                 price = ticker_data.last
             elif ticker_data.bid is not None and ticker_data.ask is not None:
-                price = (ticker_data.bid + ticker_data.ask) / Decimal('2')
+                price = (ticker_data.bid + ticker_data.ask) / 2
             elif ticker_data.bid is not None:
                 price = ticker_data.bid
             elif ticker_data.ask is not None:
@@ -1419,11 +2095,10 @@ class GridEngineImpl(IGridEngine):
                 return
 
             # 更新缓存
-            self._current_price = price
-            self._last_price_update_time = time.time()
+            self._price_state = (price, self._now())
 
         except Exception as e:
-            self.logger.error(f"处理价格更新失败: {e}", exc_info=True)
+            self.logger.exception(f"处理价格更新失败: {e}")
 
     def get_price_monitor_mode(self) -> str:
         """
@@ -1432,10 +2107,10 @@ class GridEngineImpl(IGridEngine):
         Returns:
             监控方式：'WebSocket' 或 'REST'
         """
-        if self._price_ws_enabled and self._current_price is not None:
-            price_age = time.time() - self._last_price_update_time
+        cached_price, updated_at = self._price_state
+        if self._price_ws_enabled and cached_price is not None:
             # 如果价格在10秒内更新过，认为WebSocket正常
-            if price_age < 10:
+            if self._now() - updated_at < 10:
                 return "WebSocket"
         return "REST"
 
@@ -1459,39 +2134,44 @@ class GridEngineImpl(IGridEngine):
 
         while self._running:
             try:
-                current_time = time.time()
+                current_time = self._now()
                 time_since_last_check = current_time - self._last_health_check_time
 
-                # 检查是否到达检查间隔
-                if time_since_last_check >= self.config.order_health_check_interval:
-                    self.logger.info(
-                        f"🔍 触发健康检查: 距上次检查={time_since_last_check:.0f}秒, "
-                        f"配置间隔={self.config.order_health_check_interval}秒"
-                    )
+                # 未到检查间隔：精确休眠到下次检查时间（每个间隔只唤醒一次）
+                due_in = self.config.order_health_check_interval - time_since_last_check
+                if due_in > 0:
+                    await asyncio.sleep(max(1.0, due_in))
+                    continue
 
-                    # 🆕 调用新的健康检查模块
-                    if self._health_checker:
-                        try:
-                            await self._health_checker.perform_health_check()
-                            self.logger.info("✅ 健康检查完成")
-                        except Exception as e:
-                            self.logger.error(
-                                f"❌ 健康检查执行失败: {e}", exc_info=True)
-                    else:
-                        self.logger.error("⚠️ 健康检查器未初始化")
+                self.logger.info(
+                    f"🔍 触发健康检查: 距上次检查={time_since_last_check:.0f}秒, "
+                    f"配置间隔={self.config.order_health_check_interval}秒"
+                )
+
+                # 🆕 调用新的健康检查模块
+                if self._health_checker:
+                    try:
+                        await self._health_checker.perform_health_check()
+                        self.logger.info("✅ 健康检查完成")
+                    except Exception as e:
+                        self.logger.exception(
+                            f"❌ 健康检查执行失败: {e}")
+                else:
+                    self.logger.error("⚠️ 健康检查器未初始化")
 
-                    self._last_health_check_time = current_time
+                self._last_health_check_time = current_time
 
-                # 休眠一段时间再检查（避免频繁循环）
-                await asyncio.sleep(60)  # 每分钟检查一次是否到达间隔时间
+                # 清理长时间未收到确认的主动取消记录
+                pruned = self._expected_cancellations.prune(
+                    self._EXPECTED_CANCEL_TTL)
+                if pruned:
+                    self.logger.debug("清理过期的主动取消记录: %d 个", pruned)
 
             except asyncio.CancelledError:
                 self.logger.info("订单健康检查已停止")
                 break
             except Exception as e:
-                self.logger.error(f"订单健康检查出错: {e}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception(f"订单健康检查出错: {e}")
                 await asyncio.sleep(60)  # 出错后等待1分钟再继续
 
     def _notify_health_check_complete(self, filled_count: int):
@@ -1504,14 +2184,9 @@ class GridEngineImpl(IGridEngine):
             filled_count: 成功补充的订单数量
         """
         try:
-            # 统计当前订单状态（注意：GridOrderSide的值是小写 'buy' 和 'sell'）
-            # 🔥 使用 get_pending_orders() 获取去重后的订单列表
-            pending_orders = self.get_pending_orders()
-            buy_count = sum(1 for o in pending_orders
-                            if o.side.value.lower() == 'buy')
-            sell_count = sum(1 for o in pending_orders
-                             if o.side.value.lower() == 'sell')
-            total_count = len(pending_orders)
+            # 统计当前订单状态（增量维护的去重计数）
+            buy_count, sell_count = self.get_pending_order_counts()
+            total_count = buy_count + sell_count
 
             self.logger.info(
                 f"📊 健康检查后订单统计: "
@@ -1523,7 +2198,7 @@ class GridEngineImpl(IGridEngine):
             # 所以我们更新时间戳，让get_statistics时自动同步
             if filled_count > 0:
                 self._last_health_repair_count = filled_count
-                self._last_health_repair_time = time.time()
+                self._last_health_repair_time = self._now()
 
                 # 记录详细日志便于调试
                 self.logger.info(
@@ -1545,61 +2220,53 @@ class GridEngineImpl(IGridEngine):
             确保终端UI显示正确的订单数量
         """
         try:
-            from ..models import GridOrder, GridOrderSide, GridOrderStatus
-            from datetime import datetime
-
-            # 构建交易所订单ID集合（用于对比）
-            exchange_order_ids = {
-                order.id for order in exchange_orders if order.id}
+            # 按订单ID索引交易所订单（用于集合差运算）
+            exchange_by_id = {
+                order.id: order for order in exchange_orders if order.id}
 
             # 1. 移除本地缓存中不存在于交易所的订单（可能已成交或取消）
-            removed_count = 0
-            for order_id in list(self._pending_orders.keys()):
-                if order_id not in exchange_order_ids:
-                    del self._pending_orders[order_id]
-                    removed_count += 1
+            stale_ids = self._pending_orders.keys() - exchange_by_id.keys()
+            for order_id in stale_ids:
+                self._drop_pending_key(order_id)
+            removed_count = len(stale_ids)
 
             if removed_count > 0:
-                self.logger.debug(f"🗑️ 清理本地缓存：移除{removed_count}个已不存在的订单")
+                self.logger.debug("🗑️ 清理本地缓存：移除%d个已不存在的订单", removed_count)
 
-            # 2. 将交易所订单添加到本地缓存（如果本地没有）
+            # 2. 将交易所订单添加到本地缓存（本地没有的订单）
             added_count = 0
-            for ex_order in exchange_orders:
-                if not ex_order.id:
-                    continue
-
-                # 如果本地缓存中没有这个订单，添加它
-                if ex_order.id not in self._pending_orders:
-                    try:
-                        # 映射到网格ID
-                        grid_id = self.config.get_grid_index_by_price(
-                            ex_order.price)
-
-                        # 转换订单方向
-                        side = GridOrderSide.BUY if ex_order.side.value.lower() == 'buy' else GridOrderSide.SELL
-
-                        # 创建GridOrder对象
-                        grid_order = GridOrder(
-                            order_id=ex_order.id,
-                            grid_id=grid_id,
-                            side=side,
-                            price=ex_order.price,
-                            amount=ex_order.amount,
-                            status=GridOrderStatus.PENDING,
-                            created_at=datetime.now()
-                        )
+            for order_id in exchange_by_id.keys() - self._pending_orders.keys():
+                ex_order = exchange_by_id[order_id]
+                try:
+                    # 映射到网格ID
+                    grid_id = self.config.get_grid_index_by_price(
+                        ex_order.price)
+
+                    # 转换订单方向
+                    side = _SIDE_FROM_EXCHANGE.get(ex_order.side, GridOrderSide.SELL)
+
+                    # 创建GridOrder对象
+                    grid_order = GridOrder(
+                        order_id=ex_order.id,
+                        grid_id=grid_id,
+                        side=side,
+                        price=ex_order.price,
+                        amount=ex_order.amount,
+                        status=GridOrderStatus.PENDING,
+                        created_at=datetime.now()
+                    )
 
-                        # 添加到本地缓存
-                        self._pending_orders[ex_order.id] = grid_order
-                        added_count += 1
+                    # 添加到本地缓存
+                    self._add_pending_key(ex_order.id, grid_order)
+                    added_count += 1
 
-                    except Exception as e:
-                        self.logger.warning(
-                            f"⚠️ 同步订单{ex_order.id[:10]}...失败: {e}")
+                except Exception as e:
+                    self.logger.warning(
+                        f"⚠️ 同步订单{ex_order.id[:10]}...失败: {e}")
 
             # 3. 统计同步结果
-            # 🔥 使用 get_pending_orders() 获取去重后的订单数量
-            total_local = len(self.get_pending_orders())
+            # _unique_orders 即去重后的订单（O(1) 计数）
+            total_local = len(self._unique_orders)
             total_exchange = len(exchange_orders)
 
             self.logger.info(
@@ -1615,6 +2282,4 @@ class GridEngineImpl(IGridEngine):
                 )
 
         except Exception as e:
-            self.logger.error(f"❌ 同步订单失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 同步订单失败: {e}")
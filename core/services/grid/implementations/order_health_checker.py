@@ -106,17 +106,13 @@ class OrderHealthChecker:
                     self.logger.debug("📊 健康检查: REST API显示无持仓")
 
             except Exception as rest_error:
-                self.logger.error(f"❌ REST API获取持仓失败: {rest_error}")
-                import traceback
-                self.logger.error(traceback.format_exc())
+                self.logger.exception(f"❌ REST API获取持仓失败: {rest_error}")
                 positions = []
 
             return orders, positions
 
         except Exception as e:
-            self.logger.error(f"获取订单和持仓失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"获取订单和持仓失败: {e}")
             return [], []
 
     def _calculate_expected_position(self, total_grids: int, current_buy_orders: int, current_sell_orders: int) -> Decimal:
@@ -506,9 +502,7 @@ class OrderHealthChecker:
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ 持仓调整失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 持仓调整失败: {e}")
             return False
 
     async def _close_position(self, side: PositionSide, amount: Decimal, current_price: Decimal):
@@ -1194,9 +1188,7 @@ class OrderHealthChecker:
             self.logger.debug(">" * 80)
 
         except Exception as e:
-            self.logger.error(f"❌ 订单健康检查失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 订单健康检查失败: {e}")
 
     def _calculate_actual_range_from_orders(self, orders: List) -> Dict:
         """
@@ -1845,9 +1837,7 @@ class OrderHealthChecker:
                 )
 
         except Exception as e:
-            self.logger.error(f"❌ 补充缺失网格失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 补充缺失网格失败: {e}")
 
     async def _sync_orders_to_engine(self, exchange_orders: List):
         """
@@ -1938,7 +1928,5 @@ class OrderHealthChecker:
             return [position]
 
         except Exception as e:
-            self.logger.error(f"❌ 查询现货持仓失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"❌ 查询现货持仓失败: {e}")
             return []
@@ -48,11 +48,15 @@ class GridConfig:
 
     # 计算得出的参数
     grid_count: int = field(init=False)     # 网格数量（自动计算或用户指定）
+    base_asset: str = field(init=False)     # 基础资产名称（如 "BTC"，由symbol解析）
 
     # 可选参数
     max_position: Optional[Decimal] = None  # 最大持仓限制
     enable_notifications: bool = True        # 是否启用通知
     order_health_check_interval: int = 300   # 订单健康检查间隔（秒，默认5分钟）
+    place_concurrency: int = 20              # 批量下单时同时在途的下单请求数上限
+    place_rate_limit: float = 50.0           # 批量下单每秒最多发出的下单请求数（0表示不限速）
+    rest_poll_interval: float = 3.0          # WebSocket不可用时REST轮询的最小间隔（秒）
     fee_rate: Decimal = Decimal('0.0001')    # 手续费率（默认万分之1）
 
     # 交易精度参数（重要！）
@@ -134,6 +138,9 @@ class GridConfig:
         # 初始化 logger
         self.logger = get_logger(self.__class__.__name__)
 
+        # 基础资产名称（日志等频繁使用，只解析一次）
+        self.base_asset = self.symbol.split('_')[0]
+
         # 🔥 价格移动网格：使用用户指定的网格数量
         if self.is_follow_mode():
             if self.follow_grid_count is None:
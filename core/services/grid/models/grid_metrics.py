@@ -73,6 +73,7 @@ class GridStatistics:
 
     # 监控方式
     monitoring_mode: str = "WebSocket"      # 订单监控方式：WebSocket 或 REST轮询
+    order_update_backpressure: int = 0      # 订单更新队列已满、WebSocket接收等待的次数
     # 持仓数据来源：WebSocket缓存 / PositionTracker / REST API
     position_data_source: str = "PositionTracker"
 
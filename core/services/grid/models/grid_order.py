@@ -4,6 +4,7 @@
 定义网格交易订单的数据结构
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -25,7 +26,11 @@ class GridOrderStatus(Enum):
     FAILED = "failed"          # 失败
 
 
-@dataclass
+# Python 3.10+ 使用 __slots__ 存储字段（属性访问更快、单个实例内存更小）
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GridOrder:
     """
     网格订单
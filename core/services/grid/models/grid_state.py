@@ -187,6 +187,42 @@ class GridState:
         
         self.last_update_at = datetime.now()
     
+    def add_orders_bulk(self, orders: List[GridOrder]) -> int:
+        """
+        批量添加订单（已存在的订单ID会被跳过）
+        
+        Args:
+            orders: 订单列表
+        
+        Returns:
+            实际新增的订单数量
+        """
+        new_orders = {
+            order.order_id: order for order in orders
+            if order.order_id not in self.active_orders
+        }
+        if not new_orders:
+            return 0
+        
+        self.active_orders.update(new_orders)
+        
+        buy_count = 0
+        for order in new_orders.values():
+            level = self.grid_levels.get(order.grid_id)
+            if level is not None:
+                level.set_order(order)
+            if order.is_buy_order():
+                buy_count += 1
+        
+        sell_count = len(new_orders) - buy_count
+        self.total_buy_orders += buy_count
+        self.pending_buy_orders += buy_count
+        self.total_sell_orders += sell_count
+        self.pending_sell_orders += sell_count
+        
+        self.last_update_at = datetime.now()
+        return len(new_orders)
+    
     def mark_order_filled(self, order_id: str, filled_price: Decimal, filled_amount: Decimal):
         """标记订单已成交"""
         if order_id not in self.active_orders:
@@ -4,6 +4,7 @@
 负责管理剥头皮模式的触发、止盈订单、退出逻辑
 """
 
+import asyncio
 from typing import Optional, Tuple, Dict
 from decimal import Decimal
 from datetime import datetime
@@ -35,6 +36,7 @@ class ScalpingManager:
 
         # 剥头皮状态
         self._is_scalping_active = False
+        self._active_event = asyncio.Event()  # 与 _is_scalping_active 同步，供调用方等待/快速判断
         self._trigger_grid = config.get_scalping_trigger_grid()
 
         # 持仓信息
@@ -60,6 +62,11 @@ class ScalpingManager:
         """是否处于剥头皮模式"""
         return self._is_scalping_active
 
+    @property
+    def active_event(self) -> asyncio.Event:
+        """剥头皮激活事件（激活时set，停用/重置时clear）"""
+        return self._active_event
+
     def should_trigger(self, current_price: Decimal, current_grid_index: int) -> bool:
         """
         判断是否应该触发剥头皮模式
@@ -154,11 +161,13 @@ class ScalpingManager:
     def activate(self):
         """激活剥头皮模式"""
         self._is_scalping_active = True
+        self._active_event.set()
         self.logger.info("✅ 剥头皮模式已激活")
 
     def deactivate(self):
         """停用剥头皮模式"""
         self._is_scalping_active = False
+        self._active_event.clear()
         self._take_profit_order = None
         self._take_profit_grid_index = 0
         self.logger.info("⏸️  剥头皮模式已停用")
@@ -424,6 +433,7 @@ class ScalpingManager:
         在网格重置时调用，清除所有状态
         """
         self._is_scalping_active = False
+        self._active_event.clear()
         self._trigger_grid = self.config.get_scalping_trigger_grid()
         self._current_position = Decimal('0')
         self._average_cost_price = Decimal('0')
@@ -399,9 +399,7 @@ class GridTerminalUI:
             return (liquidation_price, distance_percent, risk_level)
 
         except Exception as e:
-            self.logger.error(f"计算爆仓价格失败: {e}")
-            import traceback
-            self.logger.error(traceback.format_exc())
+            self.logger.exception(f"计算爆仓价格失败: {e}")
             return (None, 0.0, 'N/A')
 
     def _calculate_long_liquidation(self, equity: Decimal, position: Decimal,
@@ -936,9 +934,7 @@ class GridTerminalUI:
                             self.logger.info("✅ 首次界面更新成功，UI已启动！")
                             loop_started = True
                     except Exception as e:
-                        self.logger.error(f"❌ 更新界面失败: {e}")
-                        import traceback
-                        self.logger.error(f"详细错误: {traceback.format_exc()}")
+                        self.logger.exception(f"❌ 更新界面失败: {e}")
                         # 继续运行，不要因为单次更新失败而停止
 
                     # 休眠
@@ -29,6 +29,12 @@ from decimal import Decimal
 import argparse
 import logging
 
+try:
+    # 可选：uvloop 事件循环（C实现，I/O与任务切换更快；Windows不支持）
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # 添加项目根目录到路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -144,6 +150,16 @@ def create_grid_config(config_data: dict) -> GridConfig:
     if 'spot_reserve' in grid_config:
         params['spot_reserve'] = grid_config['spot_reserve']
 
+    # 批量下单并发上限
+    if 'place_concurrency' in grid_config:
+        params['place_concurrency'] = int(grid_config['place_concurrency'])
+    if 'place_rate_limit' in grid_config:
+        params['place_rate_limit'] = float(grid_config['place_rate_limit'])
+
+    # REST轮询最小间隔（WebSocket不可用时）
+    if 'rest_poll_interval' in grid_config:
+        params['rest_poll_interval'] = float(grid_config['rest_poll_interval'])
+
     # 🔥 健康检查容错配置
     if 'position_tolerance' in grid_config:
         params['position_tolerance'] = grid_config['position_tolerance']
@@ -694,8 +710,11 @@ if __name__ == "__main__":
             print("=" * 70)
             print()
 
-        # 运行主程序
-        asyncio.run(main(config_path, debug=args.debug))
+        # 运行主程序（已安装 uvloop 时使用 uvloop 事件循环）
+        if uvloop is not None:
+            uvloop.run(main(config_path, debug=args.debug))
+        else:
+            asyncio.run(main(config_path, debug=args.debug))
 
     except KeyboardInterrupt:
         print("\n👋 程序已退出")
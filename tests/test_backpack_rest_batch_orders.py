@@ -0,0 +1,101 @@
+"""
+Backpack REST 批量下单测试（POST /api/v1/orders 的签名与结果解析）
+"""
+
+import asyncio
+import base64
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from core.adapters.exchanges.adapters.backpack_rest import BackpackRest
+from core.adapters.exchanges.models import OrderData, OrderSide, OrderType
+
+_SECRET = base64.b64encode(bytes(range(32))).decode()
+
+
+def _make_rest() -> BackpackRest:
+    return BackpackRest(SimpleNamespace(api_key='test-key', api_secret=_SECRET))
+
+
+def test_batch_payload_signing_string():
+    """列表请求体：每个订单以 instruction 开头、键按字母序拼接，None 值不参与签名"""
+    signing = pytest.importorskip("nacl.signing")
+
+    rest = _make_rest()
+    payload = [
+        {'symbol': 'SOL_USDC_PERP', 'side': 'Bid', 'orderType': 'Limit',
+         'quantity': '0.1', 'price': '100'},
+        {'symbol': 'SOL_USDC_PERP', 'side': 'Ask', 'orderType': 'Limit',
+         'quantity': '0.2', 'price': '101', 'clientId': None},
+    ]
+    headers = rest._generate_signature('POST', '/api/v1/orders', data=payload)
+
+    expected = (
+        "instruction=orderExecute&orderType=Limit&price=100&quantity=0.1"
+        "&side=Bid&symbol=SOL_USDC_PERP"
+        "&instruction=orderExecute&orderType=Limit&price=101&quantity=0.2"
+        "&side=Ask&symbol=SOL_USDC_PERP"
+        f"&timestamp={headers['X-TIMESTAMP']}&window={headers['X-WINDOW']}"
+    )
+    verify_key = signing.SigningKey(base64.b64decode(_SECRET)).verify_key
+    # 签名与期望的签名字符串不一致时抛出 BadSignatureError
+    verify_key.verify(expected.encode('utf-8'),
+                      base64.b64decode(headers['X-SIGNATURE']))
+
+
+def test_create_orders_batch_posts_one_request_and_keeps_rejections_per_slot():
+    """一次请求提交全部订单；被拒绝的订单在对应位置返回异常"""
+    rest = _make_rest()
+    rest._market_info = {'SOL_USDC_PERP': {}}
+    rest._precision_cache['SOL_USDC_PERP'] = (2, 2)
+
+    requests = []
+
+    async def fake_request(method, endpoint, params=None, data=None):
+        requests.append((method, endpoint, data))
+        return [
+            {'id': '111', 'symbol': 'SOL_USDC_PERP', 'side': 'Bid',
+             'orderType': 'Limit', 'quantity': '0.1', 'price': '100.5',
+             'executedQuantity': '0', 'status': 'New'},
+            {'code': 'INSUFFICIENT_MARGIN', 'message': 'Insufficient margin'},
+        ]
+
+    rest._make_authenticated_request = fake_request
+
+    orders = [
+        {'side': OrderSide.BUY, 'order_type': OrderType.LIMIT,
+         'amount': Decimal('0.1'), 'price': Decimal('100.50'), 'params': None},
+        {'side': OrderSide.SELL, 'order_type': OrderType.LIMIT,
+         'amount': Decimal('0.1'), 'price': Decimal('102'), 'params': None},
+    ]
+    results = asyncio.run(rest.create_orders_batch('SOL_USDC_PERP', orders))
+
+    assert len(requests) == 1
+    method, endpoint, data = requests[0]
+    assert (method, endpoint) == ('POST', '/api/v1/orders')
+    assert data == [
+        {'symbol': 'SOL_USDC_PERP', 'side': 'Bid', 'orderType': 'Limit',
+         'quantity': '0.1', 'price': '100.5'},
+        {'symbol': 'SOL_USDC_PERP', 'side': 'Ask', 'orderType': 'Limit',
+         'quantity': '0.1', 'price': '102'},
+    ]
+    assert isinstance(results[0], OrderData) and results[0].id == '111'
+    assert isinstance(results[1], Exception)
+
+
+def test_create_orders_batch_rejects_mismatched_response():
+    """返回条目数与请求不一致时整体失败（无法按位置对应订单）"""
+    rest = _make_rest()
+    rest._market_info = {'SOL_USDC_PERP': {}}
+
+    async def fake_request(method, endpoint, params=None, data=None):
+        return []
+
+    rest._make_authenticated_request = fake_request
+
+    orders = [{'side': OrderSide.BUY, 'order_type': OrderType.LIMIT,
+               'amount': Decimal('0.1'), 'price': Decimal('100'), 'params': None}]
+    with pytest.raises(ValueError):
+        asyncio.run(rest.create_orders_batch('SOL_USDC_PERP', orders))
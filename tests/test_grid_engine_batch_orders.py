@@ -0,0 +1,122 @@
+"""
+网格执行引擎批量下单测试
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from core.services.grid.implementations.grid_engine_impl import GridEngineImpl
+from core.services.grid.models import GridOrder, GridOrderSide, GridOrderStatus
+
+
+class _FakeExchange:
+    """按顺序分配订单ID的交易所替身；immediate_fill 为真时下单即推送成交"""
+
+    def __init__(self):
+        self.config = SimpleNamespace(exchange_id='backpack')
+        self.engine = None
+        self.immediate_fill = False
+        self.created = 0
+
+    async def create_order(self, symbol, side, order_type, amount, price, params=None, batch_mode=False):
+        self.created += 1
+        order_id = f"order-{self.created}"
+        if self.immediate_fill:
+            # 模拟WebSocket终态推送先于下单响应到达
+            self.engine._notify_order_terminal("FILLED", order_id)
+        return SimpleNamespace(id=order_id, order_id=None)
+
+
+def _make_engine(exchange: _FakeExchange) -> GridEngineImpl:
+    engine = GridEngineImpl(exchange)
+    exchange.engine = engine
+    # 以下字段正常由 initialize() 按配置设置
+    engine.config = SimpleNamespace(symbol='SOL_USDC_PERP')
+    engine._is_lighter = False
+    engine._ws_monitoring_enabled = True
+    engine._place_sem = asyncio.Semaphore(20)
+    engine._place_rate = None
+    return engine
+
+
+def _grid_order(grid_id: int, side: GridOrderSide) -> GridOrder:
+    return GridOrder(
+        order_id="",
+        grid_id=grid_id,
+        side=side,
+        price=Decimal('100') + grid_id,
+        amount=Decimal('0.1'),
+        status=GridOrderStatus.PENDING,
+        created_at=datetime.now()
+    )
+
+
+def test_fill_callback_can_place_batch_orders_without_deadlock():
+    """立即成交的回调中再次批量下单（如反向挂单/网格重建）不会因批量锁死锁"""
+
+    async def scenario():
+        exchange = _FakeExchange()
+        engine = _make_engine(exchange)
+        nested_results = []
+
+        async def on_filled(order):
+            # 回调重入时批量锁必须已释放
+            assert not engine._batch_lock.locked()
+            exchange.immediate_fill = False
+            reverse = _grid_order(order.grid_id + 1, GridOrderSide.SELL)
+            nested_results.extend(
+                await engine.place_batch_orders([reverse], max_retries=0))
+
+        engine.subscribe_order_updates(on_filled)
+
+        exchange.immediate_fill = True
+        placed = await asyncio.wait_for(
+            engine.place_batch_orders([_grid_order(1, GridOrderSide.BUY)], max_retries=0),
+            timeout=5.0)
+        return engine, placed, nested_results
+
+    engine, placed, nested_results = asyncio.run(scenario())
+
+    assert placed[0].status == GridOrderStatus.FILLED
+    assert [order.order_id for order in nested_results] == ['order-2']
+    assert 'order-2' in engine._pending_orders
+    assert engine._batch_terminal_status is None
+    assert engine._batch_deferred_fills is None
+
+
+def test_overlapping_batches_are_serialized():
+    """并发的批量下单依次进入批量窗口，各批次的下单请求不交错"""
+
+    class _SlowExchange(_FakeExchange):
+        def __init__(self):
+            super().__init__()
+            self.events = []
+
+        async def create_order(self, symbol, side, order_type, amount, price, params=None, batch_mode=False):
+            self.events.append(('start', price))
+            await asyncio.sleep(0.01)
+            self.events.append(('end', price))
+            return await super().create_order(symbol, side, order_type, amount, price, params, batch_mode)
+
+    async def scenario():
+        exchange = _SlowExchange()
+        engine = _make_engine(exchange)
+        first = [_grid_order(n, GridOrderSide.BUY) for n in (1, 2)]
+        second = [_grid_order(n, GridOrderSide.SELL) for n in (10, 11)]
+        results = await asyncio.wait_for(
+            asyncio.gather(engine.place_batch_orders(first, max_retries=0),
+                           engine.place_batch_orders(second, max_retries=0)),
+            timeout=5.0)
+        return engine, exchange.events, results
+
+    engine, events, results = asyncio.run(scenario())
+
+    first_prices = {Decimal('101'), Decimal('102')}
+    # 第一批全部结束后第二批才开始
+    batch_of = [price in first_prices for _, price in events]
+    assert batch_of == [batch_of[0]] * 4 + [not batch_of[0]] * 4
+    assert [len(placed) for placed in results] == [2, 2]
+    assert len(engine._pending_orders) == 4
+    assert engine._batch_terminal_status is None
@@ -0,0 +1,113 @@
+"""
+网格执行引擎批量取消订单测试
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from core.services.grid.implementations.grid_engine_impl import GridEngineImpl
+from core.services.grid.models import GridOrder, GridOrderSide, GridOrderStatus
+
+
+class _CancelExchange:
+    """记录取消请求的交易所替身；failing 中的订单取消失败"""
+
+    def __init__(self, failing=()):
+        self.config = SimpleNamespace(exchange_id='backpack')
+        self.failing = set(failing)
+        self.cancelled = []
+
+    async def cancel_order(self, order_id, symbol):
+        if order_id in self.failing:
+            raise RuntimeError(f"cancel rejected: {order_id}")
+        self.cancelled.append(order_id)
+
+
+class _BatchCancelExchange(_CancelExchange):
+    """提供 batch_cancel_orders 的交易所替身"""
+
+    def __init__(self, fail_batch=False):
+        super().__init__()
+        self.fail_batch = fail_batch
+        self.batches = []
+
+    async def batch_cancel_orders(self, order_ids, symbol):
+        if self.fail_batch:
+            raise RuntimeError("batch cancel rejected")
+        self.batches.append((list(order_ids), symbol))
+
+
+def _make_engine(exchange) -> GridEngineImpl:
+    engine = GridEngineImpl(exchange)
+    # 正常由 initialize() 按配置设置
+    engine.config = SimpleNamespace(symbol='SOL_USDC_PERP')
+    return engine
+
+
+def _track(engine: GridEngineImpl, order_id: str) -> GridOrder:
+    order = GridOrder(
+        order_id=order_id,
+        grid_id=1,
+        side=GridOrderSide.BUY,
+        price=Decimal('100'),
+        amount=Decimal('0.1'),
+        status=GridOrderStatus.PENDING,
+        created_at=datetime.now()
+    )
+    engine._add_pending_key(order_id, order)
+    return order
+
+
+def test_cancel_orders_uses_single_batch_request():
+    """适配器支持批量取消时只发一次请求，并将订单标记为已取消、移出追踪"""
+    exchange = _BatchCancelExchange()
+    engine = _make_engine(exchange)
+    orders = [_track(engine, f'order-{n}') for n in range(3)]
+    order_ids = [order.order_id for order in orders]
+
+    count = asyncio.run(engine.cancel_orders(order_ids))
+
+    assert count == 3
+    assert exchange.batches == [(order_ids, 'SOL_USDC_PERP')]
+    assert exchange.cancelled == []
+    assert all(order.status == GridOrderStatus.CANCELLED for order in orders)
+    assert not any(order_id in engine._pending_orders for order_id in order_ids)
+    # 主动取消记录保留，用于识别随后到达的WebSocket取消事件
+    assert all(order_id in engine._expected_cancellations for order_id in order_ids)
+
+
+def test_cancel_orders_falls_back_to_individual_cancels():
+    """无批量接口时逐个取消，返回值只计入成功的订单"""
+    exchange = _CancelExchange(failing={'order-1'})
+    engine = _make_engine(exchange)
+    orders = [_track(engine, f'order-{n}') for n in range(3)]
+
+    count = asyncio.run(engine.cancel_orders([order.order_id for order in orders]))
+
+    assert count == 2
+    assert sorted(exchange.cancelled) == ['order-0', 'order-2']
+    assert orders[1].status == GridOrderStatus.PENDING
+    assert 'order-1' in engine._pending_orders
+
+
+def test_cancel_orders_batch_failure_returns_zero_and_keeps_tracking():
+    """批量取消失败时不抛异常，返回0且订单保持追踪"""
+    exchange = _BatchCancelExchange(fail_batch=True)
+    engine = _make_engine(exchange)
+    order = _track(engine, 'order-0')
+
+    count = asyncio.run(engine.cancel_orders(['order-0']))
+
+    assert count == 0
+    assert order.status == GridOrderStatus.PENDING
+    assert 'order-0' in engine._pending_orders
+
+
+def test_cancel_orders_empty_list_skips_exchange():
+    exchange = _BatchCancelExchange()
+    engine = _make_engine(exchange)
+
+    assert asyncio.run(engine.cancel_orders([])) == 0
+    assert exchange.batches == []
@@ -0,0 +1,79 @@
+"""
+网格执行引擎辅助结构测试（主动取消记录集合、令牌桶限速器）
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from core.services.grid.implementations import grid_engine_impl
+from core.services.grid.implementations.grid_engine_impl import _LRUSet, _TokenBucket
+
+
+def _fake_clock(monkeypatch, start: float = 1000.0):
+    """替换模块内的单调时钟，返回可手动推进的时间值"""
+    now = [start]
+    monkeypatch.setattr(grid_engine_impl, 'time',
+                        SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_lru_set_evicts_oldest_when_full():
+    """超出容量时淘汰最早加入的元素；重复加入会刷新顺序"""
+    items = _LRUSet(maxsize=3)
+    items.update(['a', 'b', 'c'])
+    items.add('a')
+    items.add('d')
+
+    assert 'b' not in items
+    assert all(key in items for key in ('a', 'c', 'd'))
+    assert len(items) == 3
+
+
+def test_lru_set_pop_and_discard():
+    """pop 返回移除前是否存在；discard 对不存在的元素不报错"""
+    items = _LRUSet()
+    items.add('order-1')
+
+    assert items.pop('order-1') is True
+    assert items.pop('order-1') is False
+    items.discard('order-1')
+    assert len(items) == 0
+
+
+def test_lru_set_prune_removes_only_expired(monkeypatch):
+    """prune 只淘汰超过存活时间的元素，并返回淘汰数量"""
+    now = _fake_clock(monkeypatch)
+    items = _LRUSet()
+    items.add('old-1')
+    items.add('old-2')
+    now[0] += 100
+    items.add('new')
+    now[0] += 50
+
+    assert items.prune(max_age=120) == 2
+    assert 'new' in items and 'old-1' not in items and 'old-2' not in items
+    assert items.prune(max_age=120) == 0
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    """一秒容量内的请求立即放行，令牌耗尽后按速率等待"""
+
+    async def scenario():
+        bucket = _TokenBucket(rate=20)
+        start = time.monotonic()
+        for _ in range(20):
+            await bucket.acquire()
+        burst = time.monotonic() - start
+
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        throttled = time.monotonic() - start
+        return burst, throttled
+
+    burst, throttled = asyncio.run(scenario())
+
+    assert burst < 0.05
+    # 两个令牌按 20/秒 补充约需 0.1 秒
+    assert throttled >= 0.08
@@ -0,0 +1,120 @@
+"""
+网格执行引擎 WebSocket 订单更新队列测试
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from core.services.grid.implementations.grid_engine_impl import GridEngineImpl
+from core.services.grid.models import GridOrder, GridOrderSide, GridOrderStatus
+
+
+def _make_engine(queue_size: int) -> GridEngineImpl:
+    exchange = SimpleNamespace(config=SimpleNamespace(exchange_id='backpack'))
+    engine = GridEngineImpl(exchange)
+    engine._ORDER_UPDATE_QUEUE_SIZE = queue_size
+    return engine
+
+
+def test_fill_survives_order_update_queue_overflow():
+    """队列溢出时WebSocket回调等待入队，成交事件不丢失，回调仍被触发"""
+
+    async def scenario():
+        engine = _make_engine(queue_size=2)
+        order = GridOrder(
+            order_id='fill-1',
+            grid_id=3,
+            side=GridOrderSide.BUY,
+            price=Decimal('100'),
+            amount=Decimal('0.1'),
+            status=GridOrderStatus.PENDING,
+            created_at=datetime.now()
+        )
+        engine._add_pending_key(order.order_id, order)
+
+        filled = []
+        filled_event = asyncio.Event()
+
+        async def on_filled(grid_order):
+            filled.append(grid_order)
+            filled_event.set()
+
+        engine.subscribe_order_updates(on_filled)
+        engine._start_order_update_consumer()
+
+        # 非监控订单的推送先占满队列，成交推送排在最后
+        updates = [{'e': 'orderAccepted', 'i': f'other-{n}', 'X': 'New'}
+                   for n in range(10)]
+        updates.append({'e': 'orderFilled', 'i': 'fill-1', 'X': 'Filled',
+                        'p': '100', 'z': '0.1'})
+        await asyncio.gather(
+            *(engine._enqueue_order_update(update) for update in updates))
+
+        await asyncio.wait_for(filled_event.wait(), timeout=1.0)
+        engine._order_update_task.cancel()
+        engine._fill_dispatch_task.cancel()
+        return engine, order, filled
+
+    engine, order, filled = asyncio.run(scenario())
+
+    assert filled == [order]
+    assert order.status == GridOrderStatus.FILLED
+    assert 'fill-1' not in engine._pending_orders
+    assert engine.get_order_update_backpressure_count() > 0
+
+
+def test_websocket_fill_callbacks_run_in_arrival_order():
+    """连续成交的回调按到达顺序逐个执行，且不阻塞后续订单更新的处理"""
+
+    async def scenario():
+        engine = _make_engine(queue_size=16)
+        orders = []
+        for n in range(3):
+            order = GridOrder(
+                order_id=f'fill-{n}',
+                grid_id=n + 1,
+                side=GridOrderSide.BUY,
+                price=Decimal('100') - n,
+                amount=Decimal('0.1'),
+                status=GridOrderStatus.PENDING,
+                created_at=datetime.now()
+            )
+            engine._add_pending_key(order.order_id, order)
+            orders.append(order)
+
+        events = []
+        all_done = asyncio.Event()
+
+        async def on_filled(grid_order):
+            events.append(('start', grid_order.order_id))
+            # 回调执行期间，后续成交已被消费任务处理（状态已更新）
+            await asyncio.sleep(0.05)
+            events.append(('end', grid_order.order_id))
+            if len(events) == 2 * len(orders):
+                all_done.set()
+
+        engine.subscribe_order_updates(on_filled)
+        engine._start_order_update_consumer()
+
+        for order in orders:
+            await engine._enqueue_order_update(
+                {'e': 'orderFilled', 'i': order.order_id, 'X': 'Filled',
+                 'p': str(order.price), 'z': '0.1'})
+
+        # 第一个回调尚未结束时，所有成交均已完成状态更新
+        await asyncio.sleep(0.01)
+        all_marked = all(order.status == GridOrderStatus.FILLED for order in orders)
+
+        await asyncio.wait_for(all_done.wait(), timeout=1.0)
+        engine._order_update_task.cancel()
+        engine._fill_dispatch_task.cancel()
+        return events, all_marked
+
+    events, all_marked = asyncio.run(scenario())
+
+    assert all_marked
+    assert events == [
+        (phase, f'fill-{n}') for n in range(3) for phase in ('start', 'end')
+    ]
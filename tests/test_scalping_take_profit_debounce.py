@@ -0,0 +1,101 @@
+"""
+剥头皮止盈订单更新防抖测试
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from core.services.grid.coordinator import scalping_operations
+from core.services.grid.coordinator.scalping_operations import ScalpingOperations
+
+
+def _make_ops(monkeypatch, debounce: float = 0.02) -> ScalpingOperations:
+    monkeypatch.setattr(scalping_operations, '_TP_UPDATE_DEBOUNCE', debounce)
+    active_event = asyncio.Event()
+    active_event.set()
+    engine = SimpleNamespace(exchange=SimpleNamespace())
+    config = SimpleNamespace(symbol='SOL_USDC_PERP')
+    return ScalpingOperations(
+        coordinator=SimpleNamespace(),
+        scalping_manager=SimpleNamespace(active_event=active_event),
+        engine=engine,
+        state=SimpleNamespace(),
+        tracker=SimpleNamespace(),
+        strategy=SimpleNamespace(),
+        config=config
+    )
+
+
+def test_burst_of_updates_runs_take_profit_update_once(monkeypatch):
+    """防抖窗口内的连续调用合并为一次更新，窗口结束后的调用重新调度"""
+
+    async def scenario():
+        ops = _make_ops(monkeypatch)
+        calls = []
+
+        async def update_now():
+            calls.append(asyncio.get_running_loop().time())
+
+        ops._update_take_profit_order_now = update_now
+
+        for _ in range(5):
+            await ops.update_take_profit_order_if_needed()
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.05)
+        burst_calls = len(calls)
+
+        await ops.update_take_profit_order_if_needed()
+        await asyncio.sleep(0.05)
+        return burst_calls, len(calls), len(ops._tp_update_tasks)
+
+    burst_calls, total_calls, remaining = asyncio.run(scenario())
+
+    assert burst_calls == 1
+    assert total_calls == 2
+    # 已完成的任务不再被引用
+    assert remaining == 0
+
+
+def test_cancel_take_profit_updates_stops_running_update(monkeypatch):
+    """停用/停止时取消正在执行的止盈更新，并等待其结束"""
+
+    async def scenario():
+        ops = _make_ops(monkeypatch, debounce=0)
+        started = asyncio.Event()
+        cancelled = []
+
+        async def update_now():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        ops._update_take_profit_order_now = update_now
+
+        await ops.update_take_profit_order_if_needed()
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        await asyncio.wait_for(ops.cancel_take_profit_updates(), timeout=1.0)
+        return ops, cancelled
+
+    ops, cancelled = asyncio.run(scenario())
+
+    assert cancelled == [True]
+    assert ops._tp_update_pending is None
+    assert not ops._tp_update_tasks
+
+
+def test_update_skipped_when_scalping_inactive(monkeypatch):
+    """剥头皮未激活时不调度更新任务"""
+
+    async def scenario():
+        ops = _make_ops(monkeypatch)
+        ops._scalping_active_event.clear()
+        result = await ops.update_take_profit_order_if_needed()
+        return ops, result
+
+    ops, result = asyncio.run(scenario())
+
+    assert result is False
+    assert not ops._tp_update_tasks